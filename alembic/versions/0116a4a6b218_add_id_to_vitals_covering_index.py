@@ -0,0 +1,57 @@
+"""add id to vitals covering index
+
+Revision ID: 0116a4a6b218
+Revises: 801d596c9ea1
+Create Date: 2026-10-17 02:36:29.865108
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0116a4a6b218"
+down_revision: str | Sequence[str] | None = "801d596c9ea1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Key the covering index on (..., recorded_at, id) so keyset pages are read index-only and in order."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vitals_patient_type_recorded_at_id",
+            "vitals",
+            ["patient_id", "vital_type", "recorded_at", "id"],
+            unique=False,
+            postgresql_include=["value"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_vitals_patient_type_recorded_at",
+            table_name="vitals",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the (patient_id, vital_type, recorded_at) covering index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vitals_patient_type_recorded_at",
+            "vitals",
+            ["patient_id", "vital_type", "recorded_at"],
+            unique=False,
+            postgresql_include=["value"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_vitals_patient_type_recorded_at_id",
+            table_name="vitals",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
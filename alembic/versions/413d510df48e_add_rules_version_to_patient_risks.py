@@ -0,0 +1,32 @@
+"""add rules_version to patient_risks
+
+Revision ID: 413d510df48e
+Revises: c3f9a8d2e514
+Create Date: 2026-10-17 14:05:12.318407
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "413d510df48e"
+down_revision: str | Sequence[str] | None = "c3f9a8d2e514"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record the rule set version each current risk was scored with; existing rows are rescored on next use."""
+    op.add_column(
+        "patient_risks",
+        sa.Column("rules_version", sa.String(length=100), server_default=sa.text("''"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop patient_risks.rules_version."""
+    op.drop_column("patient_risks", "rules_version")
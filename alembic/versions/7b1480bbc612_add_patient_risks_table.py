@@ -0,0 +1,52 @@
+"""add patient_risks table
+
+Revision ID: 7b1480bbc612
+Revises: 0116a4a6b218
+Create Date: 2026-10-17 02:45:23.838794
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1480bbc612"
+down_revision: str | Sequence[str] | None = "0116a4a6b218"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create patient_risks; rows are filled in lazily on the next vital write or risk read."""
+    op.create_table(
+        "patient_risks",
+        sa.Column("patient_id", sa.String(length=20), nullable=False),
+        sa.Column(
+            "latest_vitals",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+        sa.Column("risk_score", sa.Float(), nullable=False),
+        sa.Column("risk_level", sa.String(length=10), nullable=False),
+        sa.Column(
+            "checked_rules",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'"),
+            nullable=False,
+        ),
+        sa.Column("evaluated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["patient_id"], ["patients.patient_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("patient_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop patient_risks."""
+    op.drop_table("patient_risks")
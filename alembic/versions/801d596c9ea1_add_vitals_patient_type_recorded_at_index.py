@@ -0,0 +1,42 @@
+"""add vitals patient type recorded_at covering index
+
+Revision ID: 801d596c9ea1
+Revises: 640d2162a405
+Create Date: 2026-10-17 02:34:07.722216
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "801d596c9ea1"
+down_revision: str | Sequence[str] | None = "640d2162a405"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Covering index for time range queries, built without blocking vital writes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vitals_patient_type_recorded_at",
+            "vitals",
+            ["patient_id", "vital_type", "recorded_at"],
+            unique=False,
+            postgresql_include=["value"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the covering index without blocking vital writes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_vitals_patient_type_recorded_at",
+            table_name="vitals",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
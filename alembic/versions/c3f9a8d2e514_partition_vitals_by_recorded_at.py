@@ -0,0 +1,114 @@
+"""partition vitals by recorded_at
+
+Revision ID: c3f9a8d2e514
+Revises: 7b1480bbc612
+Create Date: 2026-10-17 09:12:41.503117
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f9a8d2e514"
+down_revision: str | Sequence[str] | None = "7b1480bbc612"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = "id, patient_id, recorded_at, vital_type, value, version, created_at, updated_at"
+
+
+def vitals_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("patient_id", sa.String(length=20), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("vital_type", sa.String(length=10), nullable=False),
+        sa.Column("value", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.CheckConstraint("vital_type IN ('HR', 'RR', 'SBP', 'DBP', 'SpO2', 'BT')", name="ck_vitals_vital_type"),
+    ]
+
+
+def create_vitals_indexes() -> None:
+    op.create_index("ix_vitals_patient_id", "vitals", ["patient_id"], unique=False)
+    op.create_index("ix_vitals_recorded_at", "vitals", ["recorded_at"], unique=False)
+    op.create_index(
+        "ix_vitals_patient_type_recorded_at_id",
+        "vitals",
+        ["patient_id", "vital_type", "recorded_at", "id"],
+        unique=False,
+        postgresql_include=["value"],
+    )
+
+
+def drop_vitals_indexes(table_name: str) -> None:
+    for name in ("ix_vitals_patient_id", "ix_vitals_recorded_at", "ix_vitals_patient_type_recorded_at_id"):
+        op.drop_index(name, table_name=table_name)
+
+
+def upgrade() -> None:
+    """Rebuild vitals as a table range-partitioned on recorded_at and copy the rows over.
+
+    The layout is fixed here: a default partition plus one monthly partition for every month that already
+    holds vitals. Partitions for the current and upcoming periods (in VITALS_PARTITION_INTERVAL) are left to
+    app.cli.maintain_partitions, which the container runs at startup. The copy rewrites the whole table
+    under an exclusive lock, so run it in a maintenance window.
+    """
+    op.rename_table("vitals", "vitals_unpartitioned")
+    op.execute("ALTER TABLE vitals_unpartitioned RENAME CONSTRAINT vitals_pkey TO vitals_unpartitioned_pkey")
+    drop_vitals_indexes("vitals_unpartitioned")
+
+    # The primary key of a partitioned table has to contain the partition key.
+    op.create_table(
+        "vitals",
+        *vitals_columns(),
+        sa.ForeignKeyConstraint(
+            ["patient_id"], ["patients.patient_id"], name="vitals_patient_id_fkey", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", "recorded_at", name="vitals_pkey"),
+        postgresql_partition_by="RANGE (recorded_at)",
+    )
+    op.execute("CREATE TABLE vitals_default PARTITION OF vitals DEFAULT")
+
+    months = op.get_bind().execute(
+        sa.text(
+            "SELECT DISTINCT date_trunc('month', recorded_at AT TIME ZONE 'UTC') FROM vitals_unpartitioned ORDER BY 1"
+        )
+    )
+    for (month,) in months.all():
+        start = month.replace(tzinfo=UTC)
+        end = datetime(start.year + start.month // 12, start.month % 12 + 1, 1, tzinfo=UTC)
+        op.execute(
+            f"CREATE TABLE vitals_p{start:%Y%m} PARTITION OF vitals "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    op.execute(f"INSERT INTO vitals ({COLUMNS}) SELECT {COLUMNS} FROM vitals_unpartitioned")
+    op.drop_table("vitals_unpartitioned")
+    # Built after the copy: one index build per partition is much cheaper than maintaining them row by row.
+    create_vitals_indexes()
+
+
+def downgrade() -> None:
+    """Copy the rows back into a single unpartitioned vitals table."""
+    op.create_table(
+        "vitals_unpartitioned",
+        *vitals_columns(),
+        sa.ForeignKeyConstraint(
+            ["patient_id"], ["patients.patient_id"], name="vitals_patient_id_fkey", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name="vitals_unpartitioned_pkey"),
+    )
+    op.execute(f"INSERT INTO vitals_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM vitals")
+    op.drop_table("vitals")  # Drops every partition with it
+
+    op.rename_table("vitals_unpartitioned", "vitals")
+    op.execute("ALTER TABLE vitals RENAME CONSTRAINT vitals_unpartitioned_pkey TO vitals_pkey")
+    create_vitals_indexes()
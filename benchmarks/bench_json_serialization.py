@@ -0,0 +1,97 @@
+"""Micro-benchmark: GET /api/v1/vitals/patient/{patient_id} body encoding, pydantic + FastAPI vs. plain rows + orjson.
+
+Rows are synthetic (no database), so only the work after the query is measured: building the response and
+encoding it to JSON bytes.
+
+Run with: PYTHONPATH=src uv run python benchmarks/bench_json_serialization.py
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import cast
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.vital_service import VitalService
+from app.infrastructure.repositories.vital_repository import ArchivedValue
+from app.main import app
+from app.presentation.responses import ORJSONResponse
+from app.presentation.schemas.vital_schema import VitalItem, VitalListResponse
+
+SIZES = [1_000, 100_000]
+START = datetime(2024, 1, 1, tzinfo=UTC)
+ROUTE = next(
+    route for route in app.routes if isinstance(route, APIRoute) and route.path == "/api/v1/vitals/patient/{patient_id}"
+)
+
+
+class StaticRows:
+    """Stands in for VitalRepository, returning fixed (recorded_at, value, id) rows."""
+
+    def __init__(self, rows: list[ArchivedValue]):
+        self.rows = rows
+
+    async def find_values_by_time_range(self, **_) -> list[ArchivedValue]:
+        return self.rows
+
+
+def rows(count: int) -> list[ArchivedValue]:
+    return [
+        ArchivedValue(START + timedelta(seconds=i), Decimal(f"{60 + i % 80}.{i % 100:02d}"), uuid4())
+        for i in range(count)
+    ]
+
+
+async def pydantic_path(service: VitalService, count: int) -> bytes:
+    """What the endpoint did before: a VitalItem per row, then FastAPI validates and encodes the response."""
+    fetched = await service.vital_repo.find_values_by_time_range()
+    response = VitalListResponse(
+        patient_id="P001",
+        vital_type=None,
+        items=[VitalItem(recorded_at=recorded_at, value=float(value)) for recorded_at, value, _ in fetched],
+        next_cursor=None,
+    )
+    content = await serialize_response(field=ROUTE.response_field, response_content=response)
+    return bytes(JSONResponse(content).body)
+
+
+async def orjson_path(service: VitalService, count: int) -> bytes:
+    payload = await service.get_vitals_payload("P001", START, START + timedelta(seconds=count), limit=count + 1)
+    return bytes(ORJSONResponse(payload).body)
+
+
+async def timed(func, *args, repeat: int) -> float:
+    """Best-of-repeat milliseconds per call."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3
+
+
+async def main() -> None:
+    # Never queries: the repository is replaced with the fixed rows.
+    service = VitalService(cast(AsyncSession, None))
+    for count in SIZES:
+        service.vital_repo = StaticRows(rows(count))  # ty: ignore[invalid-assignment]
+        before_body, after_body = await pydantic_path(service, count), await orjson_path(service, count)
+        # The stub ignores the page size, so next_cursor can differ; the encoded items must not.
+        assert before_body.split(b',"next_cursor"')[0] == after_body.split(b',"next_cursor"')[0]
+
+        repeat = 50 if count <= 1_000 else 5
+        before = await timed(pydantic_path, service, count, repeat=repeat)
+        after = await timed(orjson_path, service, count, repeat=repeat)
+        print(
+            f"{count:>7} rows   pydantic + FastAPI {before:9.2f} ms   rows + orjson {after:9.2f} ms   "
+            f"({before / after:.1f}x, {len(after_body) / 1024:.0f} KiB)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
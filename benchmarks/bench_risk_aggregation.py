@@ -0,0 +1,76 @@
+"""Micro-benchmark: streaming max aggregation with early exit vs. scoring every record.
+
+"never HIGH" is the worst case for the streaming path: nothing stops it early, so it pays for its extra batch calls.
+
+Run with: PYTHONPATH=src uv run python benchmarks/bench_risk_aggregation.py
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from app.application.inference_executor import InferenceExecutor
+from app.application.inference_service import InferenceService
+from app.domain.inference import AggregationPolicy, to_columns
+from app.presentation.schemas.inference_schema import InferenceRequest, InferenceResponse, VitalRecord
+
+RECORDS = 5_000
+REPEAT = 100
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def request(first_high: int, aggregation: AggregationPolicy = AggregationPolicy.MAX) -> InferenceRequest:
+    """RECORDS records, HIGH from index first_high onwards (first_high >= RECORDS: never HIGH)."""
+    normal = {"HR": 80.0, "SBP": 120.0, "SpO2": 98.0}
+    high = {"HR": 130.0, "SBP": 85.0, "SpO2": 85.0}
+    return InferenceRequest(
+        patient_id="P001",
+        records=[
+            VitalRecord(recorded_at=START + timedelta(minutes=i), vitals=high if i >= first_high else normal)
+            for i in range(RECORDS)
+        ],
+        aggregation=aggregation,
+    )
+
+
+async def full_scan(body: InferenceRequest) -> InferenceResponse:
+    """What evaluate did before: score every record, then take the max."""
+    records = [record.vitals for record in body.records]
+    batch = await InferenceExecutor.evaluate_batch("rule_based", to_columns(records), len(records))
+    max_result = batch.result(int(np.argmax(batch.risk_scores)))
+    return InferenceResponse(
+        patient_id=body.patient_id,
+        risk_score=max_result.risk_score,
+        risk_level=max_result.risk_level,
+        checked_rules=max_result.checked_rules,
+        evaluated_at=datetime.now(UTC),
+    )
+
+
+async def timed(func, *args) -> float:
+    """Best-of-REPEAT microseconds per call."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        await func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1e6
+
+
+async def main() -> None:
+    service = InferenceService()
+    print(f"{RECORDS} records per request")
+    for label, first_high in [("HIGH at record 3", 3), ("HIGH at record 1000", 1000), ("never HIGH", RECORDS)]:
+        body = request(first_high)
+        assert (await service.evaluate(body)).risk_score == (await full_scan(body)).risk_score
+        before = await timed(full_scan, body)
+        after = await timed(service.evaluate, body)
+        print(f"{label:<22} full scan {before:9.1f} us   streaming max {after:9.1f} us   ({before / after:.1f}x)")
+    latest = await timed(service.evaluate, request(3, AggregationPolicy.LATEST))
+    print(f"{'latest':<22} {latest:9.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
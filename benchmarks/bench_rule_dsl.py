@@ -0,0 +1,101 @@
+"""Micro-benchmark: a 51-rule set compiled from the JSON rule format vs. walking the rules one by one.
+
+The "hardcoded" baseline is how RuleBasedInference evaluated its RULES list before compilation:
+check every rule against the vitals dict, then index the score ladder by the match count.
+
+Run with: PYTHONPATH=src uv run python benchmarks/bench_rule_dsl.py
+"""
+
+import json
+import random
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.inference import InferenceResult, Rule, RuleBasedInference, load_rule_set, to_columns
+from app.domain.vital_type import VitalType
+
+# Threshold ladders per vital type, in the spirit of early-warning scores.
+LADDERS = {
+    VitalType.HR: ((">", range(100, 200, 10)), ("<", range(35, 60, 5))),
+    VitalType.RR: ((">", range(20, 40, 4)), ("<", range(6, 12, 2))),
+    VitalType.SBP: ((">", range(180, 230, 10)), ("<", range(70, 110, 5))),
+    VitalType.DBP: ((">", range(100, 130, 10)),),
+    VitalType.SPO2: (("<", range(85, 97, 2)),),
+    VitalType.BT: ((">", (38.0, 38.5, 39.0, 40.0)), ("<", (35.0, 36.0))),
+}
+LADDER_SIZE = 12
+NUMBER = 20_000
+
+
+def rule_file_data() -> dict:
+    rules = [
+        {"vital_type": vital_type.value, "op": op, "threshold": threshold}
+        for vital_type, groups in LADDERS.items()
+        for op, thresholds in groups
+        for threshold in thresholds
+    ]
+    ladder = [
+        {"score": round(0.1 + 0.08 * n, 2), "level": "LOW" if n < 3 else "MEDIUM" if n < 6 else "HIGH"}
+        for n in range(LADDER_SIZE)
+    ]
+    return {"version": "bench", "score_ladder": ladder, "rules": rules}
+
+
+def rule_walk(rules: list[Rule], scores: tuple, levels: tuple) -> Callable[[dict[str, float]], InferenceResult]:
+    def evaluate(vitals: dict[str, float]) -> InferenceResult:
+        matched = [name for name, key, compare, threshold in rules if key in vitals and compare(vitals[key], threshold)]
+        count = min(len(matched), len(scores) - 1)
+        return InferenceResult(scores[count], levels[count], matched)
+
+    return evaluate
+
+
+def random_vitals(rng: random.Random) -> dict[str, float]:
+    return {
+        VitalType.HR: rng.uniform(30, 210),
+        VitalType.RR: rng.uniform(4, 42),
+        VitalType.SBP: rng.uniform(60, 240),
+        VitalType.DBP: rng.uniform(40, 140),
+        VitalType.SPO2: rng.uniform(80, 100),
+        VitalType.BT: rng.uniform(34, 41),
+    }
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "rules.json"
+        path.write_text(json.dumps(rule_file_data()))
+        rule_set = load_rule_set(path)
+        compiled = RuleBasedInference(rules_path=path)
+        compiled.startup()
+
+        hardcoded = rule_walk(rule_set.rules, rule_set.scores, rule_set.levels)
+        rng = random.Random(0)
+        samples = [random_vitals(rng) for _ in range(100)]
+        for vitals in samples:
+            assert compiled.evaluate(vitals) == hardcoded(vitals), vitals
+
+        print(f"{len(rule_set.rules)} rules, {len(compiled.compiled.tables)} threshold tables")
+        results = []
+        for label, evaluate in [("hardcoded rule walk", hardcoded), ("compiled rule file", compiled.evaluate)]:
+            seconds = min(timeit.repeat(lambda e=evaluate: [e(v) for v in samples], number=NUMBER // 100, repeat=5))
+            results.append(seconds / NUMBER * 1e9)
+            print(f"{label:<40} {results[-1]:8.0f} ns/record  ({results[0] / results[-1]:.2f}x)")
+
+        columns = to_columns(samples * 100)
+        size = len(samples) * 100
+        seconds = min(timeit.repeat(lambda: compiled.evaluate_batch(columns, size), number=10, repeat=5))
+        nanoseconds = seconds / 10 / size * 1e9
+        label = "compiled rule file, evaluate_batch"
+        print(f"{label:<40} {nanoseconds:8.0f} ns/record  ({results[0] / nanoseconds:.2f}x)")
+
+        batch = compiled.evaluate_batch(to_columns(samples))
+        assert np.array_equal(batch.risk_scores, [compiled.evaluate(v).risk_score for v in samples])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""SQL statements and latency per request for the create endpoints, through the full ASGI app.
+
+Uses TEST_DATABASE_URL (tables are created if missing) and leaves the rows it writes behind.
+
+Run with: PYTHONPATH=src uv run python benchmarks/bench_statement_counts.py
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+os.environ.setdefault("BEARER_TOKEN", "bench-bearer-token")
+
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.database import get_db_session  # noqa: E402
+from app.infrastructure.models import Base  # noqa: E402
+from app.main import app  # noqa: E402
+
+REQUESTS = 200
+HEADERS = {"Authorization": f"Bearer {get_settings().BEARER_TOKEN}"}
+
+
+async def main() -> None:
+    engine = create_async_engine(get_settings().TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def session() -> AsyncGenerator[AsyncSession]:
+        async with session_factory() as db:
+            yield db
+            await db.commit()
+
+    app.dependency_overrides[get_db_session] = session
+    statements: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    run = uuid4().hex[:6]
+    patient_ids = [f"B{run}{i:05d}" for i in range(REQUESTS)]
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def measure(label: str, requests: list[tuple[str, dict]]) -> None:
+            statements.clear()
+            started = time.perf_counter()
+            for path, body in requests:
+                response = await client.post(path, headers=HEADERS, json=body)
+                assert response.status_code == 201, response.text
+            elapsed = time.perf_counter() - started
+            per_request = len(statements) / len(requests)
+            print(f"{label:<28} {per_request:5.1f} statements/request  {elapsed / len(requests) * 1e3:6.2f} ms/request")
+
+        def vital(patient_id: str, minute: int, vital_type: str = "HR") -> dict:
+            return {
+                "patient_id": patient_id,
+                "recorded_at": f"2024-01-01T00:{minute:02d}:00Z",
+                "vital_type": vital_type,
+                "value": 130,
+            }
+
+        await measure(
+            "POST /patients",
+            [
+                ("/api/v1/patients", {"patient_id": pid, "name": "Bench", "gender": "F", "birth_date": "1990-01-01"})
+                for pid in patient_ids
+            ],
+        )
+        await measure("POST /vitals (first)", [("/api/v1/vitals", vital(pid, 0)) for pid in patient_ids])
+        await measure("POST /vitals (steady)", [("/api/v1/vitals", vital(pid, 1)) for pid in patient_ids])
+        await measure(
+            "POST /vitals/bulk (3 items)",
+            [
+                ("/api/v1/vitals/bulk", {"items": [vital(pid, 2, vital_type) for vital_type in ("HR", "SBP", "SpO2")]})
+                for pid in patient_ids
+            ],
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,5 +6,8 @@ export PYTHONPATH="/app/src:$PYTHONPATH"
 echo "Running database migrations..."
 uv run alembic upgrade head
 
+echo "Creating upcoming vitals partitions..."
+uv run python -m app.cli.maintain_partitions
+
 echo "Starting application..."
 exec uv run uvicorn app.main:app --host 0.0.0.0 --port 8000
@@ -0,0 +1,180 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import numpy as np
+
+from app.domain.inference import (
+    BaseInference,
+    BatchInferenceResult,
+    ExecutionMode,
+    InferenceFactory,
+    InferenceResult,
+    VitalColumns,
+    to_columns,
+)
+
+# (risk_scores, distinct levels, level index per row, packed matched bits, rule names)
+PackedBatch = tuple[np.ndarray, list[Any], np.ndarray, np.ndarray, list[str]]
+
+
+class InferenceExecutor:
+    """Runs evaluations where each strategy's ExecutionMode says, without blocking the event loop.
+
+    Process workers are spawned with every process-mode strategy already constructed and
+    started, and batches cross the process boundary as numpy columns (see pack_batch).
+    """
+
+    thread_workers: int | None = None
+    process_workers: int | None = None
+    _thread_pool: ThreadPoolExecutor | None = None
+    _process_pool: ProcessPoolExecutor | None = None
+    _process_pool_generation = -1
+
+    @classmethod
+    def configure(cls, thread_workers: int | None = None, process_workers: int | None = None) -> None:
+        """Set pool sizes (None = executor defaults); pools are created on first use."""
+        cls.shutdown()
+        cls.thread_workers = thread_workers
+        cls.process_workers = process_workers
+
+    @classmethod
+    def start(cls) -> None:
+        """Spawn the process workers up front when any strategy runs in process mode."""
+        if any(InferenceFactory.execution_mode(name) is ExecutionMode.PROCESS for name in InferenceFactory.names()):
+            pool = cls._processes()
+            for _ in range(cls.process_workers or os.process_cpu_count() or 1):
+                pool.submit(os.getpid)
+
+    @classmethod
+    def max_score(cls, strategy_name: str) -> float | None:
+        """The strategy's max_score; unknown (None) for process-mode strategies, which only exist in the workers."""
+        if InferenceFactory.execution_mode(strategy_name) is ExecutionMode.PROCESS:
+            return None
+        return InferenceFactory.get(strategy_name).max_score
+
+    @classmethod
+    async def evaluate(cls, strategy_name: str, vitals: dict[str, float]) -> InferenceResult:
+        """Evaluate one record, answered from InferenceFactory.result_cache when it was seen before."""
+        mode = InferenceFactory.execution_mode(strategy_name)
+        inference = None if mode is ExecutionMode.PROCESS else InferenceFactory.get(strategy_name)
+        cache = InferenceFactory.result_cache
+        key = None
+        if cache.enabled and (
+            mode is not ExecutionMode.INLINE or InferenceFactory.registration(strategy_name)[0].CACHE_RESULTS
+        ):
+            # The quantized record is what gets evaluated, so the cached result holds for its whole key.
+            vitals = cache.quantize(vitals)
+            # Process-mode strategies only exist in the workers, so their version is not known here;
+            # their entries are dropped when the strategy is registered again and otherwise expire by TTL.
+            key = cache.key(strategy_name, "" if inference is None else inference.version, vitals)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        if inference is not None and mode is ExecutionMode.INLINE:
+            result = inference.evaluate(vitals)
+        else:
+            batch = await cls.evaluate_batch(strategy_name, to_columns([vitals]), 1)
+            result = batch.result(0)
+        if key is not None:
+            cache.put(key, result)
+        return result
+
+    @classmethod
+    async def evaluate_batch(cls, strategy_name: str, columns: VitalColumns, size: int) -> BatchInferenceResult:
+        mode = InferenceFactory.execution_mode(strategy_name)
+        if mode is ExecutionMode.INLINE:
+            return InferenceFactory.get(strategy_name).evaluate_batch(columns, size)
+
+        loop = asyncio.get_running_loop()
+        if mode is ExecutionMode.THREAD:
+            inference = InferenceFactory.get(strategy_name)
+            return await loop.run_in_executor(cls._threads(), inference.evaluate_batch, columns, size)
+
+        pool = cls._processes()
+        try:
+            packed = await loop.run_in_executor(pool, evaluate_in_worker, strategy_name, columns, size)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool for the next request.
+            cls._discard_process_pool(pool)
+            raise
+        return unpack_batch(packed)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._thread_pool is not None:
+            cls._thread_pool.shutdown(wait=False, cancel_futures=True)
+            cls._thread_pool = None
+        if cls._process_pool is not None:
+            cls._discard_process_pool(cls._process_pool)
+
+    @classmethod
+    def _threads(cls) -> Executor:
+        if cls._thread_pool is None:
+            cls._thread_pool = ThreadPoolExecutor(cls.thread_workers, thread_name_prefix="inference")
+        return cls._thread_pool
+
+    @classmethod
+    def _processes(cls) -> ProcessPoolExecutor:
+        if cls._process_pool is not None and cls._process_pool_generation != InferenceFactory.generation:
+            cls._discard_process_pool(cls._process_pool)  # Strategies were (re)registered since it started
+        if cls._process_pool is None:
+            registrations = [
+                (name, *InferenceFactory.registration(name))
+                for name in InferenceFactory.names()
+                if InferenceFactory.execution_mode(name) is ExecutionMode.PROCESS
+            ]
+            cls._process_pool = ProcessPoolExecutor(
+                cls.process_workers,
+                # spawn, not fork: forking a process that runs an event loop and threads is unsafe.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(registrations,),
+            )
+            cls._process_pool_generation = InferenceFactory.generation
+        return cls._process_pool
+
+    @classmethod
+    def _discard_process_pool(cls, pool: ProcessPoolExecutor) -> None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        if cls._process_pool is pool:
+            cls._process_pool = None
+
+
+def init_worker(registrations: list[tuple[str, type[BaseInference], dict[str, Any]]]) -> None:
+    """Process pool initializer: register and start the strategies once per worker."""
+    for name, strategy, options in registrations:
+        InferenceFactory.register(name, strategy, **options)
+        InferenceFactory.get(name)
+
+
+def evaluate_in_worker(strategy_name: str, columns: VitalColumns, size: int) -> PackedBatch:
+    return pack_batch(InferenceFactory.get(strategy_name).evaluate_batch(columns, size))
+
+
+def pack_batch(batch: BatchInferenceResult) -> PackedBatch:
+    """Columnar wire form: levels as indexes into their distinct values, matches as packed bits."""
+    levels, level_index = np.unique(batch.risk_levels, return_inverse=True)
+    return (
+        batch.risk_scores,
+        levels.tolist(),
+        level_index.astype(np.uint8 if len(levels) <= 256 else np.int64),
+        np.packbits(batch.matched, axis=1),
+        batch.rule_names,
+    )
+
+
+def unpack_batch(packed: PackedBatch) -> BatchInferenceResult:
+    risk_scores, levels, level_index, matched_bits, rule_names = packed
+    level_values = np.empty(len(levels), dtype=object)
+    level_values[:] = levels
+    return BatchInferenceResult(
+        risk_scores=risk_scores,
+        risk_levels=level_values[level_index],
+        rule_names=rule_names,
+        matched=np.unpackbits(matched_bits, axis=1, count=len(rule_names)).astype(bool),
+    )
@@ -1,21 +1,123 @@
 from datetime import UTC, datetime
 
-from app.domain.inference import InferenceFactory
-from app.presentation.schemas.inference_schema import InferenceRequest, InferenceResponse
+import numpy as np
+
+from app.application.inference_executor import InferenceExecutor
+from app.domain.inference import AGGREGATORS, AggregationPolicy, InferenceFactory, InferenceResult, to_columns
+from app.domain.inference.risk_aggregation import RiskAggregator
+from app.domain.risk_level import RiskLevel
+from app.presentation.schemas.inference_schema import (
+    InferenceCacheStatsResponse,
+    InferenceRequest,
+    InferenceResponse,
+)
 
 
 class InferenceService:
-    def __init__(self, strategy_name: str = "rule_based"):
-        self.inference = InferenceFactory.get(strategy_name)
+    # Records are scored in growing chunks, so max aggregation can stop soon after the first maximal
+    # record without giving up vectorized evaluation of long record lists.
+    FIRST_CHUNK = 16
+    CHUNK_GROWTH = 4
+    MAX_CHUNK = 4096
 
-    def evaluate(self, request: InferenceRequest) -> InferenceResponse:
-        results = [self.inference.evaluate(record.vitals) for record in request.records]
-        max_result = max(results, key=lambda r: r.risk_score)
+    def __init__(self, strategy_name: str = "rule_based"):
+        InferenceFactory.execution_mode(strategy_name)  # Fail fast on unknown names
+        # Strategies are not instantiated here: process-mode ones only live in the worker processes.
+        self.strategy_name = strategy_name
 
+    async def evaluate(self, request: InferenceRequest) -> InferenceResponse:
+        result = await self._aggregate(
+            [record.vitals for record in request.records],
+            [record.recorded_at for record in request.records],
+            request.aggregation,
+        )
         return InferenceResponse(
             patient_id=request.patient_id,
-            risk_score=max_result.risk_score,
-            risk_level=max_result.risk_level,
-            checked_rules=max_result.checked_rules,
+            risk_score=result.risk_score,
+            risk_level=result.risk_level,
+            checked_rules=result.checked_rules,
             evaluated_at=datetime.now(UTC),
         )
+
+    async def evaluate_many(self, requests: list[InferenceRequest]) -> list[InferenceResponse]:
+        """Evaluate several patients with one evaluate_batch call over all of their records."""
+        records = [record.vitals for request in requests for record in request.records]
+        batch = await InferenceExecutor.evaluate_batch(self.strategy_name, to_columns(records), len(records))
+        evaluated_at = datetime.now(UTC)
+
+        responses = []
+        start = 0
+        for request in requests:
+            end = start + len(request.records)
+            aggregator = AGGREGATORS[request.aggregation]([record.recorded_at for record in request.records])
+            aggregator.feed(np.arange(end - start), batch.risk_scores[start:end])
+            result = self._finish(aggregator, batch.result(start + aggregator.winner))
+            responses.append(
+                InferenceResponse(
+                    patient_id=request.patient_id,
+                    risk_score=result.risk_score,
+                    risk_level=result.risk_level,
+                    checked_rules=result.checked_rules,
+                    evaluated_at=evaluated_at,
+                )
+            )
+            start = end
+        return responses
+
+    @staticmethod
+    def cache_stats() -> InferenceCacheStatsResponse:
+        stats = InferenceFactory.result_cache.stats()
+        return InferenceCacheStatsResponse(
+            size=stats.size,
+            max_size=stats.max_size,
+            ttl_seconds=stats.ttl_seconds,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            hit_ratio=round(stats.hit_ratio, 4),
+        )
+
+    async def _aggregate(
+        self,
+        records: list[dict[str, float]],
+        recorded_at: list[datetime],
+        policy: AggregationPolicy,
+    ) -> InferenceResult:
+        """Evaluate records in the aggregator's order until it has its answer."""
+        aggregator = AGGREGATORS[policy](recorded_at, InferenceExecutor.max_score(self.strategy_name))
+        order = aggregator.order()  # None: as listed
+        total = len(records) if order is None else len(order)
+        if total == 1:
+            index = 0 if order is None else int(order[0])
+            result = await InferenceExecutor.evaluate(self.strategy_name, records[index])
+            aggregator.feed(np.array([index]), np.array([result.risk_score]))
+            return self._finish(aggregator, result)
+
+        winners: dict[int, InferenceResult] = {}  # At most one per chunk
+        start, size = 0, self.FIRST_CHUNK
+        while start < total:
+            if order is None:
+                chunk = records[start : start + size]
+                indexes = np.arange(start, start + len(chunk))
+            else:
+                indexes = order[start : start + size]
+                chunk = [records[index] for index in indexes.tolist()]
+            batch = await InferenceExecutor.evaluate_batch(self.strategy_name, to_columns(chunk), len(chunk))
+            done = aggregator.feed(indexes, batch.risk_scores)
+            hits = np.flatnonzero(indexes == aggregator.winner)
+            if hits.size:
+                # Rule names are only built for the record currently winning.
+                winners[aggregator.winner] = batch.result(int(hits[0]))
+            if done:
+                break
+            start += size
+            size = min(size * self.CHUNK_GROWTH, self.MAX_CHUNK)
+        return self._finish(aggregator, winners[aggregator.winner])
+
+    @staticmethod
+    def _finish(aggregator: RiskAggregator, winner: InferenceResult) -> InferenceResult:
+        score = aggregator.score()
+        if score is None:
+            return winner
+        return InferenceResult(score, RiskLevel.from_score(score), winner.checked_rules)
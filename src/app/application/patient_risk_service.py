@@ -0,0 +1,180 @@
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.exceptions import PatientNotFoundError
+from app.domain.inference import InferenceFactory, InferenceResult, RuleBasedInference
+from app.domain.risk_level import RiskLevel
+from app.infrastructure.models.patient_risk_model import PatientRiskModel
+from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.infrastructure.repositories.patient_risk_repository import PatientRiskRepository
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.presentation.schemas.inference_schema import PatientRiskResponse
+from app.presentation.schemas.vital_schema import LatestVital, LatestVitalsResponse, PatientLatestVitals
+
+
+class PatientRiskService:
+    """Keeps patient_risks in step with vital writes.
+
+    Each row holds the latest vital of every type; a write re-runs only the rules on the
+    vital types it changed, so reading the current risk is a primary-key lookup. Rows scored
+    with an older rule set (before a hot reload) are rebuilt in full on their next read or write.
+    """
+
+    MAX_LATEST_PATIENTS = 200
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        # Incremental rescoring is rule-level, so it is tied to the rule-based strategy.
+        self.inference = cast(RuleBasedInference, InferenceFactory.get("rule_based"))
+        self.risk_repo = PatientRiskRepository(session)
+        self.vital_repo = VitalRepository(session)
+        self.patient_repo = PatientRepository(session)
+
+    async def get_current_risk(self, patient_id: str) -> PatientRiskResponse:
+        risk = await self.risk_repo.find_by_patient_id(patient_id)
+        if risk is None:
+            if not await self.patient_repo.exists(patient_id):
+                raise PatientNotFoundError(f"Patient {patient_id} not found")
+            # Patients with no writes since patient_risks was introduced are scored once here.
+            risk = await self._rebuild(patient_id)
+        elif risk.rules_version != self.inference.version:
+            # Scored with rules that have since been reloaded
+            risk = await self._rebuild(patient_id)
+        return PatientRiskResponse(
+            patient_id=risk.patient_id,
+            risk_score=risk.risk_score,
+            risk_level=RiskLevel(risk.risk_level),
+            checked_rules=risk.checked_rules,
+            evaluated_at=risk.evaluated_at,
+            vitals={vital_type: entry["value"] for vital_type, entry in risk.latest_vitals.items()},
+        )
+
+    async def get_latest_vitals(self, patient_ids: list[str]) -> LatestVitalsResponse:
+        """Latest vital of each type for many patients, read from patient_risks in one lookup.
+
+        Read-only, so it can run on a replica: patients without a row yet are answered from the vitals
+        index, all in one DISTINCT ON query, instead of being rebuilt here.
+        """
+        requested = list(dict.fromkeys(patient_ids))
+        latest = {
+            patient_id: {
+                vital_type: LatestVital(
+                    vital_id=entry["vital_id"],
+                    recorded_at=entry["recorded_at"],
+                    value=entry["value"],
+                )
+                for vital_type, entry in vitals.items()
+            }
+            for patient_id, vitals in (await self.risk_repo.find_latest_vitals(requested)).items()
+        }
+        missing = [patient_id for patient_id in requested if patient_id not in latest]
+        existing = await self.patient_repo.find_existing_patient_ids(missing)
+        latest.update({patient_id: {} for patient_id in existing})
+        rows = await self.vital_repo.find_latest_per_type_for_patients(existing)
+        for patient_id, vital_type, recorded_at, value, id in rows:
+            latest[patient_id][vital_type] = LatestVital(vital_id=id, recorded_at=recorded_at, value=float(value))
+        return LatestVitalsResponse(
+            items=[
+                PatientLatestVitals(patient_id=patient_id, vitals=latest[patient_id])
+                for patient_id in requested
+                if patient_id in latest
+            ],
+            not_found=[patient_id for patient_id in requested if patient_id not in latest],
+        )
+
+    async def on_vitals_written(self, vitals: Iterable[VitalModel]) -> None:
+        """Fold newly created or updated vitals (already flushed) into their patients' current risk."""
+        by_patient: dict[str, list[VitalModel]] = defaultdict(list)
+        for vital in vitals:
+            by_patient[vital.patient_id].append(vital)
+        locked = await self._lock(by_patient)
+        for patient_id in sorted(by_patient):
+            risk, created = locked[patient_id]
+            if created or risk.rules_version != self.inference.version:
+                await self._rebuild(patient_id, risk)
+            else:
+                await self._apply(risk, by_patient[patient_id])
+
+    async def refresh(self, patient_ids: Iterable[str]) -> None:
+        """Recompute the current risk from the vitals table, e.g. after a COPY import."""
+        for patient_id, (risk, _) in sorted((await self._lock(set(patient_ids))).items()):
+            await self._rebuild(patient_id, risk)
+
+    async def _lock(self, patient_ids: Collection[str]) -> dict[str, tuple[PatientRiskModel, bool]]:
+        empty = self.inference.evaluate({})
+        return await self.risk_repo.lock(patient_ids, empty.risk_score, empty.risk_level.value, datetime.now(UTC))
+
+    async def _rebuild(self, patient_id: str, risk: PatientRiskModel | None = None) -> PatientRiskModel:
+        if risk is None:
+            risk, _ = (await self._lock([patient_id]))[patient_id]
+        rows = await self.vital_repo.find_latest_per_type(patient_id)
+        latest = {vital_type: self._entry(recorded_at, value, id) for vital_type, recorded_at, value, id in rows}
+        result = self.inference.evaluate({vital_type: entry["value"] for vital_type, entry in latest.items()})
+        # Read right after evaluate (no await in between), so it is the version the result came from.
+        return await self._store(risk, latest, result, self.inference.compiled.version)
+
+    async def _apply(self, risk: PatientRiskModel, vitals: list[VitalModel]) -> None:
+        latest = dict(risk.latest_vitals)
+        changed: set[str] = set()
+        stale: set[str] = set()
+        for vital in vitals:
+            vital_id = str(vital.id)
+            # An update can move the latest vital of a type to another type; that type is re-read below.
+            stale |= {t for t, entry in latest.items() if entry["vital_id"] == vital_id and t != vital.vital_type}
+            current = latest.get(vital.vital_type)
+            if (
+                current is None
+                or current["vital_id"] == vital_id
+                or (vital.recorded_at, vital_id) > (datetime.fromisoformat(current["recorded_at"]), current["vital_id"])
+            ):
+                latest[vital.vital_type] = self._entry(vital.recorded_at, vital.value, vital.id)
+                changed.add(vital.vital_type)
+
+        if stale:
+            for vital_type in stale:
+                latest.pop(vital_type)
+            for vital_type, recorded_at, value, id in await self.vital_repo.find_latest_per_type(
+                risk.patient_id, stale
+            ):
+                latest[vital_type] = self._entry(recorded_at, value, id)
+            changed |= stale
+        if not changed:
+            return  # Only backfilled vitals older than the latest of their type
+        if risk.rules_version != self.inference.version:
+            # The rules were reloaded while the stale types were re-read; checked_rules no longer applies.
+            await self._rebuild(risk.patient_id, risk)
+            return
+
+        result = InferenceResult(risk.risk_score, RiskLevel(risk.risk_level), risk.checked_rules)
+        for vital_type in sorted(changed):
+            entry = latest.get(vital_type)
+            result = self.inference.rescore(result.checked_rules, vital_type, entry["value"] if entry else None)
+        await self._store(risk, latest, result, risk.rules_version)
+
+    async def _store(
+        self,
+        risk: PatientRiskModel,
+        latest: dict[str, Any],
+        result: InferenceResult,
+        rules_version: str,
+    ) -> PatientRiskModel:
+        return await self.risk_repo.save(
+            risk,
+            latest_vitals=latest,
+            risk_score=result.risk_score,
+            risk_level=result.risk_level.value,
+            checked_rules=result.checked_rules,
+            evaluated_at=datetime.now(UTC),
+            rules_version=rules_version,
+        )
+
+    @staticmethod
+    def _entry(recorded_at: datetime, value: Decimal, id: UUID) -> dict[str, Any]:
+        return {"vital_id": str(id), "recorded_at": recorded_at.isoformat(), "value": float(value)}
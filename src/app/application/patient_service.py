@@ -1,11 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.exceptions import (
-    DuplicatePatientIdError,
-    OptimisticLockError,
-    PatientNotFoundError,
-)
+from app.domain.exceptions import DuplicatePatientIdError
 from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.patient_cache import patient_existence_cache
 from app.infrastructure.repositories.patient_repository import PatientRepository
 from app.presentation.schemas.patient_schema import (
     PatientCreateRequest,
@@ -19,29 +16,23 @@ class PatientService:
         self.repository = PatientRepository(session)
 
     async def create_patient(self, dto: PatientCreateRequest) -> PatientModel:
-        if await self.repository.exists(dto.patient_id):
-            raise DuplicatePatientIdError(f"Patient {dto.patient_id} already exists")
-
-        patient = PatientModel(
+        patient = await self.repository.insert_if_absent(
             patient_id=dto.patient_id,
             name=dto.name,
             gender=dto.gender,
             birth_date=dto.birth_date,
         )
-        return await self.repository.save(patient)
+        if patient is None:
+            raise DuplicatePatientIdError(f"Patient {dto.patient_id} already exists")
+        patient_existence_cache.add(patient.patient_id)
+        return patient
 
     async def update_patient(self, patient_id: str, dto: PatientUpdateRequest) -> PatientModel:
-        existing = await self.repository.find_by_patient_id(patient_id)
-        if existing is None:
-            raise PatientNotFoundError(f"Patient {patient_id} not found")
-
-        try:
-            return await self.repository.update_with_version(
-                patient_id=patient_id,
-                expected_version=dto.version,
-                name=dto.name,
-                gender=dto.gender,
-                birth_date=dto.birth_date,
-            )
-        except OptimisticLockError:
-            raise OptimisticLockError(f"Version mismatch: expected {dto.version}, current {existing.version}") from None
+        # Raises PatientNotFoundError or OptimisticLockError (with the current version) from the same statement.
+        return await self.repository.update_with_version(
+            patient_id=patient_id,
+            expected_version=dto.version,
+            name=dto.name,
+            gender=dto.gender,
+            birth_date=dto.birth_date,
+        )
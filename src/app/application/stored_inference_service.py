@@ -0,0 +1,55 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.inference_service import InferenceService
+from app.domain.exceptions import PatientNotFoundError, VitalNotFoundError, VitalWindowTooLargeError
+from app.domain.inference import AggregationPolicy
+from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.presentation.schemas.inference_schema import InferenceResponse
+
+
+class StoredInferenceService(InferenceService):
+    """Scores the vitals already stored for a patient instead of client-supplied records."""
+
+    # Rows (one per vital) loaded for one evaluation; about six days of per-minute readings of every type.
+    MAX_READINGS = 50_000
+
+    def __init__(self, session: AsyncSession, strategy_name: str = "rule_based"):
+        super().__init__(strategy_name)
+        self.vital_repo = VitalRepository(session)
+        self.patient_repo = PatientRepository(session)
+
+    async def evaluate_stored(
+        self,
+        patient_id: str,
+        from_: datetime,
+        to: datetime,
+        aggregation: AggregationPolicy = AggregationPolicy.MAX,
+    ) -> InferenceResponse:
+        """Score the stored vitals, one record per recorded_at in the window (hot table only)."""
+        self.vital_repo.require_hot(from_)
+        rows = await self.vital_repo.find_readings_by_time_range(patient_id, from_, to, limit=self.MAX_READINGS + 1)
+        if not rows:
+            if not await self.patient_repo.exists(patient_id):
+                raise PatientNotFoundError(f"Patient {patient_id} not found")
+            raise VitalNotFoundError(f"No vitals for patient {patient_id} in the given time range")
+        if len(rows) > self.MAX_READINGS:
+            raise VitalWindowTooLargeError(
+                f"More than {self.MAX_READINGS} vitals in the given time range; evaluate a shorter window"
+            )
+
+        # Rows are ordered by recorded_at, so measurements taken at the same instant are adjacent.
+        records: dict[datetime, dict[str, float]] = {}
+        for recorded_at, vital_type, value in rows:
+            records.setdefault(recorded_at, {})[vital_type] = value
+
+        result = await self._aggregate(list(records.values()), list(records), aggregation)
+        return InferenceResponse(
+            patient_id=patient_id,
+            risk_score=result.risk_score,
+            risk_level=result.risk_level,
+            checked_rules=result.checked_rules,
+            evaluated_at=datetime.now(UTC),
+        )
@@ -0,0 +1,59 @@
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.vital_partition import PartitionInterval
+from app.infrastructure.repositories.vital_partition_repository import VitalPartitionRepository
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.infrastructure.vital_archive import VitalArchive, vital_archive
+
+
+@dataclass
+class VitalArchiveResult:
+    archived: int = 0
+    segments: int = 0
+    dropped_partitions: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+class VitalArchiveService:
+    """Moves vitals past the archive cutoff from the vitals table into the Parquet cold tier.
+
+    Works one UTC day and PATIENT_BATCH_SIZE patients at a time: the rows are deleted with RETURNING,
+    written to their segments and committed, so each patient/day segment is written once per run and a
+    failed write rolls the delete back. Partitions left empty are dropped, returning their space at once.
+    """
+
+    PATIENT_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession, archive: VitalArchive = vital_archive):
+        self.session = session
+        self.archive = archive
+        self.vital_repo = VitalRepository(session, archive)
+        self.partition_repo = VitalPartitionRepository(session)
+
+    async def archive_before_cutoff(self, now: datetime) -> VitalArchiveResult:
+        result = VitalArchiveResult()
+        started = time.perf_counter()
+        cutoff = self.archive.cutoff(now)
+
+        while (earliest := await self.vital_repo.find_earliest_recorded_at()) is not None and earliest < cutoff:
+            day = PartitionInterval.DAY.floor(earliest)
+            day_end = min(day + timedelta(days=1), cutoff)
+            patient_ids = await self.vital_repo.find_patient_ids_recorded_between(day, day_end)
+            for index in range(0, len(patient_ids), self.PATIENT_BATCH_SIZE):
+                batch = patient_ids[index : index + self.PATIENT_BATCH_SIZE]
+                vitals = await self.vital_repo.delete_recorded_between(day, day_end, batch)
+                result.segments += self.archive.write(vitals)
+                result.archived += len(vitals)
+                await self.session.commit()
+
+        for partition in await self.partition_repo.find_all():
+            if partition.end <= cutoff and await self.partition_repo.drop_if_empty(partition):
+                result.dropped_partitions.append(partition.name)
+            await self.session.commit()
+
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
@@ -0,0 +1,171 @@
+import codecs
+import csv
+import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.patient_risk_service import PatientRiskService
+from app.domain.vital_type import VitalType
+from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.presentation.schemas.vital_schema import VitalImportResponse, VitalImportRowError, check_vital_value
+
+VitalRecordTuple = tuple[str, datetime, str, Decimal]
+
+
+class VitalImportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+@dataclass
+class _ImportProgress:
+    imported: int = 0
+    rejected: int = 0
+    errors: list[VitalImportRowError] = field(default_factory=list)
+
+    def reject(self, line: int, detail: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < VitalImportService.MAX_REPORTED_ERRORS:
+            self.errors.append(VitalImportRowError(line=line, detail=detail))
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 byte chunks into lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+class VitalImportService:
+    """Backfill vitals through PostgreSQL COPY in bounded-memory chunks.
+
+    Each chunk is validated, checked for unknown patients and committed on its own,
+    so a long import keeps its progress and never holds more than chunk_size rows.
+    Current risks of the imported patients are rebuilt once, after the last chunk.
+    """
+
+    DEFAULT_CHUNK_SIZE = 5000
+    MAX_REPORTED_ERRORS = 100
+    VITAL_TYPES = frozenset(vital_type.value for vital_type in VitalType)  # mirrors ck_vitals_vital_type
+
+    def __init__(self, session: AsyncSession, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.session = session
+        self.chunk_size = chunk_size
+        self.vital_repo = VitalRepository(session)
+        self.patient_repo = PatientRepository(session)
+        self.risk_service = PatientRiskService(session)
+        self._known_patient_ids: set[str] = set()
+        self._missing_patient_ids: set[str] = set()
+        # Current risks are rebuilt once at the end, not per chunk: a rebuild reads the patient's whole history.
+        self._imported_patient_ids: set[str] = set()
+
+    async def import_lines(self, lines: AsyncIterable[str], fmt: VitalImportFormat) -> VitalImportResponse:
+        started = time.perf_counter()
+        progress = _ImportProgress()
+        chunk: list[tuple[int, VitalRecordTuple]] = []
+        header: list[str] | None = None
+
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            if fmt == VitalImportFormat.CSV and header is None:
+                header = [name.strip() for name in next(csv.reader([line]))]
+                continue
+            try:
+                chunk.append((line_no, self._to_record(self._parse_row(line, header))))
+            except ValueError as exc:
+                progress.reject(line_no, str(exc))
+                continue
+            if len(chunk) >= self.chunk_size:
+                await self._flush(chunk, progress)
+                chunk = []
+        await self._flush(chunk, progress)
+        if self._imported_patient_ids:
+            await self.risk_service.refresh(self._imported_patient_ids)
+            await self.session.commit()
+
+        elapsed = time.perf_counter() - started
+        return VitalImportResponse(
+            imported=progress.imported,
+            rejected=progress.rejected,
+            errors=progress.errors,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(progress.imported / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+    async def _flush(self, chunk: list[tuple[int, VitalRecordTuple]], progress: _ImportProgress) -> None:
+        if not chunk:
+            return
+        unchecked = {record[0] for _, record in chunk} - self._known_patient_ids - self._missing_patient_ids
+        if unchecked:
+            existing = await self.patient_repo.find_existing_patient_ids(unchecked)
+            self._known_patient_ids |= existing
+            self._missing_patient_ids |= unchecked - existing
+
+        records = []
+        for line_no, record in chunk:
+            if record[0] in self._known_patient_ids:
+                records.append(record)
+            else:
+                progress.reject(line_no, f"Patient {record[0]} not found")
+
+        progress.imported += await self.vital_repo.copy_records(records)
+        self._imported_patient_ids.update(record[0] for record in records)
+        await self.session.commit()
+
+    @staticmethod
+    def _parse_row(line: str, header: list[str] | None) -> dict[str, Any]:
+        if header is None:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON: {exc.msg}") from None
+            if not isinstance(row, dict):
+                raise ValueError("Row must be a JSON object")
+            return row
+        values = next(csv.reader([line]))
+        if len(values) != len(header):
+            raise ValueError(f"Expected {len(header)} columns, got {len(values)}")
+        return dict(zip(header, values, strict=True))
+
+    @classmethod
+    def _to_record(cls, row: dict[str, Any]) -> VitalRecordTuple:
+        patient_id = row.get("patient_id")
+        if not isinstance(patient_id, str) or not 0 < len(patient_id) <= 20:
+            raise ValueError("patient_id must be a non-empty string of at most 20 characters")
+
+        try:
+            recorded_at = datetime.fromisoformat(str(row.get("recorded_at")))
+        except ValueError:
+            raise ValueError("recorded_at must be an ISO 8601 datetime") from None
+        if recorded_at.tzinfo is None:
+            raise ValueError("recorded_at must include a timezone")
+
+        vital_type = row.get("vital_type")
+        if vital_type not in cls.VITAL_TYPES:
+            raise ValueError(f"vital_type must be one of {', '.join(VitalType)}")
+
+        try:
+            value = Decimal(str(row.get("value")))
+        except InvalidOperation:
+            raise ValueError("value must be a number") from None
+        check_vital_value(value)  # Rounded to Numeric(10, 2) first, as COPY would
+
+        return patient_id, recorded_at, vital_type, value
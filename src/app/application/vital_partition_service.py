@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.vital_partition import PartitionInterval, VitalPartition
+from app.infrastructure.repositories.vital_partition_repository import VitalPartitionRepository
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    moved_rows: int = 0  # Rows moved from the default partition into new partitions
+    deleted_rows: int = 0  # Rows past retention deleted from the default partition
+
+
+class VitalPartitionService:
+    """Keeps range partitions of vitals ahead of the clock and drops the ones past retention.
+
+    Run it periodically (e.g. daily). Rows without a matching partition land in the default partition,
+    so a missed run never fails inserts; the next run creates the partition and moves them out.
+    """
+
+    def __init__(self, session: AsyncSession, interval: PartitionInterval):
+        self.session = session
+        self.interval = interval
+        self.repo = VitalPartitionRepository(session)
+
+    def partition_name(self, start: datetime) -> str:
+        return f"{self.repo.TABLE}_p{self.interval.suffix(start)}"
+
+    async def maintain(
+        self,
+        now: datetime,
+        ahead: int,
+        retain_from: datetime | None = None,
+    ) -> PartitionMaintenanceResult:
+        """Create partitions up to `ahead` periods after now's, plus any needed for rows in the default partition.
+
+        With retain_from, partitions that end at or before it are dropped, older default rows are deleted
+        and no partitions are created before it.
+        """
+        result = PartitionMaintenanceResult()
+        await self.repo.lock()
+        existing = await self.repo.find_all()
+
+        if retain_from is not None:
+            for partition in existing:
+                if partition.end <= retain_from:
+                    await self.repo.drop(partition)
+                    result.dropped.append(partition.name)
+            existing = [partition for partition in existing if partition.name not in result.dropped]
+            result.deleted_rows = await self.repo.delete_default_before(retain_from)
+
+        horizon = self.interval.floor(now)
+        for _ in range(ahead + 1):
+            horizon = self.interval.next(horizon)
+        start = self.interval.floor(now)
+        default_range = await self.repo.default_range()
+        if default_range is not None:
+            start = min(start, default_range[0])
+        if retain_from is not None:
+            start = max(start, retain_from)
+
+        for period_start, period_end in self.interval.periods(start, horizon):
+            # Skip ranges already covered, also by partitions created with a different interval.
+            if any(partition.overlaps(period_start, period_end) for partition in existing):
+                continue
+            partition = VitalPartition(self.partition_name(period_start), period_start, period_end)
+            result.moved_rows += await self.repo.create(partition)
+            existing.append(partition)
+            result.created.append(partition.name)
+        return result
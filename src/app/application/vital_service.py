@@ -1,32 +1,54 @@
-from datetime import datetime
+import json
+import math
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.patient_risk_service import PatientRiskService
+from app.domain.downsampling import lttb
 from app.domain.exceptions import OptimisticLockError, PatientNotFoundError, VitalNotFoundError
+from app.domain.vital_aggregation import AggregationBucket, AggregationFunction
+from app.domain.vital_cursor import PatientVitalCursor, VitalCursor
 from app.domain.vital_type import VitalType
 from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.patient_cache import patient_existence_cache
 from app.infrastructure.repositories.patient_repository import PatientRepository
 from app.infrastructure.repositories.vital_repository import VitalRepository
 from app.presentation.schemas.vital_schema import (
+    VitalAggregateResponse,
+    VitalBulkCreateRequest,
+    VitalBulkCreateResponse,
+    VitalBulkItemError,
     VitalCreateRequest,
     VitalItem,
-    VitalListResponse,
     VitalResponse,
     VitalUpdateRequest,
+    check_vital_value,
 )
 
 
 class VitalService:
+    MAX_PATIENTS_PER_QUERY = 100
+    # Raw series longer than this many times max_points are averaged into as many date_bin buckets in SQL
+    # before LTTB, so memory use does not grow with the window.
+    LTTB_PREBUCKET_FACTOR = 4
+
     def __init__(self, session: AsyncSession):
         self.session = session
         self.vital_repo = VitalRepository(session)
         self.patient_repo = PatientRepository(session)
+        self.risk_service = PatientRiskService(session)
 
     async def create_vital(self, request: VitalCreateRequest) -> VitalResponse:
-        if not await self.patient_repo.exists(request.patient_id):
-            raise PatientNotFoundError(f"Patient {request.patient_id} not found")
+        # Known patients skip the existence query; the vitals foreign key still guards the insert.
+        if request.patient_id not in patient_existence_cache:
+            if not await self.patient_repo.exists(request.patient_id):
+                raise PatientNotFoundError(f"Patient {request.patient_id} not found")
+            patient_existence_cache.add(request.patient_id)
 
         vital = VitalModel(
             patient_id=request.patient_id,
@@ -34,27 +56,185 @@ class VitalService:
             vital_type=request.vital_type.value,
             value=Decimal(str(request.value)),
         )
-        saved = await self.vital_repo.save(vital)
+        try:
+            saved = await self.vital_repo.save(vital)
+        except PatientNotFoundError:
+            patient_existence_cache.discard(request.patient_id)
+            raise
+        await self.risk_service.on_vitals_written([saved])
         return VitalResponse.model_validate(saved)
 
-    async def get_vitals(
+    async def create_vitals_bulk(self, request: VitalBulkCreateRequest) -> VitalBulkCreateResponse:
+        existing = await self.patient_repo.find_existing_patient_ids({item.patient_id for item in request.items})
+
+        values = []
+        errors = []
+        for index, item in enumerate(request.items):
+            try:
+                check_vital_value(item.value)
+            except ValueError as exc:
+                errors.append(VitalBulkItemError(index=index, patient_id=item.patient_id, detail=str(exc)))
+                continue
+            if item.patient_id not in existing:
+                errors.append(
+                    VitalBulkItemError(
+                        index=index,
+                        patient_id=item.patient_id,
+                        detail=f"Patient {item.patient_id} not found",
+                    )
+                )
+                continue
+            values.append(
+                {
+                    "patient_id": item.patient_id,
+                    "recorded_at": item.recorded_at,
+                    "vital_type": item.vital_type.value,
+                    "value": Decimal(str(item.value)),
+                }
+            )
+
+        saved = await self.vital_repo.save_many(values)
+        await self.risk_service.on_vitals_written(saved)
+        return VitalBulkCreateResponse(
+            created=[VitalResponse.model_validate(vital) for vital in saved],
+            errors=errors,
+        )
+
+    async def get_vitals_payload(
         self,
         patient_id: str,
         from_: datetime,
         to: datetime,
         vital_type: VitalType | None = None,
-    ) -> VitalListResponse:
-        vitals = await self.vital_repo.find_by_time_range(
+        limit: int = VitalRepository.MAX_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """Vitals of one patient as plain dicts shaped like VitalListResponse, to be encoded straight to JSON."""
+        page_size = min(limit, VitalRepository.MAX_PAGE_SIZE)
+        rows = await self.vital_repo.find_values_by_time_range(
             patient_id=patient_id,
             start_time=from_,
             end_time=to,
             vital_type=vital_type,
+            limit=page_size,
+            after=VitalCursor.decode(cursor) if cursor else None,
         )
-        items = [VitalItem(recorded_at=v.recorded_at, value=float(v.value)) for v in vitals]
-        return VitalListResponse(
+        # A full page means there may be more rows; the cursor points past its last row.
+        next_cursor = VitalCursor(rows[-1].recorded_at, rows[-1].id).encode() if len(rows) == page_size else None
+        return {
+            "patient_id": patient_id,
+            "vital_type": vital_type.value if vital_type else None,
+            "items": [{"recorded_at": recorded_at, "value": float(value)} for recorded_at, value, _ in rows],
+            "next_cursor": next_cursor,
+        }
+
+    async def get_vitals_for_patients_payload(
+        self,
+        patient_ids: list[str],
+        from_: datetime,
+        to: datetime,
+        vital_types: list[VitalType] | None = None,
+        limit: int = VitalRepository.MAX_MULTI_PATIENT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """Vitals of several patients in one query, grouped per patient in request order.
+
+        Plain dicts shaped like VitalMultiPatientListResponse, to be encoded straight to JSON.
+        """
+        requested = list(dict.fromkeys(patient_ids))
+        types = sorted(set(vital_types), key=list(VitalType).index) if vital_types else None
+        page_size = min(limit, VitalRepository.MAX_MULTI_PATIENT_PAGE_SIZE)
+        rows = await self.vital_repo.find_values_for_patients(
+            patient_ids=requested,
+            start_time=from_,
+            end_time=to,
+            vital_types=types,
+            limit=page_size,
+            after=PatientVitalCursor.decode(cursor) if cursor else None,
+        )
+        series: dict[str, list[dict[str, Any]]] = {patient_id: [] for patient_id in requested}
+        for patient_id, recorded_at, vital_type, value, _ in rows:
+            series[patient_id].append({"recorded_at": recorded_at, "vital_type": vital_type, "value": float(value)})
+        next_cursor = (
+            PatientVitalCursor(rows[-1].patient_id, rows[-1].recorded_at, rows[-1].id).encode()
+            if len(rows) == page_size
+            else None
+        )
+        return {
+            "vital_types": [vital_type.value for vital_type in types] if types else None,
+            "patients": [{"patient_id": patient_id, "items": items} for patient_id, items in series.items()],
+            "next_cursor": next_cursor,
+        }
+
+    def stream_vitals(
+        self,
+        patient_id: str,
+        from_: datetime,
+        to: datetime,
+        vital_type: VitalType | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream the whole window as NDJSON, one encoded chunk per fetched batch of rows.
+
+        Hot table only: a window reaching archived vitals is rejected here, before the response starts.
+        """
+        self.vital_repo.require_hot(from_)
+        return self._stream_vitals(patient_id, from_, to, vital_type)
+
+    async def _stream_vitals(
+        self,
+        patient_id: str,
+        from_: datetime,
+        to: datetime,
+        vital_type: VitalType | None,
+    ) -> AsyncIterator[bytes]:
+        async for rows in self.vital_repo.stream_values_by_time_range(patient_id, from_, to, vital_type):
+            yield b"".join(
+                json.dumps({"recorded_at": recorded_at.isoformat(), "value": float(value)}).encode() + b"\n"
+                for recorded_at, value, _ in rows
+            )
+
+    async def aggregate_vitals(
+        self,
+        patient_id: str,
+        from_: datetime,
+        to: datetime,
+        vital_type: VitalType,
+        bucket: AggregationBucket | None = None,
+        agg: AggregationFunction = AggregationFunction.AVG,
+        max_points: int | None = None,
+    ) -> VitalAggregateResponse:
+        """Bucket the series in SQL and/or reduce it to max_points with LTTB (hot table only)."""
+        self.vital_repo.require_hot(from_)
+        if bucket is not None:
+            rows = await self.vital_repo.aggregate_by_time_range(
+                patient_id, from_, to, vital_type, bucket.interval, agg
+            )
+            points = [(bucket_start, value) for bucket_start, value in rows]
+        elif max_points is not None and (
+            await self.vital_repo.count_by_time_range(patient_id, from_, to, vital_type)
+            > self.LTTB_PREBUCKET_FACTOR * max_points
+        ):
+            buckets = self.LTTB_PREBUCKET_FACTOR * max_points
+            width = timedelta(seconds=max(math.ceil((to - from_).total_seconds() / buckets), 1))
+            rows = await self.vital_repo.aggregate_by_time_range(
+                patient_id, from_, to, vital_type, width, AggregationFunction.AVG
+            )
+            points = [(bucket_start, value) for bucket_start, value in rows]
+        else:
+            points = [
+                (recorded_at, float(value))
+                async for batch in self.vital_repo.stream_values_by_time_range(patient_id, from_, to, vital_type)
+                for recorded_at, value, _ in batch
+            ]
+        if max_points is not None:
+            points = lttb(points, max_points)
+
+        return VitalAggregateResponse(
             patient_id=patient_id,
-            vital_type=vital_type.value if vital_type else None,
-            items=items,
+            vital_type=vital_type.value,
+            bucket=bucket.value if bucket else None,
+            agg=agg.value if bucket else None,
+            items=[VitalItem(recorded_at=recorded_at, value=value) for recorded_at, value in points],
         )
 
     async def update_vital(
@@ -69,9 +249,10 @@ class VitalService:
                 value=Decimal(str(request.value)),
                 vital_type=request.vital_type.value,
             )
-            return VitalResponse.model_validate(updated)
         except OptimisticLockError:
             existing = await self.vital_repo.find_by_id(vital_id)
             if existing is None:
                 raise VitalNotFoundError(f"Vital {vital_id} not found") from None
             raise
+        await self.risk_service.on_vitals_written([updated])
+        return VitalResponse.model_validate(updated)
@@ -0,0 +1,59 @@
+"""Move vitals older than VITALS_ARCHIVE_AFTER_HOURS into Parquet segments under VITALS_ARCHIVE_DIR.
+
+Run it daily, after maintain_partitions. The API reads the same directory, so it must be shared with
+(or local to) the API containers.
+
+Usage:
+    uv run python -m app.cli.archive_vitals
+    uv run python -m app.cli.archive_vitals --archive-dir /var/lib/vitals --after-hours 96
+"""
+
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.application.vital_archive_service import VitalArchiveService
+from app.config import get_settings
+from app.infrastructure.database import async_session_factory, engine
+from app.infrastructure.vital_archive import vital_archive
+
+
+async def run(archive_dir: Path, after_hours: int) -> None:
+    vital_archive.configure(archive_dir, timedelta(hours=after_hours))
+    async with async_session_factory() as session:
+        result = await VitalArchiveService(session).archive_before_cutoff(datetime.now(UTC))
+    await engine.dispose()
+
+    for name in result.dropped_partitions:
+        print(f"dropped {name}")
+    print(
+        f"Archived {result.archived} vitals into {result.segments} segments "
+        f"in {result.elapsed_seconds:.1f}s ({len(result.dropped_partitions)} empty partitions dropped)"
+    )
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Archive old vitals to compressed Parquet segments.")
+    parser.add_argument(
+        "--archive-dir",
+        type=Path,
+        default=Path(settings.VITALS_ARCHIVE_DIR) if settings.VITALS_ARCHIVE_DIR else None,
+        help="Segment directory (default: VITALS_ARCHIVE_DIR)",
+    )
+    parser.add_argument(
+        "--after-hours",
+        type=int,
+        default=settings.VITALS_ARCHIVE_AFTER_HOURS,
+        help="Archive vitals recorded more than this many hours ago, whole UTC days only "
+        "(default: VITALS_ARCHIVE_AFTER_HOURS)",
+    )
+    args = parser.parse_args()
+    if args.archive_dir is None:
+        parser.error("set VITALS_ARCHIVE_DIR or pass --archive-dir")
+    asyncio.run(run(args.archive_dir, args.after_hours))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Backfill vitals from an NDJSON or CSV file using PostgreSQL COPY.
+
+Usage:
+    uv run python -m app.cli.import_vitals vitals.ndjson
+    uv run python -m app.cli.import_vitals vitals.csv --chunk-size 10000
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from app.application.vital_import_service import VitalImportFormat, VitalImportService
+from app.infrastructure.database import async_session_factory, engine
+
+
+async def read_lines(path: Path) -> AsyncIterator[str]:
+    with path.open(encoding="utf-8", newline="") as file:
+        for line in file:
+            yield line
+
+
+async def run(path: Path, fmt: VitalImportFormat, chunk_size: int) -> None:
+    async with async_session_factory() as session:
+        service = VitalImportService(session, chunk_size=chunk_size)
+        result = await service.import_lines(read_lines(path), fmt)
+    await engine.dispose()
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.detail}")
+    print(
+        f"Imported {result.imported} rows ({result.rejected} rejected) "
+        f"in {result.elapsed_seconds:.1f}s ({result.rows_per_second:.0f} rows/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import historical vitals with PostgreSQL COPY.")
+    parser.add_argument("path", type=Path, help="NDJSON or CSV file to import")
+    parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in VitalImportFormat],
+        help="Input format (default: inferred from the file extension)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=VitalImportService.DEFAULT_CHUNK_SIZE,
+        help="Rows per COPY batch and commit",
+    )
+    args = parser.parse_args()
+
+    try:
+        fmt = VitalImportFormat(args.format or args.path.suffix.lstrip(".").lower())
+    except ValueError:
+        parser.error(f"cannot infer format from {args.path.name}, pass --format")
+    asyncio.run(run(args.path, fmt, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Create upcoming vitals partitions and drop those past retention.
+
+Run it daily (cron, or the container entrypoint); concurrent runs wait for each other.
+
+Usage:
+    uv run python -m app.cli.maintain_partitions
+    uv run python -m app.cli.maintain_partitions --interval day --ahead 7 --retention-days 365
+"""
+
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from app.application.vital_partition_service import VitalPartitionService
+from app.config import get_settings
+from app.domain.vital_partition import PartitionInterval
+from app.infrastructure.database import async_session_factory, engine
+
+
+async def run(interval: PartitionInterval, ahead: int, retention_days: int) -> None:
+    now = datetime.now(UTC)
+    retain_from = now - timedelta(days=retention_days) if retention_days > 0 else None
+    async with async_session_factory() as session:
+        service = VitalPartitionService(session, interval)
+        result = await service.maintain(now, ahead, retain_from)
+        await session.commit()
+    await engine.dispose()
+
+    for name in result.created:
+        print(f"created {name}")
+    for name in result.dropped:
+        print(f"dropped {name}")
+    print(
+        f"{len(result.created)} created, {len(result.dropped)} dropped, "
+        f"{result.moved_rows} rows moved out of the default partition, {result.deleted_rows} expired rows deleted"
+    )
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Maintain the recorded_at range partitions of vitals.")
+    parser.add_argument(
+        "--interval",
+        choices=[interval.value for interval in PartitionInterval],
+        default=settings.VITALS_PARTITION_INTERVAL,
+        help="Partition width (default: VITALS_PARTITION_INTERVAL)",
+    )
+    parser.add_argument(
+        "--ahead",
+        type=int,
+        default=settings.VITALS_PARTITIONS_AHEAD,
+        help="Future periods to create beyond the current one (default: VITALS_PARTITIONS_AHEAD)",
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings.VITALS_RETENTION_DAYS,
+        help="Drop partitions that ended more than this many days ago, 0 = keep (default: VITALS_RETENTION_DAYS)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(PartitionInterval(args.interval), args.ahead, args.retention_days))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,46 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Optional read replica for read-only routes (empty = everything uses DATABASE_URL)
+    READ_DATABASE_URL: str = ""
+    # After a successful write the client reads from the primary for this long (0 = never pin)
+    READ_AFTER_WRITE_PIN_SECONDS: float = 5.0
     TEST_DATABASE_URL: str = ""
     BEARER_TOKEN: str
+    # Connection pool, per worker process (see infrastructure/database.py)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 = never
+    DB_POOL_PRE_PING: bool = False  # costs a round-trip per checkout
+    # Prepared statements cached per connection (0 = prepare every statement)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Connect through pgbouncer in transaction pooling mode: no pool here and no reused prepared statements
+    DB_PGBOUNCER: bool = False
+    # vitals range partitions: width (day or month) and how many future periods maintain_partitions creates
+    VITALS_PARTITION_INTERVAL: Literal["day", "month"] = "month"
+    VITALS_PARTITIONS_AHEAD: int = 3
+    # Drop partitions older than this many days (0 = keep everything)
+    VITALS_RETENTION_DAYS: int = 0
+    # Cold tier: vitals older than VITALS_ARCHIVE_AFTER_HOURS are moved to Parquet files here (empty = disabled)
+    VITALS_ARCHIVE_DIR: str = ""
+    VITALS_ARCHIVE_AFTER_HOURS: int = 72
+    # JSON rule file for the rule_based strategy (empty = built-in rules), re-read when it changes
+    INFERENCE_RULES_PATH: str = ""
+    INFERENCE_RULES_RELOAD_SECONDS: float = 1.0
+    # Pool sizes for strategies registered with thread / process execution mode (0 = executor default)
+    INFERENCE_THREAD_WORKERS: int = 0
+    INFERENCE_PROCESS_WORKERS: int = 0
+    # patient_ids kept in the process-local existence cache used by vital writes (0 = disabled)
+    PATIENT_CACHE_SIZE: int = 100000
+    # Memoized single-record evaluations (0 entries = disabled, 0 seconds = no expiry)
+    INFERENCE_CACHE_SIZE: int = 10000
+    INFERENCE_CACHE_TTL_SECONDS: float = 300.0
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+
+def lttb(points: Sequence[tuple[datetime, float]], threshold: int) -> list[tuple[datetime, float]]:
+    """Downsample a time series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for each of the threshold - 2 buckets in between,
+    the point forming the largest triangle with the previously kept point and the average
+    of the next bucket. This preserves the visual shape (peaks and dips) of the series.
+    """
+    if threshold < 3:
+        raise ValueError("threshold must be at least 3")
+    n = len(points)
+    if n <= threshold:
+        return list(points)
+
+    xs = [recorded_at.timestamp() for recorded_at, _ in points]
+    ys = [value for _, value in points]
+    every = (n - 2) / (threshold - 2)
+
+    sampled = [points[0]]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = sum(xs[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(ys[avg_start:avg_end]) / (avg_end - avg_start)
+
+        ax, ay = xs[a], ys[a]
+        max_area = -1.0
+        next_a = range_start = int(i * every) + 1
+        for j in range(range_start, int((i + 1) * every) + 1):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+        sampled.append(points[next_a])
+        a = next_a
+
+    sampled.append(points[-1])
+    return sampled
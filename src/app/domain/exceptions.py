@@ -32,3 +32,21 @@ class DuplicatePatientIdError(DomainError):
     """Raised when patient_id already exists."""
 
     pass
+
+
+class InvalidCursorError(DomainError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+class VitalWindowTooLargeError(DomainError):
+    """Raised when a time range holds more vitals than a query may load at once."""
+
+    pass
+
+
+class ArchivedWindowError(DomainError):
+    """Raised when a hot-table-only query would miss vitals already moved to the archive."""
+
+    pass
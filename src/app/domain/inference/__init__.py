@@ -1,10 +1,30 @@
-from app.domain.inference.base import BaseInference, InferenceResult
+from app.domain.inference.base import BaseInference, BatchInferenceResult, InferenceResult, VitalColumns, to_columns
+from app.domain.inference.execution_mode import ExecutionMode
 from app.domain.inference.factory import InferenceFactory
+from app.domain.inference.result_cache import InferenceCacheStats, InferenceResultCache
+from app.domain.inference.risk_aggregation import AGGREGATORS, AggregationPolicy, RiskAggregator
 from app.domain.inference.rule_based_inference import RuleBasedInference
+from app.domain.inference.rule_compiler import CompiledRules, Rule, compile_rules
+from app.domain.inference.rule_dsl import RuleSet, load_rule_set, parse_rule_set
 
 __all__ = [
+    "AGGREGATORS",
+    "AggregationPolicy",
     "BaseInference",
+    "BatchInferenceResult",
+    "CompiledRules",
+    "ExecutionMode",
+    "InferenceCacheStats",
     "InferenceFactory",
     "InferenceResult",
+    "InferenceResultCache",
+    "RiskAggregator",
+    "Rule",
     "RuleBasedInference",
+    "RuleSet",
+    "VitalColumns",
+    "compile_rules",
+    "load_rule_set",
+    "parse_rule_set",
+    "to_columns",
 ]
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 from app.domain.risk_level import RiskLevel
 
+# One float64 column per vital type; NaN marks a vital that was not measured in that record.
+VitalColumns = dict[str, np.ndarray]
+
 
 @dataclass
 class InferenceResult:
@@ -11,8 +17,89 @@ class InferenceResult:
     checked_rules: list[str]
 
 
+@dataclass
+class BatchInferenceResult:
+    """Columnar results for a batch of records; rule names are only built per record on demand."""
+
+    risk_scores: np.ndarray  # float64, shape (n,)
+    risk_levels: np.ndarray  # RiskLevel objects, shape (n,)
+    rule_names: list[str]
+    matched: np.ndarray  # bool, shape (n, len(rule_names))
+
+    def __len__(self) -> int:
+        return len(self.risk_scores)
+
+    def result(self, index: int) -> InferenceResult:
+        return InferenceResult(
+            risk_score=float(self.risk_scores[index]),
+            risk_level=self.risk_levels[index],
+            checked_rules=[name for name, hit in zip(self.rule_names, self.matched[index], strict=True) if hit],
+        )
+
+
+def to_columns(records: Sequence[Mapping[str, float]]) -> VitalColumns:
+    """Pivot per-record vitals dicts into NaN-padded columns."""
+    keys = {key for vitals in records for key in vitals}
+    columns = {key: np.full(len(records), np.nan) for key in keys}
+    for row, vitals in enumerate(records):
+        for key, value in vitals.items():
+            columns[key][row] = value
+    return columns
+
+
+def column_count(columns: VitalColumns) -> int:
+    return len(next(iter(columns.values()))) if columns else 0
+
+
 class BaseInference(ABC):
+    # Whether InferenceExecutor.evaluate memoizes results of inline evaluation (see InferenceResultCache).
+    # Building and hashing the key costs about as much as a few compiled threshold checks, so only slower
+    # strategies gain. Thread and process modes are always cached: a lookup is cheaper than the hop.
+    CACHE_RESULTS = True
+
+    def startup(self) -> None:  # noqa: B027 - optional hook
+        """Acquire resources (e.g. load a model). Called once before the strategy serves requests."""
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook
+        """Release resources acquired in startup()."""
+
+    @property
+    def version(self) -> str:
+        """Identifies the model or rules behind the results; part of the result cache key, and stored with
+        results computed from it.
+
+        Strategies whose results can change while running (e.g. reloaded rules) must change it too.
+        """
+        return ""
+
+    @property
+    def max_score(self) -> float | None:
+        """Highest score evaluate can return, if known; lets max aggregation stop early."""
+        return None
+
     @abstractmethod
     def evaluate(self, vitals: dict[str, float]) -> InferenceResult:
         """Evaluate vitals and return risk assessment."""
         pass
+
+    def evaluate_batch(self, columns: VitalColumns, size: int | None = None) -> BatchInferenceResult:
+        """Evaluate many records given as columns.
+
+        The default walks the rows through evaluate(); strategies that can vectorize should override it.
+        size is only needed when columns is empty (records without any vitals).
+        """
+        n = column_count(columns) if size is None else size
+        results = [
+            self.evaluate({key: float(values[row]) for key, values in columns.items() if not np.isnan(values[row])})
+            for row in range(n)
+        ]
+        rule_names = list(dict.fromkeys(name for result in results for name in result.checked_rules))
+        matched = np.array(
+            [[name in result.checked_rules for name in rule_names] for result in results], dtype=bool
+        ).reshape(n, len(rule_names))
+        return BatchInferenceResult(
+            risk_scores=np.array([result.risk_score for result in results], dtype=np.float64),
+            risk_levels=np.array([result.risk_level for result in results], dtype=object),
+            rule_names=rule_names,
+            matched=matched,
+        )
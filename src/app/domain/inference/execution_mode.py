@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class ExecutionMode(StrEnum):
+    """Where a strategy's evaluations run."""
+
+    INLINE = "inline"  # On the event loop; for cheap strategies such as rule_based
+    THREAD = "thread"  # In a thread pool; for strategies whose native code releases the GIL
+    PROCESS = "process"  # In a process pool with the strategy preloaded in every worker; for CPU-heavy models
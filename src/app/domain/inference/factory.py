@@ -1,4 +1,8 @@
+from typing import Any
+
 from app.domain.inference.base import BaseInference
+from app.domain.inference.execution_mode import ExecutionMode
+from app.domain.inference.result_cache import InferenceResultCache
 from app.domain.inference.rule_based_inference import RuleBasedInference
 
 
@@ -6,15 +10,74 @@ class InferenceFactory:
     _strategies: dict[str, type[BaseInference]] = {
         "rule_based": RuleBasedInference,
     }
+    # Strategies hold no per-request state, so one instance per name is shared by every request.
+    _instances: dict[str, BaseInference] = {}
+    # Constructor keyword arguments per strategy name (e.g. a rule file path from settings).
+    _options: dict[str, dict[str, Any]] = {}
+    _execution_modes: dict[str, ExecutionMode] = {}
+    # evaluate() results shared by every caller of InferenceExecutor.evaluate; sized from settings at startup.
+    result_cache = InferenceResultCache()
+    # Bumped on every register() so holders of preloaded strategies (worker processes) can tell they are stale.
+    generation = 0
 
     @classmethod
     def get(cls, strategy_name: str = "rule_based") -> BaseInference:
         strategy_class = cls._strategies.get(strategy_name)
         if not strategy_class:
             raise ValueError(f"Unknown inference strategy: {strategy_name}")
-        return strategy_class()
+        instance = cls._instances.get(strategy_name)
+        if instance is not None and type(instance) is strategy_class:
+            return instance
+        instance = strategy_class(**cls._options.get(strategy_name, {}))
+        instance.startup()
+        cls._instances[strategy_name] = instance
+        return instance
+
+    @classmethod
+    def execution_mode(cls, strategy_name: str = "rule_based") -> ExecutionMode:
+        if strategy_name not in cls._strategies:
+            raise ValueError(f"Unknown inference strategy: {strategy_name}")
+        return cls._execution_modes.get(strategy_name, ExecutionMode.INLINE)
 
     @classmethod
-    def register(cls, name: str, strategy: type[BaseInference]) -> None:
-        """Register a new inference strategy for future use."""
+    def registration(cls, strategy_name: str) -> tuple[type[BaseInference], dict[str, Any]]:
+        """The class and constructor options of a strategy, e.g. to recreate it in a worker process."""
+        return cls._strategies[strategy_name], cls._options.get(strategy_name, {})
+
+    @classmethod
+    def names(cls) -> list[str]:
+        return list(cls._strategies)
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        strategy: type[BaseInference],
+        execution_mode: ExecutionMode = ExecutionMode.INLINE,
+        **options: Any,
+    ) -> None:
+        """Register a new inference strategy for future use; options are passed to its constructor."""
         cls._strategies[name] = strategy
+        cls._options[name] = options
+        cls._execution_modes[name] = execution_mode
+        cls.generation += 1
+        cls.result_cache.invalidate(name)
+        previous = cls._instances.pop(name, None)
+        if previous is not None:
+            previous.shutdown()
+
+    @classmethod
+    def startup(cls) -> None:
+        """Create and start every in-process strategy so the first request does not pay for it.
+
+        Process-mode strategies are only created inside the worker processes.
+        """
+        for name in cls._strategies:
+            if cls.execution_mode(name) is not ExecutionMode.PROCESS:
+                cls.get(name)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        for instance in cls._instances.values():
+            instance.shutdown()
+        cls._instances.clear()
@@ -0,0 +1,106 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from app.domain.inference.base import InferenceResult
+
+# (strategy name, strategy version, quantized vitals as sorted (type, value) pairs)
+CacheKey = tuple[str, str, tuple[tuple[str, float], ...]]
+
+
+@dataclass(frozen=True)
+class InferenceCacheStats:
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class InferenceResultCache:
+    """LRU memo of evaluate() results with a time-to-live, keyed by strategy name, version and vitals.
+
+    Monitors poll with the same vitals over and over, so a repeat evaluation becomes a dict lookup.
+    Values are quantized to the DECIMALS vitals are stored with; callers evaluate the quantized record,
+    so a cached result is exact for every record sharing its key. Cached results are shared between
+    callers and must be treated as read-only.
+    max_size 0 disables the cache; ttl_seconds 0 keeps entries until they are evicted.
+    """
+
+    DECIMALS = 2  # vitals.value is Numeric(10, 2)
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 300.0):
+        self._entries: OrderedDict[CacheKey, tuple[float, InferenceResult]] = OrderedDict()
+        self.configure(max_size, ttl_seconds)
+
+    def configure(self, max_size: int, ttl_seconds: float) -> None:
+        """Apply new limits; drops every entry and resets the counters."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @classmethod
+    def quantize(cls, vitals: Mapping[str, float]) -> dict[str, float]:
+        """The record as it is cached and evaluated: values rounded to DECIMALS, so jitter below that hits."""
+        return {vital_type: round(float(value), cls.DECIMALS) for vital_type, value in vitals.items()}
+
+    @classmethod
+    def key(cls, strategy_name: str, version: str, vitals: Mapping[str, float]) -> CacheKey:
+        # Sorting makes the key independent of the order the client listed the vitals in.
+        return strategy_name, version, tuple(sorted(cls.quantize(vitals).items()))
+
+    def get(self, key: CacheKey) -> InferenceResult | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return None
+
+    def put(self, key: CacheKey, result: InferenceResult) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else math.inf
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, strategy_name: str | None = None) -> None:
+        """Drop the entries of one strategy, or all entries."""
+        if strategy_name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == strategy_name]:
+            del self._entries[key]
+
+    def stats(self) -> InferenceCacheStats:
+        return InferenceCacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
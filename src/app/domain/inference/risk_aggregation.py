@@ -0,0 +1,114 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from enum import StrEnum
+
+import numpy as np
+
+
+class AggregationPolicy(StrEnum):
+    """How the risk scores of a patient's records are combined into one assessment."""
+
+    MAX = "max"  # The highest-risk record
+    LATEST = "latest"  # The most recent record
+    TIME_WEIGHTED = "time_weighted"  # Mean score, recent records weighted more (see TimeWeightedAggregator)
+
+
+def as_utc(recorded_at: Sequence[datetime]) -> list[datetime]:
+    """Aware copies of the timestamps; naive ones are UTC (requests may mix "...T10:00:00" and "...Z")."""
+    return [moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment for moment in recorded_at]
+
+
+class RiskAggregator(ABC):
+    """Folds the risk scores of one patient's records into one assessment.
+
+    Records are scored in the order given by order() and fed in chunks; feed() returns True once the
+    remaining records cannot change the outcome, so the caller stops evaluating. winner is the record
+    whose checked_rules are reported, so rule names only need to be built for that one record.
+    """
+
+    def __init__(self, recorded_at: Sequence[datetime], max_score: float | None = None):
+        self.recorded_at = recorded_at
+        self.max_score = max_score  # Highest score the strategy can return, if known
+        self.winner = -1
+
+    def order(self) -> np.ndarray | None:
+        """Indexes of the records to evaluate, in evaluation order; None for all records as listed."""
+        return None
+
+    @abstractmethod
+    def feed(self, indexes: np.ndarray, scores: np.ndarray) -> bool:
+        """Take the scores of records[indexes]; True when no further records are needed."""
+
+    def score(self) -> float | None:
+        """The aggregated score, or None to report the winner's own score and level."""
+        return None
+
+
+class MaxAggregator(RiskAggregator):
+    """The first record with the highest score; stops as soon as a record reaches max_score."""
+
+    def __init__(self, recorded_at: Sequence[datetime], max_score: float | None = None):
+        super().__init__(recorded_at, max_score)
+        self.best = -np.inf
+
+    def feed(self, indexes: np.ndarray, scores: np.ndarray) -> bool:
+        position = int(np.argmax(scores))
+        if scores[position] > self.best:
+            self.best = float(scores[position])
+            self.winner = int(indexes[position])
+        return self.max_score is not None and self.best >= self.max_score
+
+
+class LatestAggregator(RiskAggregator):
+    """The record with the latest recorded_at (the last one listed on ties); only that record is evaluated."""
+
+    def __init__(self, recorded_at: Sequence[datetime], max_score: float | None = None):
+        super().__init__(recorded_at, max_score)
+        times = as_utc(recorded_at)
+        # max() keeps the first maximum it sees, so scanning backwards picks the last one listed.
+        self.winner = max(reversed(range(len(times))), key=lambda index: times[index])
+
+    def order(self) -> np.ndarray | None:
+        return np.array([self.winner])
+
+    def feed(self, indexes: np.ndarray, scores: np.ndarray) -> bool:
+        return True
+
+
+class TimeWeightedAggregator(RiskAggregator):
+    """Mean score weighted by recency: a record's weight halves every HALF_LIFE_SECONDS before the latest one.
+
+    The record contributing the most weighted score supplies checked_rules.
+    """
+
+    HALF_LIFE_SECONDS = 3600.0
+
+    def __init__(self, recorded_at: Sequence[datetime], max_score: float | None = None):
+        super().__init__(recorded_at, max_score)
+        times = np.array([timestamp.timestamp() for timestamp in as_utc(recorded_at)])
+        self.weights = 0.5 ** ((times.max() - times) / self.HALF_LIFE_SECONDS)
+        self.weighted_sum = 0.0
+        self.weight_sum = 0.0
+        self.best = -np.inf
+
+    def feed(self, indexes: np.ndarray, scores: np.ndarray) -> bool:
+        weights = self.weights[indexes]
+        contributions = weights * scores
+        self.weighted_sum += float(contributions.sum())
+        self.weight_sum += float(weights.sum())
+        position = int(np.argmax(contributions))
+        if contributions[position] > self.best:
+            self.best = float(contributions[position])
+            self.winner = int(indexes[position])
+        return False
+
+    def score(self) -> float | None:
+        return self.weighted_sum / self.weight_sum
+
+
+AGGREGATORS: dict[AggregationPolicy, type[RiskAggregator]] = {
+    AggregationPolicy.MAX: MaxAggregator,
+    AggregationPolicy.LATEST: LatestAggregator,
+    AggregationPolicy.TIME_WEIGHTED: TimeWeightedAggregator,
+}
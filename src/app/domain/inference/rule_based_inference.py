@@ -1,25 +1,104 @@
-from collections.abc import Callable
+import logging
+import operator
+import time
+from collections.abc import Collection
+from pathlib import Path
 
-from app.domain.inference.base import BaseInference, InferenceResult
+from app.domain.inference.base import BaseInference, BatchInferenceResult, InferenceResult, VitalColumns
+from app.domain.inference.rule_compiler import CompiledRules, Rule, compile_rules
+from app.domain.inference.rule_dsl import load_rule_set
 from app.domain.risk_level import RiskLevel
+from app.domain.vital_type import VitalType
+
+logger = logging.getLogger(__name__)
 
 
 class RuleBasedInference(BaseInference):
-    RULES: list[tuple[str, Callable[[dict[str, float]], bool]]] = [
-        ("HR > 120", lambda v: v.get("HR", 0) > 120),
-        ("SBP < 90", lambda v: v.get("SBP", float("inf")) < 90),
-        ("SpO2 < 90", lambda v: v.get("SpO2", 100) < 90),
+    """Threshold rules scored by how many of them match.
+
+    The built-in RULES/SCORES/LEVELS apply unless a rule file (see rule_dsl) is given; a rule
+    file is re-read when its mtime changes, checked at most every reload_interval seconds.
+    """
+
+    # The comparisons work on scalars and on numpy columns alike, so both paths share one definition.
+    RULES: list[Rule] = [
+        Rule("HR > 120", VitalType.HR, operator.gt, 120),
+        Rule("SBP < 90", VitalType.SBP, operator.lt, 90),
+        Rule("SpO2 < 90", VitalType.SPO2, operator.lt, 90),
     ]
+    # Indexed by the number of matched rules (the last entry covers "or more").
+    SCORES = (0.2, 0.5, 0.7, 0.9)
+    LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.MEDIUM, RiskLevel.HIGH)
+    # Inline, the compiled evaluator returns shared results faster than a cache key can be built.
+    CACHE_RESULTS = False
+
+    def __init__(self, rules_path: str | Path | None = None, reload_interval: float = 1.0):
+        self.rules_path = Path(rules_path) if rules_path else None
+        self.reload_interval = reload_interval
+        self.compiled: CompiledRules = compile_rules(self.RULES, self.SCORES, self.LEVELS)
+        self._loaded_mtime_ns: int | None = None
+        self._next_reload_check = 0.0
+
+    @property
+    def version(self) -> str:
+        # Checked (throttled) here too, so cached results of replaced rules stop being served.
+        if self.rules_path is not None:
+            self._check_reload()
+        return self.compiled.version
+
+    @property
+    def max_score(self) -> float | None:
+        return max(self.compiled.scores)
+
+    def startup(self) -> None:
+        if self.rules_path is not None:
+            self.reload()  # A broken rule file should fail startup rather than fall back silently
+
+    def reload(self) -> bool:
+        """Recompile the rule file if it changed since the last load; True when new rules were swapped in."""
+        if self.rules_path is None:
+            return False
+        mtime_ns = self.rules_path.stat().st_mtime_ns
+        if mtime_ns == self._loaded_mtime_ns:
+            return False
+        # Remember the mtime first so a broken file is reported once, not on every check.
+        self._loaded_mtime_ns = mtime_ns
+        rule_set = load_rule_set(self.rules_path)
+        self.compiled = compile_rules(rule_set.rules, rule_set.scores, rule_set.levels, rule_set.version)
+        logger.info(
+            "Loaded %d inference rules (version %s) from %s", len(rule_set.rules), self.version, self.rules_path
+        )
+        return True
 
     def evaluate(self, vitals: dict[str, float]) -> InferenceResult:
-        matched = [name for name, check in self.RULES if check(vitals)]
-        count = len(matched)
-
-        if count == 0:
-            return InferenceResult(0.2, RiskLevel.LOW, matched)
-        elif count == 1:
-            return InferenceResult(0.5, RiskLevel.MEDIUM, matched)
-        elif count == 2:
-            return InferenceResult(0.7, RiskLevel.MEDIUM, matched)
-        else:
-            return InferenceResult(0.9, RiskLevel.HIGH, matched)
+        if self.rules_path is not None:
+            self._check_reload()
+        return self.compiled.evaluate(vitals)
+
+    def evaluate_batch(self, columns: VitalColumns, size: int | None = None) -> BatchInferenceResult:
+        if self.rules_path is not None:
+            self._check_reload()
+        return self.compiled.evaluate_batch(columns, size)
+
+    def rescore(self, checked_rules: Collection[str], vital_type: str, value: float | None) -> InferenceResult:
+        """Re-run only the rules on vital_type; the other rules keep their outcome from checked_rules.
+
+        value is None when the patient no longer has a measurement of that type. checked_rules must come
+        from the current rule version: rules added or changed since are not re-checked here.
+        """
+        compiled = self.compiled
+        mask = 0
+        for index, (name, key, compare, threshold) in enumerate(compiled.rules):
+            if value is not None and compare(value, threshold) if key == vital_type else name in checked_rules:
+                mask |= 1 << index
+        return compiled.result(mask)
+
+    def _check_reload(self) -> None:
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.reload_interval
+        try:
+            self.reload()
+        except (OSError, ValueError):
+            logger.exception("Keeping inference rules version %s; reloading %s failed", self.version, self.rules_path)
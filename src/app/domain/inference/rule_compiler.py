@@ -0,0 +1,198 @@
+import math
+import operator
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, NamedTuple
+
+import numpy as np
+
+from app.domain.inference.base import BatchInferenceResult, InferenceResult, VitalColumns, column_count
+from app.domain.risk_level import RiskLevel
+
+# Threshold comparisons: (source form, bisect side, True if matches are a prefix of the ascending thresholds).
+# value > t holds for every t below bisect_left(thresholds, value), value < t for every t from bisect_right on, etc.
+_THRESHOLD_OPERATORS: dict[Callable, tuple[str, Literal["left", "right"], bool]] = {
+    operator.gt: (">", "left", True),
+    operator.ge: (">=", "right", True),
+    operator.lt: ("<", "right", False),
+    operator.le: ("<=", "left", False),
+}
+
+
+class Rule(NamedTuple):
+    """A threshold rule on one vital type. A vital that was not measured never matches."""
+
+    name: str
+    vital_type: str
+    compare: Callable  # operator.gt, operator.lt, ...; works on scalars and numpy columns alike
+    threshold: float
+
+
+@dataclass(frozen=True)
+class ThresholdTable:
+    """The rules of one vital type that share a threshold comparison, sorted by threshold."""
+
+    vital_type: str
+    compare: Callable
+    thresholds: tuple[float, ...]
+    rule_indexes: tuple[int, ...]  # rules[rule_indexes[k]] has thresholds[k]
+
+    @property
+    def side(self) -> Literal["left", "right"]:
+        return _THRESHOLD_OPERATORS[self.compare][1]
+
+    @property
+    def prefix(self) -> bool:
+        return _THRESHOLD_OPERATORS[self.compare][2]
+
+    def masks(self) -> tuple[int, ...]:
+        """Bitmask of matched rules for every bisect position 0..len(thresholds)."""
+        bits = [1 << index for index in self.rule_indexes]
+        masks = [0] * (len(bits) + 1)
+        if self.prefix:
+            for k, bit in enumerate(bits):
+                masks[k + 1] = masks[k] | bit
+        else:
+            for k in range(len(bits) - 1, -1, -1):
+                masks[k] = masks[k + 1] | bits[k]
+        return tuple(masks)
+
+    def match_columns(self, column: np.ndarray) -> np.ndarray:
+        """Bool matrix (rows, len(thresholds)) of matches for a column; NaN matches nothing."""
+        positions = np.searchsorted(np.asarray(self.thresholds), column, side=self.side)[:, None]
+        ks = np.arange(len(self.thresholds))
+        matched = ks < positions if self.prefix else ks >= positions
+        return matched & ~np.isnan(column)[:, None]
+
+
+class CompiledRules:
+    """Rules compiled into sorted threshold tables per vital type plus a score lookup table.
+
+    The scalar evaluator is generated code: for each vital type present it either compares a few
+    thresholds inline or, for larger tables, bisects the sorted thresholds and ORs a precomputed
+    mask. Matches form a bitmask whose InferenceResult is built once and shared, so callers must
+    treat results (including checked_rules) as read-only. evaluate_batch runs the same tables
+    through np.searchsorted.
+    """
+
+    # Tables with more thresholds than this are bisected; smaller ones are cheaper to compare inline.
+    INLINE_LIMIT = 4
+
+    def __init__(
+        self,
+        rules: Sequence[Rule],
+        scores: Sequence[float],
+        levels: Sequence[RiskLevel],
+        version: str = "builtin",
+    ):
+        self.rules = tuple(rules)
+        self.scores = tuple(scores)
+        self.levels = tuple(levels)
+        self.version = version
+        self.rule_names = [rule.name for rule in self.rules]
+
+        grouped: dict[tuple[str, Callable], list[int]] = {}
+        self.custom_rules: list[int] = []  # comparisons without a threshold table, checked one by one
+        for index, rule in enumerate(self.rules):
+            if rule.compare in _THRESHOLD_OPERATORS and not math.isnan(rule.threshold):
+                grouped.setdefault((str(rule.vital_type), rule.compare), []).append(index)
+            else:
+                self.custom_rules.append(index)
+        self.tables = [
+            ThresholdTable(
+                vital_type,
+                compare,
+                tuple(self.rules[index].threshold for index in ordered),
+                tuple(ordered),
+            )
+            for (vital_type, compare), indexes in grouped.items()
+            for ordered in [sorted(indexes, key=lambda index: self.rules[index].threshold)]
+        ]
+
+        self._results: dict[int, InferenceResult] = {}
+        self.evaluate: Callable[[dict[str, float]], InferenceResult] = self._generate()
+
+    def result(self, mask: int) -> InferenceResult:
+        """Result for a bitmask of matched rules (bit i = rules[i])."""
+        result = self._results.get(mask)
+        if result is None:
+            names = [rule.name for index, rule in enumerate(self.rules) if mask >> index & 1]
+            count = min(len(names), len(self.scores) - 1)
+            result = self._results[mask] = InferenceResult(self.scores[count], self.levels[count], names)
+        return result
+
+    def evaluate_batch(self, columns: VitalColumns, size: int | None = None) -> BatchInferenceResult:
+        n = column_count(columns) if size is None else size
+        matched = np.zeros((n, len(self.rules)), dtype=bool)
+        for table in self.tables:
+            if table.vital_type in columns:
+                matched[:, table.rule_indexes] = table.match_columns(columns[table.vital_type])
+        for index in self.custom_rules:
+            _, vital_type, compare, threshold = self.rules[index]
+            if vital_type in columns:
+                matched[:, index] = compare(columns[vital_type], threshold)  # NaN compares False
+
+        counts = np.minimum(matched.sum(axis=1), len(self.scores) - 1)
+        return BatchInferenceResult(
+            risk_scores=np.asarray(self.scores, dtype=np.float64)[counts],
+            risk_levels=np.asarray(self.levels, dtype=object)[counts],
+            rule_names=self.rule_names,
+            matched=matched,
+        )
+
+    def _generate(self) -> Callable[[dict[str, float]], InferenceResult]:
+        namespace: dict[str, Any] = {
+            "results": self._results,
+            "build": self.result,
+            "bisect_left": bisect_left,
+            "bisect_right": bisect_right,
+        }
+
+        def literal(name: str, value: float) -> str:
+            if math.isfinite(value):
+                return repr(float(value))
+            namespace[name] = value  # inf has no literal form
+            return name
+
+        body: dict[str, list[str]] = {}
+        for number, table in enumerate(self.tables):
+            lines = body.setdefault(table.vital_type, [])
+            if len(table.thresholds) <= self.INLINE_LIMIT:
+                symbol = _THRESHOLD_OPERATORS[table.compare][0]
+                for threshold, index in zip(table.thresholds, table.rule_indexes, strict=True):
+                    bound = literal(f"threshold_{index}", threshold)
+                    lines += [f"if value {symbol} {bound}:", f"    mask |= {1 << index}"]
+            else:
+                namespace[f"thresholds_{number}"] = table.thresholds
+                namespace[f"masks_{number}"] = table.masks()
+                lines.append(f"mask |= masks_{number}[bisect_{table.side}(thresholds_{number}, value)]")
+        for index in self.custom_rules:
+            rule = self.rules[index]
+            namespace[f"compare_{index}"] = rule.compare
+            namespace[f"threshold_{index}"] = rule.threshold
+            body.setdefault(str(rule.vital_type), []).extend(
+                [f"if compare_{index}(value, threshold_{index}):", f"    mask |= {1 << index}"]
+            )
+
+        source = ["def evaluate(vitals):", "    mask = 0"]
+        for vital_type, lines in body.items():
+            # value == value skips NaN, which would otherwise land at the end of every bisect.
+            source += [f"    value = vitals.get({vital_type!r})", "    if value is not None and value == value:"]
+            source += [f"        {line}" for line in lines]
+        source += ["    result = results.get(mask)", "    return build(mask) if result is None else result"]
+
+        exec(compile("\n".join(source), "<compiled rules>", "exec"), namespace)
+        return namespace["evaluate"]
+
+
+def compile_rules(
+    rules: Sequence[Rule],
+    scores: Sequence[float],
+    levels: Sequence[RiskLevel],
+    version: str = "builtin",
+) -> CompiledRules:
+    """Compile rules with a score/level table indexed by the number of matched rules (last entry = "or more")."""
+    if not scores or len(scores) != len(levels):
+        raise ValueError("scores and levels must be non-empty and of equal length")
+    return CompiledRules(rules, scores, levels, version)
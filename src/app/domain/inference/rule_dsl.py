@@ -0,0 +1,107 @@
+"""Declarative rule sets for RuleBasedInference.
+
+A rule file is JSON::
+
+    {
+      "version": "2025-12-01",
+      "score_ladder": [
+        {"score": 0.2, "level": "LOW"},
+        {"score": 0.5, "level": "MEDIUM"},
+        {"score": 0.7, "level": "MEDIUM"},
+        {"score": 0.9, "level": "HIGH"}
+      ],
+      "rules": [
+        {"name": "HR > 120", "vital_type": "HR", "op": ">", "threshold": 120},
+        {"vital_type": "SBP", "op": "<", "threshold": 90}
+      ]
+    }
+
+score_ladder is indexed by the number of matched rules; its last entry covers "or more".
+A rule's name defaults to "<vital_type> <op> <threshold>".
+"""
+
+import hashlib
+import json
+import math
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.domain.inference.rule_compiler import Rule
+from app.domain.risk_level import RiskLevel
+from app.domain.vital_type import VitalType
+
+OPERATORS: dict[str, Callable] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    version: str
+    rules: list[Rule]
+    scores: tuple[float, ...]
+    levels: tuple[RiskLevel, ...]
+
+
+def parse_rule_set(data: Mapping[str, Any]) -> RuleSet:
+    """Validate a decoded rule file; raises ValueError describing the first problem found."""
+    ladder = data.get("score_ladder")
+    if not isinstance(ladder, list) or not ladder:
+        raise ValueError("score_ladder must be a non-empty list")
+    scores = []
+    levels = []
+    for position, step in enumerate(ladder):
+        try:
+            scores.append(_number(step["score"]))
+            levels.append(RiskLevel(step["level"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"score_ladder[{position}]: expected {{score, level}} ({exc})") from None
+
+    raw_rules = data.get("rules")
+    if not isinstance(raw_rules, list):
+        raise ValueError("rules must be a list")
+    rules = []
+    for position, raw in enumerate(raw_rules):
+        try:
+            vital_type = VitalType(raw["vital_type"])
+            op = raw["op"]
+            compare = OPERATORS[op]
+            threshold = _number(raw["threshold"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(
+                f"rules[{position}]: expected vital_type in {[t.value for t in VitalType]}, "
+                f"op in {list(OPERATORS)} and a numeric threshold ({exc!r})"
+            ) from None
+        name = raw.get("name") or f"{vital_type.value} {op} {threshold:g}"
+        rules.append(Rule(str(name), vital_type.value, compare, threshold))
+
+    return RuleSet(str(data.get("version", "")), rules, tuple(scores), tuple(levels))
+
+
+def load_rule_set(path: str | Path) -> RuleSet:
+    content = Path(path).read_bytes()
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{path}: invalid JSON ({exc})") from None
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+    rule_set = parse_rule_set(data)
+    if not rule_set.version:
+        # Without an explicit version, a hash of the file identifies the rule set, so result caches keyed by version
+        # only go stale when the rules actually change.
+        version = f"sha256-{hashlib.sha256(content).hexdigest()[:16]}"
+        rule_set = RuleSet(version, rule_set.rules, rule_set.scores, rule_set.levels)
+    return rule_set
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float) or math.isnan(value):
+        raise ValueError(f"{value!r} is not a number")
+    return float(value)
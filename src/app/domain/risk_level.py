@@ -5,3 +5,12 @@ class RiskLevel(StrEnum):
     LOW = "LOW"
     MEDIUM = "MEDIUM"
     HIGH = "HIGH"
+
+    @classmethod
+    def from_score(cls, score: float) -> "RiskLevel":
+        """Level of a score that did not come from a rule ladder (e.g. an aggregate): HIGH >= 0.8, MEDIUM > 0.3."""
+        if score >= 0.8:
+            return cls.HIGH
+        if score > 0.3:
+            return cls.MEDIUM
+        return cls.LOW
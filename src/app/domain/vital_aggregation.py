@@ -0,0 +1,27 @@
+from datetime import timedelta
+from enum import StrEnum
+
+
+class AggregationBucket(StrEnum):
+    ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    ONE_HOUR = "1h"
+
+    @property
+    def interval(self) -> timedelta:
+        return _BUCKET_INTERVALS[self]
+
+
+class AggregationFunction(StrEnum):
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    LAST = "last"
+    COUNT = "count"
+
+
+_BUCKET_INTERVALS = {
+    AggregationBucket.ONE_MINUTE: timedelta(minutes=1),
+    AggregationBucket.FIVE_MINUTES: timedelta(minutes=5),
+    AggregationBucket.ONE_HOUR: timedelta(hours=1),
+}
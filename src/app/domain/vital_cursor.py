@@ -0,0 +1,50 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from app.domain.exceptions import InvalidCursorError
+
+
+@dataclass(frozen=True)
+class VitalCursor:
+    """Keyset position in a vital time series, ordered by (recorded_at, id)."""
+
+    recorded_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.recorded_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            recorded_at, id_ = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+            return cls(recorded_at=datetime.fromisoformat(recorded_at), id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(f"Invalid cursor: {token}") from None
+
+
+@dataclass(frozen=True)
+class PatientVitalCursor:
+    """Keyset position across the vital series of several patients, ordered by (patient_id, recorded_at, id)."""
+
+    patient_id: str
+    recorded_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.patient_id}|{self.recorded_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            # patient_id is free text, so split from the right
+            patient_id, recorded_at, id_ = base64.urlsafe_b64decode(token.encode()).decode().rsplit("|", 2)
+            return cls(patient_id=patient_id, recorded_at=datetime.fromisoformat(recorded_at), id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(f"Invalid cursor: {token}") from None
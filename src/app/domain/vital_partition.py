@@ -0,0 +1,44 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+
+class PartitionInterval(StrEnum):
+    """Width of the recorded_at ranges the vitals table is partitioned into (boundaries in UTC)."""
+
+    DAY = "day"
+    MONTH = "month"
+
+    def floor(self, moment: datetime) -> datetime:
+        """Start of the period containing moment."""
+        moment = moment.astimezone(UTC)
+        start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        return start.replace(day=1) if self is PartitionInterval.MONTH else start
+
+    def next(self, start: datetime) -> datetime:
+        """Start of the period after the one beginning at start."""
+        if self is PartitionInterval.DAY:
+            return start + timedelta(days=1)
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+    def periods(self, start: datetime, end: datetime) -> Iterator[tuple[datetime, datetime]]:
+        """(start, end) of every period overlapping [start, end)."""
+        period_start = self.floor(start)
+        while period_start < end:
+            period_end = self.next(period_start)
+            yield period_start, period_end
+            period_start = period_end
+
+    def suffix(self, start: datetime) -> str:
+        return start.strftime("%Y%m%d" if self is PartitionInterval.DAY else "%Y%m")
+
+
+@dataclass(frozen=True)
+class VitalPartition:
+    name: str
+    start: datetime
+    end: datetime
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        return self.start < end and start < self.end
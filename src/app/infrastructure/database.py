@@ -1,15 +1,68 @@
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import Settings, get_settings
+from app.infrastructure.db_pool import InstrumentedNullPool, InstrumentedQueuePool, pool_status
+from app.infrastructure.read_routing import pinned_to_primary
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """create_async_engine keyword arguments for the pool and statement-cache settings."""
+    if settings.DB_PGBOUNCER:
+        # In transaction pooling mode consecutive transactions may run on different server connections, so
+        # prepared statements are neither cached nor given asyncpg's sequential names (which would collide).
+        # Pooling is left to pgbouncer; holding connections here would only pin prepared statements on them.
+        return {
+            "poolclass": InstrumentedNullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
+def build_engine(url: str, settings: Settings) -> AsyncEngine:
+    return create_async_engine(url, echo=False, **engine_options(settings))
 
-from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+engine = build_engine(settings.DATABASE_URL, settings)
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
+# Without a replica, reads share the primary engine and its pool.
+read_engine = build_engine(settings.READ_DATABASE_URL, settings) if settings.READ_DATABASE_URL else engine
+read_session_factory = async_sessionmaker(read_engine, expire_on_commit=False)
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession]:
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Session for read-only routes: the replica, unless the client wrote recently (see PrimaryPinMiddleware)."""
+    factory = async_session_factory if pinned_to_primary(request) else read_session_factory
+    async with factory() as session:
+        yield session
+
+
+def engine_pool_status() -> dict[str, Any]:
+    return pool_status(engine.pool)
@@ -0,0 +1,85 @@
+import bisect
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool, Pool
+
+
+class PoolWaitStats:
+    """How long requests waited to check a connection out of the pool (including connecting, when needed).
+
+    Pool exhaustion otherwise only shows up as request latency.
+    """
+
+    # Upper bounds (seconds) of the wait histogram buckets; the last bucket catches everything slower.
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.histogram = [0] * (len(self.BUCKETS) + 1)
+
+    def timed(self, checkout: Callable[[], ConnectionPoolEntry]) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return checkout()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.record(time.perf_counter() - started)
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.histogram[bisect.bisect_left(self.BUCKETS, wait)] += 1
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """The default asyncio pool, recording checkout waits in wait_stats."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        return self.wait_stats.timed(super()._do_get)
+
+
+class InstrumentedNullPool(NullPool):
+    """No pooling (an external pooler such as pgbouncer does it); the recorded wait is the time to connect."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        return self.wait_stats.timed(super()._do_get)
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    """Occupancy of the pool plus its checkout wait statistics."""
+    stats: PoolWaitStats = getattr(pool, "wait_stats", None) or PoolWaitStats()
+    status: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "size": None,
+        "checked_out": None,
+        "overflow": None,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_seconds_total": stats.total_wait,
+        "wait_seconds_max": stats.max_wait,
+        "wait_seconds_avg": stats.total_wait / stats.checkouts if stats.checkouts else 0.0,
+        "wait_histogram": {
+            **{f"le_{bound:g}": count for bound, count in zip(stats.BUCKETS, stats.histogram, strict=False)},
+            "le_inf": stats.histogram[-1],
+        },
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+    return status
@@ -1,5 +1,6 @@
 from app.infrastructure.models.base import Base, TimestampMixin
 from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.patient_risk_model import PatientRiskModel
 from app.infrastructure.models.vital_model import VitalModel
 
-__all__ = ["Base", "TimestampMixin", "PatientModel", "VitalModel"]
+__all__ = ["Base", "TimestampMixin", "PatientModel", "PatientRiskModel", "VitalModel"]
@@ -5,7 +5,9 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated columns (timestamps, defaults) with RETURNING during the flush itself,
+    # instead of expiring them and paying a SELECT (refresh) to read them back.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimestampMixin:
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Float, ForeignKey, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.models.base import Base, TimestampMixin
+
+
+class PatientRiskModel(Base, TimestampMixin):
+    """Current risk of a patient, kept up to date as vitals are written."""
+
+    __tablename__ = "patient_risks"
+
+    patient_id: Mapped[str] = mapped_column(
+        String(20),
+        ForeignKey("patients.patient_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # {vital_type: {"vital_id": str, "recorded_at": ISO 8601 str, "value": float}} for the latest vital of each type
+    latest_vitals: Mapped[dict[str, Any]] = mapped_column(JSONB, server_default=text("'{}'"), nullable=False)
+    risk_score: Mapped[float] = mapped_column(Float, nullable=False)
+    risk_level: Mapped[str] = mapped_column(String(10), nullable=False)
+    checked_rules: Mapped[list[str]] = mapped_column(JSONB, server_default=text("'[]'"), nullable=False)
+    evaluated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Version of the rule set risk_score/checked_rules were computed with; rows of older versions are rebuilt.
+    rules_version: Mapped[str] = mapped_column(String(100), server_default=text("''"), nullable=False)
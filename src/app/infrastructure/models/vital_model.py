@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Numeric, String, Uuid, text
+from sqlalchemy import DDL, CheckConstraint, DateTime, ForeignKey, Index, Numeric, String, Uuid, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.domain.vital_type import VitalType
@@ -10,7 +10,10 @@ from app.infrastructure.models.base import Base, TimestampMixin
 
 
 class VitalModel(Base, TimestampMixin):
+    """Range-partitioned on recorded_at (see VitalPartitionRepository), so recorded_at is part of the key."""
+
     __tablename__ = "vitals"
+    DEFAULT_PARTITION = "vitals_default"
 
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
@@ -23,7 +26,7 @@ class VitalModel(Base, TimestampMixin):
         ForeignKey("patients.patient_id", ondelete="CASCADE"),
         nullable=False,
     )
-    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     vital_type: Mapped[str] = mapped_column(String(10), nullable=False)
     value: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     version: Mapped[int] = mapped_column(default=1, server_default=text("1"), nullable=False)
@@ -36,4 +39,21 @@ class VitalModel(Base, TimestampMixin):
         ),
         Index("ix_vitals_patient_id", "patient_id"),
         Index("ix_vitals_recorded_at", "recorded_at"),
+        Index(
+            "ix_vitals_patient_type_recorded_at_id",
+            "patient_id",
+            "vital_type",
+            "recorded_at",
+            "id",
+            postgresql_include=["value"],
+        ),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
     )
+
+
+# Catches rows outside every range partition, so a missing partition never fails an insert.
+event.listen(
+    VitalModel.__table__,
+    "after_create",
+    DDL(f"CREATE TABLE {VitalModel.DEFAULT_PARTITION} PARTITION OF {VitalModel.__tablename__} DEFAULT"),
+)
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+from app.infrastructure.repositories.patient_repository import PatientRepository
+
+
+class PatientExistenceCache:
+    """Process-local LRU set of patient_ids known to exist, so vital writes can skip the existence SELECT.
+
+    Only positive answers are cached: patients are never deleted through the API, and an entry that
+    went stale anyway (a row removed by hand, a patient insert that was rolled back) is caught by the
+    vitals foreign key, whose violation discards it. max_size 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self.max_size = max_size
+
+    def configure(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._ids.clear()
+
+    def __contains__(self, patient_id: str) -> bool:
+        if patient_id not in self._ids:
+            return False
+        self._ids.move_to_end(patient_id)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, patient_id: str) -> None:
+        if self.max_size <= 0:
+            return
+        self._ids[patient_id] = None
+        self._ids.move_to_end(patient_id)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    def discard(self, patient_id: str) -> None:
+        self._ids.pop(patient_id, None)
+
+    async def warm(self, repository: PatientRepository) -> int:
+        """Load the most recently registered patients (up to max_size); returns how many were loaded."""
+        if self.max_size <= 0:
+            return 0
+        patient_ids = await repository.find_recent_patient_ids(self.max_size)
+        for patient_id in reversed(patient_ids):  # Oldest first, so the newest end up most recently used
+            self.add(patient_id)
+        return len(patient_ids)
+
+
+patient_existence_cache = PatientExistenceCache()
@@ -0,0 +1,49 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Holds the time (epoch seconds) until which the client's reads go to the primary.
+PRIMARY_PIN_COOKIE = "db_primary_until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def pinned_to_primary(request: Request) -> bool:
+    until = request.cookies.get(PRIMARY_PIN_COOKIE)
+    if until is None:
+        return False
+    try:
+        return float(until) > time.time()
+    except ValueError:
+        return False
+
+
+class PrimaryPinMiddleware:
+    """Sets PRIMARY_PIN_COOKIE on successful writes, so the writer reads its own writes.
+
+    The replica may lag behind the primary; for pin_seconds after a write, get_read_db_session sends the
+    same client's reads to the primary. Other clients keep reading from the replica (bounded staleness).
+    """
+
+    def __init__(self, app: ASGIApp, pin_seconds: float):
+        self.app = app
+        self.pin_seconds = pin_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.pin_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_PIN_COOKIE}={until:.3f}; Max-Age={math.ceil(self.pin_seconds)}; Path=/; HttpOnly",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -1,4 +1,5 @@
 from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.infrastructure.repositories.patient_risk_repository import PatientRiskRepository
 from app.infrastructure.repositories.vital_repository import VitalRepository
 
-__all__ = ["PatientRepository", "VitalRepository"]
+__all__ = ["PatientRepository", "PatientRiskRepository", "VitalRepository"]
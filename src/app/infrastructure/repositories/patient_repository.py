@@ -1,7 +1,12 @@
-from sqlalchemy import select, update
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import select, true, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.domain.exceptions import OptimisticLockError
+from app.domain.exceptions import OptimisticLockError, PatientNotFoundError
 from app.infrastructure.models.patient_model import PatientModel
 
 
@@ -20,13 +25,37 @@ class PatientRepository:
         return result.scalar_one_or_none()
 
     async def exists(self, patient_id: str) -> bool:
-        patient = await self.find_by_patient_id(patient_id)
-        return patient is not None
+        stmt = select(PatientModel.patient_id).where(PatientModel.patient_id == patient_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def find_recent_patient_ids(self, limit: int) -> list[str]:
+        """patient_ids of the most recently registered patients, newest first."""
+        stmt = select(PatientModel.patient_id).order_by(PatientModel.created_at.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_existing_patient_ids(self, patient_ids: Collection[str]) -> set[str]:
+        if not patient_ids:
+            return set()
+        stmt = select(PatientModel.patient_id).where(PatientModel.patient_id.in_(patient_ids))
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def insert_if_absent(self, **values: Any) -> PatientModel | None:
+        """INSERT ... ON CONFLICT (patient_id) DO NOTHING RETURNING; None when the patient_id is already taken."""
+        stmt = (
+            insert(PatientModel)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[PatientModel.patient_id])
+            .returning(PatientModel)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def save(self, patient: PatientModel) -> PatientModel:
         self.session.add(patient)
-        await self.session.flush()
-        await self.session.refresh(patient)
+        await self.session.flush()  # Server defaults come back through INSERT ... RETURNING (eager_defaults)
         return patient
 
     async def update_with_version(
@@ -35,20 +64,34 @@ class PatientRepository:
         expected_version: int,
         **values,
     ) -> PatientModel:
-        stmt = (
+        """Optimistic-lock UPDATE ... RETURNING in one statement.
+
+        The current version is read alongside the update (a CTE sees the row as it was before), so a
+        missing patient and a version mismatch are told apart without another round-trip.
+        """
+        updated = (
             update(PatientModel)
             .where(
                 PatientModel.patient_id == patient_id,
                 PatientModel.version == expected_version,
             )
             .values(**values, version=PatientModel.version + 1)
-            .returning(PatientModel)
+            .returning(*PatientModel.__table__.columns)
+            .cte("updated")
         )
-        result = await self.session.execute(stmt)
-        updated = result.scalar_one_or_none()
-        if updated is None:
-            raise OptimisticLockError(f"Version mismatch for patient {patient_id}")
-        return updated
+        current = select(PatientModel.version).where(PatientModel.patient_id == patient_id).cte("current")
+        stmt = (
+            select(current.c.version, aliased(PatientModel, updated))
+            .select_from(current.outerjoin(updated, true()))
+            .execution_options(populate_existing=True)
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            raise PatientNotFoundError(f"Patient {patient_id} not found")
+        current_version, patient = row
+        if patient is None:
+            raise OptimisticLockError(f"Version mismatch: expected {expected_version}, current {current_version}")
+        return patient
 
     # async def delete(self, patient_id: str) -> bool:
     #     patient = await self.find_by_patient_id(patient_id)
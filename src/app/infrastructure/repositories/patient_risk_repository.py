@@ -0,0 +1,69 @@
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Boolean, String, any_, bindparam, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.models.patient_risk_model import PatientRiskModel
+
+
+class PatientRiskRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_by_patient_id(self, patient_id: str) -> PatientRiskModel | None:
+        return await self.session.get(PatientRiskModel, patient_id)
+
+    async def find_latest_vitals(self, patient_ids: Collection[str]) -> dict[str, dict[str, Any]]:
+        """latest_vitals of each patient that has a row, by primary key with patient_id = ANY(:patient_ids)."""
+        if not patient_ids:
+            return {}
+        # One array parameter keeps the statement (and its prepared plan) the same for any number of patients.
+        ids = bindparam("patient_ids", list(patient_ids), type_=ARRAY(String))
+        stmt = select(PatientRiskModel.patient_id, PatientRiskModel.latest_vitals).where(
+            PatientRiskModel.patient_id == any_(ids)
+        )
+        result = await self.session.execute(stmt)
+        return {patient_id: latest for patient_id, latest in result.all()}
+
+    async def lock(
+        self,
+        patient_ids: Collection[str],
+        risk_score: float,
+        risk_level: str,
+        evaluated_at: datetime,
+    ) -> dict[str, tuple[PatientRiskModel, bool]]:
+        """Return each patient's row locked, inserting empty ones where missing, in one statement.
+
+        INSERT ... ON CONFLICT DO UPDATE locks an existing row as SELECT FOR UPDATE would, and RETURNING
+        hands back inserted and existing rows alike. The flag is True when the row was just created (and
+        still has to be filled in). Rows are taken in patient_id order, so concurrent multi-patient
+        writers cannot deadlock.
+        """
+        if not patient_ids:
+            return {}
+        stmt = insert(PatientRiskModel).values(
+            [
+                {
+                    "patient_id": patient_id,
+                    "risk_score": risk_score,
+                    "risk_level": risk_level,
+                    "evaluated_at": evaluated_at,
+                }
+                for patient_id in sorted(set(patient_ids))
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PatientRiskModel.patient_id],
+            set_={"patient_id": stmt.excluded.patient_id},  # A no-op update, for the row lock and RETURNING
+        ).returning(PatientRiskModel, literal_column("xmax = 0", Boolean))  # xmax is 0 on freshly inserted rows
+        result = await self.session.execute(stmt, execution_options={"populate_existing": True})
+        return {risk.patient_id: (risk, created) for risk, created in result.all()}
+
+    async def save(self, risk: PatientRiskModel, **values: Any) -> PatientRiskModel:
+        for key, value in values.items():
+            setattr(risk, key, value)
+        await self.session.flush()
+        return risk
@@ -0,0 +1,104 @@
+import re
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.vital_partition import VitalPartition
+from app.infrastructure.models.vital_model import VitalModel
+
+
+class VitalPartitionRepository:
+    """DDL for the recorded_at range partitions of vitals.
+
+    Partition names and bounds are generated here (never taken from user input), which is why they can be
+    formatted into the statements: DDL does not accept bind parameters.
+    """
+
+    TABLE = VitalModel.__tablename__
+    DEFAULT_PARTITION = VitalModel.DEFAULT_PARTITION
+    # Serializes maintenance runs (e.g. one per API container at startup).
+    ADVISORY_LOCK_KEY = 0x7669_7461  # "vita"
+    _BOUND = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def lock(self) -> None:
+        """Hold the maintenance lock until the transaction ends."""
+        await self.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+
+    async def find_all(self) -> list[VitalPartition]:
+        """Range partitions of vitals ordered by start; the default partition is not included."""
+        result = await self.session.execute(
+            text(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": self.TABLE},
+        )
+        partitions = []
+        for name, bound in result.all():
+            match = self._BOUND.search(bound)
+            if match is None:  # FOR VALUES DEFAULT
+                continue
+            start, end = (datetime.fromisoformat(value) for value in match.groups())
+            partitions.append(VitalPartition(name, start, end))
+        return sorted(partitions, key=lambda partition: partition.start)
+
+    async def default_range(self) -> tuple[datetime, datetime] | None:
+        """Earliest and latest recorded_at in the default partition, or None when it is empty."""
+        result = await self.session.execute(
+            text(f"SELECT min(recorded_at), max(recorded_at) FROM {self.DEFAULT_PARTITION}")
+        )
+        earliest, latest = result.one()
+        return None if earliest is None else (earliest, latest)
+
+    async def create(self, partition: VitalPartition) -> int:
+        """Create a partition, moving rows in its range out of the default partition; returns the rows moved.
+
+        The table is filled before it is attached, because attaching a range that the default partition
+        still holds rows for is rejected.
+        """
+        bounds = f"FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+        await self.session.execute(
+            text(f"CREATE TABLE {partition.name} (LIKE {self.TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        )
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {self.DEFAULT_PARTITION} "
+                    "WHERE recorded_at >= :start AND recorded_at < :end RETURNING *) "
+                    f"INSERT INTO {partition.name} SELECT * FROM moved"
+                ),
+                {"start": partition.start, "end": partition.end},
+            ),
+        )
+        await self.session.execute(
+            text(f"ALTER TABLE {self.TABLE} ATTACH PARTITION {partition.name} FOR VALUES {bounds}")
+        )
+        return result.rowcount
+
+    async def drop(self, partition: VitalPartition) -> None:
+        await self.session.execute(text(f"DROP TABLE {partition.name}"))
+
+    async def drop_if_empty(self, partition: VitalPartition) -> bool:
+        """Drop a partition that holds no rows; the lock keeps a concurrent insert from slipping in first."""
+        await self.session.execute(text(f"LOCK TABLE {partition.name} IN ACCESS EXCLUSIVE MODE"))
+        if await self.session.scalar(text(f"SELECT EXISTS (SELECT FROM {partition.name})")):
+            return False
+        await self.drop(partition)
+        return True
+
+    async def delete_default_before(self, cutoff: datetime) -> int:
+        """Delete rows older than cutoff that were left in the default partition; returns how many."""
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                text(f"DELETE FROM {self.DEFAULT_PARTITION} WHERE recorded_at < :cutoff"), {"cutoff": cutoff}
+            ),
+        )
+        return result.rowcount
@@ -1,17 +1,68 @@
-from datetime import datetime
-from uuid import UUID
+from collections.abc import AsyncIterator, Callable, Collection, Sequence
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    Float,
+    Interval,
+    Row,
+    Select,
+    String,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.exceptions import OptimisticLockError
+from app.domain.exceptions import ArchivedWindowError, OptimisticLockError, PatientNotFoundError
+from app.domain.vital_aggregation import AggregationFunction
+from app.domain.vital_cursor import PatientVitalCursor, VitalCursor
 from app.domain.vital_type import VitalType
 from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.vital_archive import ArchivedVital, VitalArchive, vital_archive
+
+
+class ArchivedValue(NamedTuple):
+    """An archived vital shaped like the (recorded_at, value, id) rows of find_values_by_time_range."""
+
+    recorded_at: datetime
+    value: Decimal
+    id: UUID
+
+
+class ArchivedPatientValue(NamedTuple):
+    """An archived vital shaped like the rows of find_values_for_patients."""
+
+    patient_id: str
+    recorded_at: datetime
+    vital_type: str
+    value: Decimal
+    id: UUID
 
 
 class VitalRepository:
-    def __init__(self, session: AsyncSession):
+    MAX_PAGE_SIZE = 1000
+    MAX_MULTI_PATIENT_PAGE_SIZE = 10000
+    STREAM_BATCH_SIZE = 1000
+    BUCKET_ORIGIN = datetime(2000, 1, 1, tzinfo=UTC)
+    COPY_COLUMNS = ("patient_id", "recorded_at", "vital_type", "value")
+    FOREIGN_KEY_VIOLATION = "23503"  # SQLSTATE
+
+    def __init__(self, session: AsyncSession, archive: VitalArchive = vital_archive):
         self.session = session
+        self.archive = archive
 
     async def find_by_id(self, id: UUID) -> VitalModel | None:
         stmt = select(VitalModel).where(VitalModel.id == id)
@@ -29,24 +80,381 @@ class VitalRepository:
         start_time: datetime,
         end_time: datetime,
         vital_type: VitalType | None = None,
+        limit: int | None = None,
+        after: VitalCursor | None = None,
     ) -> list[VitalModel]:
-        stmt = select(VitalModel).where(
+        """Vitals in the window, merging the archived (cold) ones with the table (hot) when the window reaches back."""
+        stmt = self._filter_time_range(select(VitalModel), patient_id, start_time, end_time, vital_type)
+        stmt = self._paginate(stmt, limit, after)
+        result = await self.session.execute(stmt)
+        vitals = list(result.scalars().all())
+        archived = self.archive.read(
+            patient_id, start_time, end_time, [vital_type] if vital_type else None, after, self._page_size(limit)
+        )
+        if not archived:
+            return vitals
+        cold = [VitalModel(**vital._asdict()) for vital in archived]  # Transient: never added to the session
+        return self._merge_archived(vitals, cold, self._page_size(limit))
+
+    async def find_values_by_time_range(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType | None = None,
+        limit: int | None = None,
+        after: VitalCursor | None = None,
+    ) -> list[Row[tuple[datetime, Decimal, UUID]] | ArchivedValue]:
+        stmt = self.time_range_values_query(patient_id, start_time, end_time, vital_type, limit, after)
+        result = await self.session.execute(stmt)
+        rows: list[Row[tuple[datetime, Decimal, UUID]] | ArchivedValue] = list(result.all())
+        archived = self.archive.read(
+            patient_id, start_time, end_time, [vital_type] if vital_type else None, after, self._page_size(limit)
+        )
+        if not archived:
+            return rows
+        cold = [ArchivedValue(vital.recorded_at, vital.value, vital.id) for vital in archived]
+        return self._merge_archived(rows, cold, self._page_size(limit))
+
+    async def find_values_for_patients(
+        self,
+        patient_ids: Collection[str],
+        start_time: datetime,
+        end_time: datetime,
+        vital_types: Collection[VitalType] | None = None,
+        limit: int | None = None,
+        after: PatientVitalCursor | None = None,
+    ) -> list[Row[tuple[str, datetime, str, Decimal, UUID]] | ArchivedPatientValue]:
+        """(patient_id, recorded_at, vital_type, value, id) of several patients' vitals in the window.
+
+        One query with patient_id = ANY(:patient_ids), ordered by (patient_id, recorded_at, id) and paged
+        by keyset; page size is capped at MAX_MULTI_PATIENT_PAGE_SIZE.
+        """
+        if not patient_ids:
+            return []
+        page_size = self._page_size(limit, self.MAX_MULTI_PATIENT_PAGE_SIZE)
+        types = [vital_type.value for vital_type in vital_types] if vital_types else None
+        # Byte order ("C") on patient_id, so merging archived rows and comparing cursors in Python agree with SQL.
+        patient_key = VitalModel.patient_id.collate("C")
+        # Array parameters keep the statement text (and its prepared plan) independent of the list lengths.
+        stmt = (
+            select(
+                VitalModel.patient_id, VitalModel.recorded_at, VitalModel.vital_type, VitalModel.value, VitalModel.id
+            )
+            .where(
+                VitalModel.patient_id == any_(bindparam("patient_ids", list(patient_ids), type_=ARRAY(String))),
+                VitalModel.recorded_at >= start_time,
+                VitalModel.recorded_at <= end_time,
+            )
+            .order_by(patient_key, VitalModel.recorded_at, VitalModel.id)
+            .limit(page_size)
+        )
+        if types is not None:
+            stmt = stmt.where(VitalModel.vital_type == any_(bindparam("vital_types", types, type_=ARRAY(String))))
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(patient_key, VitalModel.recorded_at, VitalModel.id)
+                > (after.patient_id, after.recorded_at, after.id)
+            )
+        result = await self.session.execute(stmt)
+        rows: list[Row[tuple[str, datetime, str, Decimal, UUID]] | ArchivedPatientValue] = list(result.all())
+
+        # Patients in page order; archived rows are read only up to one page in total.
+        cold: list[Row[tuple[str, datetime, str, Decimal, UUID]] | ArchivedPatientValue] = []
+        for patient_id in sorted(set(patient_ids)):
+            if len(cold) >= page_size:
+                break
+            if after is not None and patient_id < after.patient_id:
+                continue
+            resume = (
+                VitalCursor(after.recorded_at, after.id)
+                if after is not None and patient_id == after.patient_id
+                else None
+            )
+            archived = self.archive.read(patient_id, start_time, end_time, vital_types, resume, page_size - len(cold))
+            cold.extend(
+                ArchivedPatientValue(patient_id, vital.recorded_at, vital.vital_type, vital.value, vital.id)
+                for vital in archived
+            )
+        if not cold:
+            return rows
+        return self._merge_archived(rows, cold, page_size, key=attrgetter("patient_id", "recorded_at", "id"))
+
+    def require_hot(self, start_time: datetime) -> None:
+        """Reject a window that reaches archived vitals, for queries that only read the hot table."""
+        if self.archive.may_contain(start_time):
+            cutoff = self.archive.cutoff(datetime.now(UTC))
+            raise ArchivedWindowError(
+                f"Vitals before {cutoff.isoformat()} are archived; start the window at or after it, "
+                "or page through them with GET /api/v1/vitals/patient/{patient_id}"
+            )
+
+    async def stream_values_by_time_range(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType | None = None,
+    ) -> AsyncIterator[Sequence[Row[tuple[datetime, Decimal, UUID]]]]:
+        """Yield the whole window in batches of STREAM_BATCH_SIZE rows through a server-side cursor."""
+        stmt = self._filter_time_range(
+            select(VitalModel.recorded_at, VitalModel.value, VitalModel.id),
+            patient_id,
+            start_time,
+            end_time,
+            vital_type,
+        )
+        result = await self.session.stream(stmt.execution_options(yield_per=self.STREAM_BATCH_SIZE))
+        async for partition in result.partitions():
+            yield partition
+
+    async def find_readings_by_time_range(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int | None = None,
+    ) -> list[Row[tuple[datetime, str, float]]]:
+        """Return (recorded_at, vital_type, value) for every vital type in the window, ordered by recorded_at.
+
+        At most limit rows (the earliest) when given.
+        """
+        stmt = (
+            select(VitalModel.recorded_at, VitalModel.vital_type, cast(VitalModel.value, Float))
+            .where(
+                VitalModel.patient_id == patient_id,
+                VitalModel.recorded_at >= start_time,
+                VitalModel.recorded_at <= end_time,
+            )
+            .order_by(VitalModel.recorded_at, VitalModel.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def find_latest_per_type(
+        self,
+        patient_id: str,
+        vital_types: Collection[str] | None = None,
+    ) -> list[Row[tuple[str, datetime, Decimal, UUID]]]:
+        """Return (vital_type, recorded_at, value, id) of the newest vital of each type, via DISTINCT ON."""
+        stmt = (
+            select(VitalModel.vital_type, VitalModel.recorded_at, VitalModel.value, VitalModel.id)
+            .distinct(VitalModel.vital_type)
+            .where(VitalModel.patient_id == patient_id)
+            .order_by(VitalModel.vital_type, VitalModel.recorded_at.desc(), VitalModel.id.desc())
+        )
+        if vital_types is not None:
+            stmt = stmt.where(VitalModel.vital_type.in_(vital_types))
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def find_latest_per_type_for_patients(
+        self,
+        patient_ids: Collection[str],
+    ) -> list[Row[tuple[str, str, datetime, Decimal, UUID]]]:
+        """Return (patient_id, vital_type, recorded_at, value, id) of each patient's newest vital of each type.
+
+        One DISTINCT ON (patient_id, vital_type) query with patient_id = ANY(:patient_ids).
+        """
+        if not patient_ids:
+            return []
+        stmt = (
+            select(
+                VitalModel.patient_id, VitalModel.vital_type, VitalModel.recorded_at, VitalModel.value, VitalModel.id
+            )
+            .distinct(VitalModel.patient_id, VitalModel.vital_type)
+            .where(VitalModel.patient_id == any_(bindparam("patient_ids", list(patient_ids), type_=ARRAY(String))))
+            .order_by(VitalModel.patient_id, VitalModel.vital_type, VitalModel.recorded_at.desc(), VitalModel.id.desc())
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def count_by_time_range(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType | None = None,
+    ) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(VitalModel)
+            .where(
+                VitalModel.patient_id == patient_id,
+                VitalModel.recorded_at >= start_time,
+                VitalModel.recorded_at <= end_time,
+            )
+        )
+        if vital_type is not None:
+            stmt = stmt.where(VitalModel.vital_type == vital_type.value)
+        return await self.session.scalar(stmt) or 0
+
+    async def aggregate_by_time_range(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType,
+        bucket: timedelta,
+        agg: AggregationFunction,
+    ) -> list[Row[tuple[datetime, float]]]:
+        """Aggregate values into fixed-width buckets (date_bin aligned to BUCKET_ORIGIN), one row per bucket."""
+        bucket_start = func.date_bin(literal(bucket, Interval()), VitalModel.recorded_at, self.BUCKET_ORIGIN)
+        aggregates = {
+            AggregationFunction.AVG: func.avg(VitalModel.value),
+            AggregationFunction.MIN: func.min(VitalModel.value),
+            AggregationFunction.MAX: func.max(VitalModel.value),
+            AggregationFunction.LAST: func.array_agg(
+                aggregate_order_by(VitalModel.value, VitalModel.recorded_at.desc(), VitalModel.id.desc())
+            )[1],
+            AggregationFunction.COUNT: func.count(),
+        }
+        stmt = (
+            select(bucket_start.label("bucket_start"), cast(aggregates[agg], Float).label("value"))
+            .where(
+                VitalModel.patient_id == patient_id,
+                VitalModel.vital_type == vital_type.value,
+                VitalModel.recorded_at >= start_time,
+                VitalModel.recorded_at <= end_time,
+            )
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    def time_range_values_query(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType | None = None,
+        limit: int | None = None,
+        after: VitalCursor | None = None,
+    ) -> Select[tuple[datetime, Decimal, UUID]]:
+        """Select only (recorded_at, value, id) so ix_vitals_patient_type_recorded_at_id can answer it index-only."""
+        stmt = select(VitalModel.recorded_at, VitalModel.value, VitalModel.id)
+        stmt = self._filter_time_range(stmt, patient_id, start_time, end_time, vital_type)
+        return self._paginate(stmt, limit, after)
+
+    @staticmethod
+    def _filter_time_range[T: tuple[Any, ...]](
+        stmt: Select[T],
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_type: VitalType | None,
+    ) -> Select[T]:
+        stmt = stmt.where(
             VitalModel.patient_id == patient_id,
             VitalModel.recorded_at >= start_time,
             VitalModel.recorded_at <= end_time,
         )
         if vital_type is not None:
             stmt = stmt.where(VitalModel.vital_type == vital_type.value)
-        stmt = stmt.order_by(VitalModel.recorded_at)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.order_by(VitalModel.recorded_at, VitalModel.id)
+
+    @staticmethod
+    def _merge_archived[T: Any](
+        hot: list[T],
+        cold: list[T],
+        page_size: int,
+        key: Callable[[Any], tuple[Any, ...]] = attrgetter("recorded_at", "id"),
+    ) -> list[T]:
+        """Merge one page of hot rows with the archived rows past the same cursor, in key order.
+
+        The hot copy wins if a row is in both (an archive run whose delete did not commit).
+        """
+        hot_ids = {row.id for row in hot}
+        merged = sorted([*hot, *(row for row in cold if row.id not in hot_ids)], key=key)
+        return merged[:page_size]
+
+    @classmethod
+    def _page_size(cls, limit: int | None, maximum: int | None = None) -> int:
+        maximum = maximum or cls.MAX_PAGE_SIZE
+        return min(limit, maximum) if limit else maximum
+
+    @classmethod
+    def _paginate[T: tuple[Any, ...]](cls, stmt: Select[T], limit: int | None, after: VitalCursor | None) -> Select[T]:
+        """Apply keyset paging; page size is capped at MAX_PAGE_SIZE."""
+        if after is not None:
+            stmt = stmt.where(tuple_(VitalModel.recorded_at, VitalModel.id) > (after.recorded_at, after.id))
+        return stmt.limit(cls._page_size(limit))
 
     async def save(self, vital: VitalModel) -> VitalModel:
+        """Insert a vital; an unknown patient_id is reported by the foreign key as PatientNotFoundError."""
         self.session.add(vital)
-        await self.session.flush()
-        await self.session.refresh(vital)
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) != self.FOREIGN_KEY_VIOLATION:
+                raise
+            raise PatientNotFoundError(f"Patient {vital.patient_id} not found") from e
         return vital
 
+    async def save_many(self, values: list[dict[str, Any]]) -> list[VitalModel]:
+        """Insert many vitals with a single multi-row INSERT ... RETURNING.
+
+        Ids are assigned up front so the returned rows can be put back in input order
+        without forcing SQLAlchemy into its row-by-row "ordered" insert mode.
+        """
+        if not values:
+            return []
+        rows = [{**row, "id": row.get("id") or uuid4()} for row in values]
+        stmt = insert(VitalModel).returning(VitalModel)
+        result = await self.session.scalars(stmt, rows)
+        saved = {vital.id: vital for vital in result.all()}
+        return [saved[row["id"]] for row in rows]
+
+    async def copy_records(self, records: Sequence[tuple[str, datetime, str, Decimal]]) -> int:
+        """Stream rows into vitals with PostgreSQL COPY inside the session's transaction.
+
+        Records must follow COPY_COLUMNS; id, version and timestamps come from server defaults.
+        """
+        if not records:
+            return 0
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # ty: ignore[possibly-missing-attribute]
+            VitalModel.__tablename__,
+            records=records,
+            columns=self.COPY_COLUMNS,
+        )
+        return len(records)
+
+    async def find_earliest_recorded_at(self) -> datetime | None:
+        return await self.session.scalar(select(func.min(VitalModel.recorded_at)))
+
+    async def find_patient_ids_recorded_between(self, start_time: datetime, end_time: datetime) -> list[str]:
+        """Patients with vitals in [start_time, end_time)."""
+        stmt = (
+            select(VitalModel.patient_id)
+            .distinct()
+            .where(VitalModel.recorded_at >= start_time, VitalModel.recorded_at < end_time)
+            .order_by(VitalModel.patient_id)
+        )
+        return list((await self.session.scalars(stmt)).all())
+
+    async def delete_recorded_between(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        patient_ids: Collection[str],
+    ) -> list[ArchivedVital]:
+        """Delete the patients' vitals in [start_time, end_time) and return them, for archiving."""
+        stmt = (
+            delete(VitalModel)
+            .where(
+                VitalModel.recorded_at >= start_time,
+                VitalModel.recorded_at < end_time,
+                VitalModel.patient_id.in_(patient_ids),
+            )
+            .returning(*(getattr(VitalModel, field) for field in ArchivedVital._fields))
+        )
+        result = await self.session.execute(stmt)
+        return [ArchivedVital(*row) for row in result.all()]
+
     async def update_with_version(
         self,
         vital_id: UUID,
@@ -0,0 +1,188 @@
+import os
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Sequence
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import quote
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.domain.vital_cursor import VitalCursor
+from app.domain.vital_type import VitalType
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Naive query bounds are UTC, as asyncpg sends them to timestamptz columns."""
+    return moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment
+
+
+class ArchivedVital(NamedTuple):
+    id: UUID
+    patient_id: str
+    recorded_at: datetime
+    vital_type: str
+    value: Decimal
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class VitalArchive:
+    """Cold tier for vitals: zstd-compressed Parquet segments on local disk, one per patient and UTC day.
+
+    Segments live at <root>/<patient_id>/<YYYY-MM-DD>.parquet and are read memory-mapped. Archived vitals
+    are read-only; the hot vitals table keeps only the last `archive_after` (rounded down to a UTC day
+    boundary). root None disables the archive.
+    """
+
+    SCHEMA = pa.schema(
+        [
+            ("id", pa.binary(16)),
+            ("recorded_at", pa.timestamp("us", tz="UTC")),
+            ("vital_type", pa.string()),  # Parquet dictionary-encodes it
+            ("value", pa.decimal128(10, 2)),
+            ("version", pa.int32()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("updated_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    COMPRESSION = "zstd"
+
+    def __init__(self, root: Path | None = None, archive_after: timedelta = timedelta(hours=72)):
+        self.configure(root, archive_after)
+
+    def configure(self, root: Path | None, archive_after: timedelta) -> None:
+        self.root = root
+        self.archive_after = archive_after
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def cutoff(self, now: datetime) -> datetime:
+        """Vitals recorded before this are due for archiving; whole days only, so a segment is written once."""
+        moment = (now - self.archive_after).astimezone(UTC)
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def may_contain(self, start_time: datetime) -> bool:
+        """Whether a window starting at start_time can reach archived vitals (cutoffs only move forward)."""
+        return self.enabled and _as_utc(start_time) < self.cutoff(datetime.now(UTC))
+
+    def patient_dir(self, patient_id: str) -> Path:
+        if self.root is None:
+            raise RuntimeError("Vital archive is not configured")
+        # patient_id is free text; quoting keeps it a single, safe path component.
+        return self.root / quote(patient_id, safe="")
+
+    def segment_path(self, patient_id: str, day: date) -> Path:
+        return self.patient_dir(patient_id) / f"{day.isoformat()}.parquet"
+
+    def write(self, vitals: Iterable[ArchivedVital]) -> int:
+        """Append vitals to their patient/day segments; returns the number of segments written.
+
+        A segment that already exists (a late backfill archived after its day) is rewritten with the new
+        rows merged in. Files are replaced atomically, so readers never see a partial segment.
+        """
+        segments: dict[tuple[str, date], list[ArchivedVital]] = defaultdict(list)
+        for vital in vitals:
+            segments[vital.patient_id, vital.recorded_at.astimezone(UTC).date()].append(vital)
+
+        for (patient_id, day), rows in segments.items():
+            path = self.segment_path(patient_id, day)
+            table = self._to_table(rows)
+            if path.exists():
+                fresh_ids = {row.id.bytes for row in rows}
+                kept = pq.read_table(path, memory_map=True, filters=[("id", "not in", fresh_ids)], schema=self.SCHEMA)
+                table = pa.concat_tables([kept, table])
+            table = table.sort_by([("recorded_at", "ascending"), ("id", "ascending")])
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, partial, compression=self.COMPRESSION)
+            os.replace(partial, path)
+        return len(segments)
+
+    def read(
+        self,
+        patient_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        vital_types: Collection[VitalType] | None = None,
+        after: VitalCursor | None = None,
+        limit: int | None = None,
+    ) -> list[ArchivedVital]:
+        """Archived vitals of a patient with start_time <= recorded_at <= end_time, ordered by (recorded_at, id).
+
+        With after, only vitals past that position are read, starting from its day; with limit, reading stops
+        once that many are found. A page therefore costs the segments it touches, not the whole window.
+        """
+        start_time, end_time = _as_utc(start_time), _as_utc(end_time)
+        first = start_time if after is None else max(start_time, after.recorded_at)
+        if not self.may_contain(first):
+            return []
+        first_day, last_day = first.astimezone(UTC).date().isoformat(), end_time.astimezone(UTC).date().isoformat()
+        directory = self.patient_dir(patient_id)
+        # One directory listing instead of a stat per day of the window.
+        try:
+            with os.scandir(directory) as entries:
+                names = sorted(entry.name for entry in entries if entry.name.endswith(".parquet"))
+        except FileNotFoundError:
+            return []
+
+        bounds: list[tuple[str, str, Any]] = [("recorded_at", ">=", start_time), ("recorded_at", "<=", end_time)]
+        if vital_types:
+            bounds.append(("vital_type", "in", [vital_type.value for vital_type in vital_types]))
+        filters: list[list[tuple[str, str, Any]]] = [bounds]
+        if after is not None:
+            filters = [
+                [*bounds, ("recorded_at", ">", after.recorded_at)],
+                [*bounds, ("recorded_at", "==", after.recorded_at), ("id", ">", after.id.bytes)],
+            ]
+
+        vitals: list[ArchivedVital] = []
+        for name in names:
+            if not first_day <= name.removesuffix(".parquet") <= last_day:
+                continue
+            table = pq.read_table(directory / name, memory_map=True, filters=filters, schema=self.SCHEMA)
+            if limit is not None:
+                # Segments are written in this order already, so the sort is cheap; it guards the slice.
+                table = table.sort_by([("recorded_at", "ascending"), ("id", "ascending")]).slice(0, limit - len(vitals))
+            vitals.extend(self._from_table(patient_id, table))
+            if limit is not None and len(vitals) >= limit:
+                break
+        return vitals
+
+    def _to_table(self, rows: Sequence[ArchivedVital]) -> pa.Table:
+        columns: dict[str, list[Any]] = {
+            "id": [row.id.bytes for row in rows],
+            "recorded_at": [row.recorded_at for row in rows],
+            "vital_type": [row.vital_type for row in rows],
+            "value": [row.value for row in rows],
+            "version": [row.version for row in rows],
+            "created_at": [row.created_at for row in rows],
+            "updated_at": [row.updated_at for row in rows],
+        }
+        return pa.table(columns, schema=self.SCHEMA)
+
+    @staticmethod
+    def _from_table(patient_id: str, table: pa.Table) -> list[ArchivedVital]:
+        return [
+            ArchivedVital(
+                id=UUID(bytes=row["id"]),
+                patient_id=patient_id,
+                recorded_at=row["recorded_at"],
+                vital_type=row["vital_type"],
+                value=row["value"],
+                version=row["version"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in table.to_pylist()
+        ]
+
+
+vital_archive = VitalArchive()
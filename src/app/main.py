@@ -1,16 +1,37 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from pathlib import Path
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.application.inference_executor import InferenceExecutor
+from app.config import get_settings
 from app.domain.exceptions import (
+    ArchivedWindowError,
     DuplicatePatientIdError,
+    InvalidCursorError,
     OptimisticLockError,
     PatientNotFoundError,
     VitalNotFoundError,
+    VitalWindowTooLargeError,
 )
+from app.domain.inference import InferenceFactory, RuleBasedInference
+from app.infrastructure.database import async_session_factory
+from app.infrastructure.patient_cache import patient_existence_cache
+from app.infrastructure.read_routing import PrimaryPinMiddleware
+from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.infrastructure.vital_archive import vital_archive
+from app.presentation.admin_router import router as admin_router
 from app.presentation.inference_router import router as inference_router
 from app.presentation.patient_router import router as patient_router
 from app.presentation.vital_router import router as vital_router
 
+logger = logging.getLogger(__name__)
+
 openapi_tags = [
     {
         "name": "patients",
@@ -24,19 +45,72 @@ openapi_tags = [
         "name": "inference",
         "description": "Rule-based risk assessment using vital signs data.",
     },
+    {
+        "name": "admin",
+        "description": "Operational endpoints such as historical vital backfills.",
+    },
 ]
 
+
+async def warm_patient_cache(max_size: int) -> None:
+    patient_existence_cache.configure(max_size)
+    try:
+        async with async_session_factory() as session:
+            loaded = await patient_existence_cache.warm(PatientRepository(session))
+    except (OSError, SQLAlchemyError):
+        # Not fatal: the cache fills up as vitals are written.
+        logger.warning("Could not warm the patient existence cache", exc_info=True)
+        return
+    logger.info("Warmed the patient existence cache with %d patients", loaded)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    if settings.INFERENCE_RULES_PATH:
+        InferenceFactory.register(
+            "rule_based",
+            RuleBasedInference,
+            rules_path=settings.INFERENCE_RULES_PATH,
+            reload_interval=settings.INFERENCE_RULES_RELOAD_SECONDS,
+        )
+    InferenceExecutor.configure(
+        thread_workers=settings.INFERENCE_THREAD_WORKERS or None,
+        process_workers=settings.INFERENCE_PROCESS_WORKERS or None,
+    )
+    vital_archive.configure(
+        Path(settings.VITALS_ARCHIVE_DIR) if settings.VITALS_ARCHIVE_DIR else None,
+        timedelta(hours=settings.VITALS_ARCHIVE_AFTER_HOURS),
+    )
+    InferenceFactory.result_cache.configure(settings.INFERENCE_CACHE_SIZE, settings.INFERENCE_CACHE_TTL_SECONDS)
+    InferenceFactory.startup()
+    InferenceExecutor.start()
+    await warm_patient_cache(settings.PATIENT_CACHE_SIZE)
+    yield
+    InferenceExecutor.shutdown()
+    InferenceFactory.shutdown()
+
+
 app = FastAPI(
     title="Vital Monitor API",
     description="Hospital Vital Signs Monitoring REST API",
     version="0.1.0",
     openapi_tags=openapi_tags,
+    lifespan=lifespan,
 )
 
+settings = get_settings()
+if settings.READ_DATABASE_URL and settings.READ_AFTER_WRITE_PIN_SECONDS > 0:
+    app.add_middleware(
+        PrimaryPinMiddleware,  # ty: ignore[invalid-argument-type]
+        pin_seconds=settings.READ_AFTER_WRITE_PIN_SECONDS,
+    )
+
 # Routers
 app.include_router(patient_router)
 app.include_router(vital_router)
 app.include_router(inference_router)
+app.include_router(admin_router)
 
 
 # Exception handlers
@@ -60,6 +134,21 @@ async def duplicate_patient_handler(request: Request, exc: DuplicatePatientIdErr
     return JSONResponse(status_code=409, content={"detail": str(exc)})
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(ArchivedWindowError)
+async def archived_window_handler(request: Request, exc: ArchivedWindowError) -> JSONResponse:
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+
+@app.exception_handler(VitalWindowTooLargeError)
+async def vital_window_too_large_handler(request: Request, exc: VitalWindowTooLargeError) -> JSONResponse:
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,125 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.vital_import_service import VitalImportFormat, VitalImportService, iter_lines
+from app.dependencies import verify_bearer_token
+from app.infrastructure.database import engine_pool_status, get_db_session
+from app.presentation.schemas.admin_schema import DatabasePoolResponse
+from app.presentation.schemas.error_schema import ErrorResponse
+from app.presentation.schemas.vital_schema import VitalImportResponse
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+VITAL_IMPORT_DESCRIPTION = """
+Streams a historical vital backfill into the vitals table using PostgreSQL COPY.
+
+The request body is read incrementally and written in chunks of `chunk_size` rows,
+each committed on its own, so memory use does not grow with the file size.
+
+**Formats:**
+- `ndjson`: one JSON object per line with `patient_id`, `recorded_at`, `vital_type`, `value`
+- `csv`: header line followed by rows with the same columns
+
+Rows with an unknown vital type, an invalid value or an unknown patient are skipped
+and reported in `errors` with their line number.
+"""
+
+
+@router.post(
+    "/vitals/import",
+    response_model=VitalImportResponse,
+    summary="Import historical vitals",
+    description=VITAL_IMPORT_DESCRIPTION,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string"},
+                    "example": (
+                        '{"patient_id": "P00001234", "recorded_at": "2025-12-01T10:15:00Z", '
+                        '"vital_type": "HR", "value": 110.0}\n'
+                    ),
+                },
+                "text/csv": {
+                    "schema": {"type": "string"},
+                    "example": "patient_id,recorded_at,vital_type,value\nP00001234,2025-12-01T10:15:00Z,HR,110.0\n",
+                },
+            },
+        }
+    },
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def import_vitals(
+    request: Request,
+    format: VitalImportFormat = Query(
+        ...,
+        description="Format of the request body (ndjson or csv)",
+        examples=["ndjson"],
+    ),
+    chunk_size: int = Query(
+        VitalImportService.DEFAULT_CHUNK_SIZE,
+        ge=1,
+        le=50000,
+        description="Number of rows sent per COPY and committed together",
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_db_session),
+) -> VitalImportResponse:
+    service = VitalImportService(db, chunk_size=chunk_size)
+    return await service.import_lines(iter_lines(request.stream()), format)
+
+
+@router.get(
+    "/db-pool",
+    response_model=DatabasePoolResponse,
+    summary="Get database pool statistics",
+    description=(
+        "Occupancy of the connection pool and how long requests waited to check a connection out. "
+        "A growing wait or any timeouts mean DB_POOL_SIZE / DB_MAX_OVERFLOW are too small for the load. "
+        "Counters are per API process."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_db_pool_status(
+    _: bool = Depends(verify_bearer_token),
+) -> DatabasePoolResponse:
+    return DatabasePoolResponse(**engine_pool_status())
@@ -1,9 +1,23 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.inference_service import InferenceService
+from app.application.patient_risk_service import PatientRiskService
+from app.application.stored_inference_service import StoredInferenceService
 from app.dependencies import verify_bearer_token
+from app.domain.inference import AggregationPolicy
+from app.infrastructure.database import get_db_session, get_read_db_session
 from app.presentation.schemas.error_schema import ErrorResponse
-from app.presentation.schemas.inference_schema import InferenceRequest, InferenceResponse
+from app.presentation.schemas.inference_schema import (
+    InferenceBatchRequest,
+    InferenceBatchResponse,
+    InferenceCacheStatsResponse,
+    InferenceRequest,
+    InferenceResponse,
+    PatientRiskResponse,
+)
 
 router = APIRouter(prefix="/api/v1/inference", tags=["inference"])
 
@@ -20,7 +34,10 @@ Evaluates patient vital signs for risk assessment using rule-based inference.
 - 1-2 rules matched: MEDIUM risk (score 0.4-0.7)
 - 3+ rules matched: HIGH risk (score >= 0.8)
 
-When multiple records are provided, returns the highest risk assessment.
+When multiple records are provided, `aggregation` selects how they are combined:
+- `max` (default): the highest risk assessment; evaluation stops at the first record with the maximum score
+- `latest`: the assessment of the most recent record
+- `time_weighted`: recency-weighted mean score (half-life 1 hour), with the level derived from that score
 """
 
 
@@ -58,4 +75,199 @@ async def evaluate_vital_risk(
     _: bool = Depends(verify_bearer_token),
 ) -> InferenceResponse:
     service = InferenceService()
-    return service.evaluate(request)
+    return await service.evaluate(request)
+
+
+@router.post(
+    "/vital-risk/batch",
+    response_model=InferenceBatchResponse,
+    summary="Evaluate vital-based risk for many patients",
+    description=(
+        "Evaluates up to 5000 patients in one call using the same rules as `/vital-risk`. "
+        "All records of all patients are scored in a single vectorized pass; each patient gets "
+        "its own highest-risk assessment, returned in request order."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        422: {
+            "description": "Validation error (e.g., empty requests or records list)",
+        },
+    },
+)
+async def evaluate_vital_risk_batch(
+    request: InferenceBatchRequest,
+    _: bool = Depends(verify_bearer_token),
+) -> InferenceBatchResponse:
+    service = InferenceService()
+    return InferenceBatchResponse(results=await service.evaluate_many(request.requests))
+
+
+@router.get(
+    "/patients/{patient_id}/vital-risk",
+    response_model=InferenceResponse,
+    summary="Evaluate risk from stored vitals",
+    description=(
+        "Evaluates the vitals already stored for a patient instead of client-supplied records. "
+        "Vitals recorded at the same instant form one record; the rules are the same as `/vital-risk` "
+        "and the records in the time range are combined per `aggregation` (default: the highest risk assessment)."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        404: {
+            "model": ErrorResponse,
+            "description": "Patient not found, or no vitals in the time range",
+        },
+        422: {
+            "model": ErrorResponse,
+            "description": (
+                "The time range starts before the archive cutoff (archived vitals are not read here), "
+                "or holds more vitals than one evaluation loads"
+            ),
+        },
+    },
+)
+async def evaluate_stored_vital_risk(
+    patient_id: str = Path(
+        ...,
+        description="Hospital patient identifier",
+        examples=["P00001234"],
+    ),
+    from_: datetime = Query(
+        ...,
+        alias="from",
+        description="Start of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-01T00:00:00Z"],
+    ),
+    to: datetime = Query(
+        ...,
+        description="End of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-31T23:59:59Z"],
+    ),
+    aggregation: AggregationPolicy = Query(
+        AggregationPolicy.MAX,
+        description="How the records in the window are combined (max, latest, time_weighted)",
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> InferenceResponse:
+    service = StoredInferenceService(db)
+    return await service.evaluate_stored(patient_id, from_, to, aggregation)
+
+
+@router.get(
+    "/patients/{patient_id}/current-risk",
+    response_model=PatientRiskResponse,
+    summary="Get current risk",
+    description=(
+        "Returns the patient's current risk, kept up to date whenever vitals are created, updated or imported. "
+        "It is scored from the latest vital of each type and read with a single lookup, "
+        "so it is cheap enough to poll for every bed."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        404: {
+            "model": ErrorResponse,
+            "description": "Patient not found",
+        },
+    },
+)
+async def get_current_risk(
+    patient_id: str = Path(
+        ...,
+        description="Hospital patient identifier",
+        examples=["P00001234"],
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_db_session),
+) -> PatientRiskResponse:
+    service = PatientRiskService(db)
+    response = await service.get_current_risk(patient_id)
+    await db.commit()
+    return response
+
+
+@router.get(
+    "/cache/stats",
+    response_model=InferenceCacheStatsResponse,
+    summary="Get inference cache statistics",
+    description=(
+        "Hit, miss and eviction counters of the in-memory cache of single-record evaluations. "
+        "Entries are keyed by strategy, strategy version and vitals, and are dropped when a strategy is re-registered. "
+        "Counters are per API process."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_inference_cache_stats(
+    _: bool = Depends(verify_bearer_token),
+) -> InferenceCacheStatsResponse:
+    return InferenceService.cache_stats()
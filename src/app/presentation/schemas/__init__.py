@@ -1,7 +1,17 @@
 from app.presentation.schemas.inference_schema import (
+    InferenceBatchRequest,
+    InferenceBatchResponse,
     InferenceRequest,
     InferenceResponse,
+    PatientRiskResponse,
     VitalRecord,
 )
 
-__all__ = ["InferenceRequest", "InferenceResponse", "VitalRecord"]
+__all__ = [
+    "InferenceBatchRequest",
+    "InferenceBatchResponse",
+    "InferenceRequest",
+    "InferenceResponse",
+    "PatientRiskResponse",
+    "VitalRecord",
+]
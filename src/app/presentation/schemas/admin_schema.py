@@ -0,0 +1,45 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DatabasePoolResponse(BaseModel):
+    """Occupancy and checkout wait statistics of the database connection pool."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "pool_class": "InstrumentedQueuePool",
+                    "size": 5,
+                    "checked_out": 2,
+                    "overflow": 0,
+                    "checkouts": 18230,
+                    "timeouts": 0,
+                    "wait_seconds_total": 4.12,
+                    "wait_seconds_max": 0.084,
+                    "wait_seconds_avg": 0.000226,
+                    "wait_histogram": {
+                        "le_0.001": 18190,
+                        "le_0.005": 31,
+                        "le_0.01": 4,
+                        "le_0.05": 4,
+                        "le_0.1": 1,
+                        "le_0.5": 0,
+                        "le_1": 0,
+                        "le_5": 0,
+                        "le_inf": 0,
+                    },
+                }
+            ]
+        },
+    )
+
+    pool_class: str = Field(..., description="Pool implementation (InstrumentedNullPool when DB_PGBOUNCER is set)")
+    size: int | None = Field(None, description="Configured pool size (null without local pooling)")
+    checked_out: int | None = Field(None, description="Connections currently in use")
+    overflow: int | None = Field(None, description="Connections opened beyond the pool size (negative while unfilled)")
+    checkouts: int = Field(..., description="Connection checkouts since startup")
+    timeouts: int = Field(..., description="Checkouts that gave up after DB_POOL_TIMEOUT")
+    wait_seconds_total: float = Field(..., description="Time spent waiting for connections, including connecting")
+    wait_seconds_max: float = Field(..., description="Longest single checkout wait")
+    wait_seconds_avg: float = Field(..., description="Mean checkout wait")
+    wait_histogram: dict[str, int] = Field(..., description="Checkouts per wait bucket (upper bound in seconds)")
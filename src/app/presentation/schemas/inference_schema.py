@@ -2,6 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.domain.inference import AggregationPolicy
 from app.domain.risk_level import RiskLevel
 
 
@@ -49,6 +50,13 @@ class InferenceRequest(BaseModel):
         min_length=1,
         description="List of vital records to evaluate (minimum 1 record required)",
     )
+    aggregation: AggregationPolicy = Field(
+        AggregationPolicy.MAX,
+        description=(
+            "How records are combined: max (highest-risk record), latest (most recent record) "
+            "or time_weighted (recency-weighted mean score)"
+        ),
+    )
 
 
 class InferenceResponse(BaseModel):
@@ -84,3 +92,100 @@ class InferenceResponse(BaseModel):
         description="List of triggered risk rules (e.g., 'HR > 120', 'SBP < 90')",
     )
     evaluated_at: datetime = Field(..., description="Timestamp of evaluation (UTC)")
+
+
+class InferenceBatchRequest(BaseModel):
+    """Request body for evaluating many patients in one call."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "requests": [
+                        {
+                            "patient_id": "P00001234",
+                            "records": [
+                                {
+                                    "recorded_at": "2025-12-01T10:15:00Z",
+                                    "vitals": {"HR": 130.0, "SBP": 85.0, "SpO2": 89.0},
+                                }
+                            ],
+                        },
+                        {
+                            "patient_id": "P00005678",
+                            "records": [
+                                {
+                                    "recorded_at": "2025-12-01T10:15:00Z",
+                                    "vitals": {"HR": 80.0, "SBP": 120.0, "SpO2": 98.0},
+                                }
+                            ],
+                        },
+                    ]
+                }
+            ]
+        },
+    )
+
+    requests: list[InferenceRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Per-patient inference requests (1 to 5000)",
+    )
+
+
+class InferenceBatchResponse(BaseModel):
+    """Response body containing one risk assessment per requested patient."""
+
+    results: list[InferenceResponse] = Field(..., description="Risk assessments, in request order")
+
+
+class PatientRiskResponse(InferenceResponse):
+    """Current risk of a patient, maintained as vitals are written."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "patient_id": "P00001234",
+                    "risk_score": 0.7,
+                    "risk_level": "MEDIUM",
+                    "checked_rules": ["HR > 120", "SBP < 90"],
+                    "evaluated_at": "2025-12-01T10:20:00Z",
+                    "vitals": {"HR": 130.0, "SBP": 85.0, "SpO2": 97.0},
+                }
+            ]
+        },
+    )
+
+    vitals: dict[str, float] = Field(..., description="Latest value of each vital type the risk was scored from")
+
+
+class InferenceCacheStatsResponse(BaseModel):
+    """Counters of the inference result cache since startup (or the last reconfiguration)."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "size": 812,
+                    "max_size": 10000,
+                    "ttl_seconds": 300.0,
+                    "hits": 45210,
+                    "misses": 3120,
+                    "evictions": 0,
+                    "expirations": 2308,
+                    "hit_ratio": 0.9354,
+                }
+            ]
+        },
+    )
+
+    size: int = Field(..., description="Number of cached results")
+    max_size: int = Field(..., description="Maximum number of cached results (0 = cache disabled)")
+    ttl_seconds: float = Field(..., description="Lifetime of a cached result (0 = until evicted)")
+    hits: int = Field(..., description="Evaluations answered from the cache")
+    misses: int = Field(..., description="Evaluations that ran the strategy")
+    evictions: int = Field(..., description="Results dropped because the cache was full (least recently used)")
+    expirations: int = Field(..., description="Results dropped because their lifetime had passed")
+    hit_ratio: float = Field(..., description="hits / (hits + misses)")
@@ -1,13 +1,37 @@
+import math
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from app.domain.vital_type import VitalType
 
+# vitals.value is Numeric(10, 2): rounded to cents, a value must stay below 1e8 in magnitude.
+MAX_ABS_VITAL_VALUE = Decimal("1e8")
+
+
+def check_vital_value[T: (float, Decimal)](value: T) -> T:
+    """Reject values the vitals table cannot store, instead of failing the INSERT."""
+    if (
+        not math.isfinite(value)
+        or abs(value) >= MAX_ABS_VITAL_VALUE
+        or abs(Decimal(str(value)).quantize(Decimal("0.01"), ROUND_HALF_UP)) >= MAX_ABS_VITAL_VALUE
+    ):
+        raise ValueError("value must be a finite number below 1e8 after rounding to 2 decimals")
+    return value
+
+
+VitalValue = Annotated[float, AfterValidator(check_vital_value)]
 
-class VitalCreateRequest(BaseModel):
-    """Request body for recording a vital sign measurement."""
+
+class VitalMeasurement(BaseModel):
+    """A vital sign measurement as submitted in a bulk request.
+
+    The value range is not checked here, so one bad item is reported in the bulk response's errors
+    (see check_vital_value) instead of rejecting the whole request.
+    """
 
     patient_id: str = Field(
         ...,
@@ -31,10 +55,20 @@ class VitalCreateRequest(BaseModel):
     )
 
 
+class VitalCreateRequest(VitalMeasurement):
+    """Request body for recording a vital sign measurement."""
+
+    value: VitalValue = Field(
+        ...,
+        description="Measured value (unit depends on vital_type; below 1e8 in magnitude, stored to 2 decimals)",
+        examples=[110.0],
+    )
+
+
 class VitalUpdateRequest(BaseModel):
     """Request body for correcting a vital record."""
 
-    value: float = Field(
+    value: VitalValue = Field(
         ...,
         description="Corrected measurement value",
         examples=[115.0],
@@ -110,6 +144,7 @@ class VitalListResponse(BaseModel):
                         {"recorded_at": "2025-12-01T10:15:00Z", "value": 110.0},
                         {"recorded_at": "2025-12-01T10:30:00Z", "value": 108.0},
                     ],
+                    "next_cursor": None,
                 }
             ]
         },
@@ -121,3 +156,236 @@ class VitalListResponse(BaseModel):
         description="Vital type filter applied (null if no filter)",
     )
     items: list[VitalItem] = Field(..., description="List of vital measurements")
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the next page; pass it as `cursor` to continue (null on the last page)",
+    )
+
+
+class PatientVitalItem(BaseModel):
+    """Single vital measurement in a multi-patient list response."""
+
+    recorded_at: datetime = Field(..., description="When the vital sign was recorded")
+    vital_type: str = Field(..., description="Type of vital sign")
+    value: float = Field(..., description="Measured value")
+
+
+class PatientVitalSeries(BaseModel):
+    """Vital measurements of one patient, ordered by recorded_at."""
+
+    patient_id: str = Field(..., description="Hospital patient identifier")
+    items: list[PatientVitalItem] = Field(..., description="List of vital measurements")
+
+
+class VitalMultiPatientListResponse(BaseModel):
+    """Response body for a vital records query over several patients."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "vital_types": ["HR", "SpO2"],
+                    "patients": [
+                        {
+                            "patient_id": "P00001234",
+                            "items": [
+                                {"recorded_at": "2025-12-01T10:15:00Z", "vital_type": "HR", "value": 110.0},
+                                {"recorded_at": "2025-12-01T10:15:00Z", "vital_type": "SpO2", "value": 96.0},
+                            ],
+                        },
+                        {"patient_id": "P00005678", "items": []},
+                    ],
+                    "next_cursor": None,
+                }
+            ]
+        },
+    )
+
+    vital_types: list[str] | None = Field(
+        ...,
+        description="Vital type filter applied (null if no filter)",
+    )
+    patients: list[PatientVitalSeries] = Field(
+        ...,
+        description="One entry per requested patient, in request order (items may be empty)",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description=(
+            "Opaque cursor for the next page; pass it as `cursor` to continue (null on the last page). "
+            "Pages run patient by patient, so a patient's items can continue on the next page"
+        ),
+    )
+
+
+class LatestVital(BaseModel):
+    """Newest vital of one type for a patient."""
+
+    vital_id: UUID = Field(..., description="Identifier of the vital record")
+    recorded_at: datetime = Field(..., description="When the vital sign was recorded")
+    value: float = Field(..., description="Measured value")
+
+
+class PatientLatestVitals(BaseModel):
+    """Latest vital of each type recorded for one patient."""
+
+    patient_id: str = Field(..., description="Hospital patient identifier")
+    vitals: dict[str, LatestVital] = Field(
+        ...,
+        description="Latest vital keyed by vital type (types never recorded are absent)",
+    )
+
+
+class LatestVitalsResponse(BaseModel):
+    """Response body for the latest vitals of many patients."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "items": [
+                        {
+                            "patient_id": "P00001234",
+                            "vitals": {
+                                "HR": {
+                                    "vital_id": "550e8400-e29b-41d4-a716-446655440000",
+                                    "recorded_at": "2025-12-01T10:15:00Z",
+                                    "value": 110.0,
+                                },
+                                "SpO2": {
+                                    "vital_id": "6fa459ea-ee8a-3ca4-894e-db77e160355e",
+                                    "recorded_at": "2025-12-01T10:14:00Z",
+                                    "value": 96.0,
+                                },
+                            },
+                        }
+                    ],
+                    "not_found": ["P00009999"],
+                }
+            ]
+        },
+    )
+
+    items: list[PatientLatestVitals] = Field(..., description="Latest vitals per patient, in request order")
+    not_found: list[str] = Field(..., description="Requested patient IDs that do not exist")
+
+
+class VitalBulkCreateRequest(BaseModel):
+    """Request body for recording many vital sign measurements at once."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "items": [
+                        {
+                            "patient_id": "P00001234",
+                            "recorded_at": "2025-12-01T10:15:00Z",
+                            "vital_type": "HR",
+                            "value": 110.0,
+                        },
+                        {
+                            "patient_id": "P00001234",
+                            "recorded_at": "2025-12-01T10:15:00Z",
+                            "vital_type": "SpO2",
+                            "value": 97.0,
+                        },
+                    ]
+                }
+            ]
+        },
+    )
+
+    items: list[VitalMeasurement] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Vital measurements to record (1 to 1000 items)",
+    )
+
+
+class VitalBulkItemError(BaseModel):
+    """Failure detail for a single item of a bulk request."""
+
+    index: int = Field(..., description="Position of the failed item in the request items list")
+    patient_id: str = Field(..., description="Hospital patient identifier of the failed item")
+    detail: str = Field(
+        ...,
+        description="Error message describing why the item was rejected",
+        examples=["Patient P00001234 not found"],
+    )
+
+
+class VitalBulkCreateResponse(BaseModel):
+    """Response body for bulk vital recording."""
+
+    created: list[VitalResponse] = Field(..., description="Recorded vitals, in request order")
+    errors: list[VitalBulkItemError] = Field(..., description="Items that were rejected (empty if all succeeded)")
+
+
+class VitalImportRowError(BaseModel):
+    """Rejected row of a vital import."""
+
+    line: int = Field(..., description="1-based line number of the rejected row in the uploaded file")
+    detail: str = Field(
+        ...,
+        description="Reason the row was rejected",
+        examples=["vital_type must be one of HR, RR, SBP, DBP, SpO2, BT"],
+    )
+
+
+class VitalImportResponse(BaseModel):
+    """Summary of a streaming vital import."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "imported": 250000,
+                    "rejected": 1,
+                    "errors": [{"line": 42, "detail": "Patient P00009999 not found"}],
+                    "elapsed_seconds": 3.2,
+                    "rows_per_second": 78125.0,
+                }
+            ]
+        },
+    )
+
+    imported: int = Field(..., description="Number of rows written to the vitals table")
+    rejected: int = Field(..., description="Number of rows skipped because they failed validation")
+    errors: list[VitalImportRowError] = Field(
+        ...,
+        description="Details of rejected rows (only the first 100 are reported)",
+    )
+    elapsed_seconds: float = Field(..., description="Wall-clock duration of the import")
+    rows_per_second: float = Field(..., description="Import throughput (imported rows / elapsed seconds)")
+
+
+class VitalAggregateResponse(BaseModel):
+    """Response body for aggregated or downsampled vital series."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "patient_id": "P00001234",
+                    "vital_type": "SpO2",
+                    "bucket": "5m",
+                    "agg": "avg",
+                    "items": [
+                        {"recorded_at": "2025-12-01T10:15:00Z", "value": 96.4},
+                        {"recorded_at": "2025-12-01T10:20:00Z", "value": 95.8},
+                    ],
+                }
+            ]
+        },
+    )
+
+    patient_id: str = Field(..., description="Hospital patient identifier")
+    vital_type: str = Field(..., description="Vital type of the series")
+    bucket: str | None = Field(..., description="Bucket width applied (null if raw points were downsampled)")
+    agg: str | None = Field(..., description="Aggregate function applied per bucket (null if no bucketing)")
+    items: list[VitalItem] = Field(
+        ...,
+        description="Series points; recorded_at is the bucket start when bucketing is applied",
+    )
@@ -1,17 +1,27 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.patient_risk_service import PatientRiskService
 from app.application.vital_service import VitalService
 from app.dependencies import verify_bearer_token
+from app.domain.vital_aggregation import AggregationBucket, AggregationFunction
 from app.domain.vital_type import VitalType
-from app.infrastructure.database import get_db_session
+from app.infrastructure.database import get_db_session, get_read_db_session
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.presentation.responses import ORJSONResponse
 from app.presentation.schemas.error_schema import ErrorResponse
 from app.presentation.schemas.vital_schema import (
+    LatestVitalsResponse,
+    VitalAggregateResponse,
+    VitalBulkCreateRequest,
+    VitalBulkCreateResponse,
     VitalCreateRequest,
     VitalListResponse,
+    VitalMultiPatientListResponse,
     VitalResponse,
     VitalUpdateRequest,
 )
@@ -59,11 +69,110 @@ async def create_vital(
     return await service.create_vital(request)
 
 
+@router.post(
+    "/bulk",
+    response_model=VitalBulkCreateResponse,
+    status_code=201,
+    summary="Record many vital sign measurements",
+    description=(
+        "Records up to 1000 vital sign measurements in one request. Patient existence is checked once per "
+        "distinct patient_id and all valid items are written together. Items for unknown patients are "
+        "reported in `errors` by their index instead of failing the whole request."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        422: {
+            "description": "Validation error (e.g., empty items list or more than 1000 items)",
+        },
+    },
+)
+async def create_vitals_bulk(
+    request: VitalBulkCreateRequest,
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_db_session),
+) -> VitalBulkCreateResponse:
+    service = VitalService(db)
+    response = await service.create_vitals_bulk(request)
+    await db.commit()
+    return response
+
+
+@router.get(
+    "/latest",
+    response_model=LatestVitalsResponse,
+    summary="Query the latest vitals of many patients",
+    description=(
+        "Returns the latest vital of each type for up to "
+        f"{PatientRiskService.MAX_LATEST_PATIENTS} patients (repeat `patient_id`), e.g. for a ward overview. "
+        "Values come from the per-patient snapshot that is updated in the same transaction as every vital "
+        "write, so no time window is scanned. Unknown patient IDs are listed in `not_found`."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        422: {
+            "description": (
+                f"Validation error (e.g., no patient_id or more than {PatientRiskService.MAX_LATEST_PATIENTS})"
+            ),
+        },
+    },
+)
+async def get_latest_vitals(
+    patient_id: list[str] = Query(
+        ...,
+        min_length=1,
+        max_length=PatientRiskService.MAX_LATEST_PATIENTS,
+        description="Hospital patient identifier; repeat the parameter for each patient",
+        examples=[["P00001234", "P00005678"]],
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> LatestVitalsResponse:
+    service = PatientRiskService(db)
+    return await service.get_latest_vitals(patient_id)
+
+
 @router.get(
     "/patient/{patient_id}",
     response_model=VitalListResponse,
     summary="Query vital records by time range",
-    description="Retrieves vital records for a patient within specified time range. Optionally filter by vital type.",
+    description=(
+        "Retrieves vital records for a patient within specified time range, ordered by recorded_at. "
+        "Optionally filter by vital type. Results are paginated: follow `next_cursor` until it is null."
+    ),
     responses={
         401: {
             "model": ErrorResponse,
@@ -83,6 +192,10 @@ async def create_vital(
                 }
             },
         },
+        400: {
+            "model": ErrorResponse,
+            "description": "Invalid pagination cursor",
+        },
     },
 )
 async def get_vitals(
@@ -107,11 +220,268 @@ async def get_vitals(
         description="Optional filter by vital type (HR, RR, SBP, DBP, SpO2, BT)",
         examples=["HR"],
     ),
+    limit: int = Query(
+        VitalRepository.MAX_PAGE_SIZE,
+        ge=1,
+        le=VitalRepository.MAX_PAGE_SIZE,
+        description=f"Maximum number of items per page (1 to {VitalRepository.MAX_PAGE_SIZE})",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from the previous page's next_cursor",
+    ),
     _: bool = Depends(verify_bearer_token),
-    db: AsyncSession = Depends(get_db_session),
-) -> VitalListResponse:
+    db: AsyncSession = Depends(get_read_db_session),
+) -> ORJSONResponse:
+    service = VitalService(db)
+    # Encoded from plain rows with orjson; response_model above still documents (not validates) the body.
+    return ORJSONResponse(await service.get_vitals_payload(patient_id, from_, to, vital_type, limit, cursor))
+
+
+@router.get(
+    "/patients",
+    response_model=VitalMultiPatientListResponse,
+    summary="Query vital records of many patients by time range",
+    description=(
+        f"Retrieves vital records of up to {VitalService.MAX_PATIENTS_PER_QUERY} patients (repeat `patient_id`) "
+        "within the same time range in a single query, grouped per patient and ordered by recorded_at. "
+        "Optionally filter by one or more vital types (repeat `vital_type`). Results are paginated: follow "
+        "`next_cursor` until it is null."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        400: {
+            "model": ErrorResponse,
+            "description": "Invalid pagination cursor",
+        },
+    },
+)
+async def get_vitals_for_patients(
+    patient_id: list[str] = Query(
+        ...,
+        min_length=1,
+        max_length=VitalService.MAX_PATIENTS_PER_QUERY,
+        description="Hospital patient identifier; repeat the parameter for each patient",
+        examples=[["P00001234", "P00005678"]],
+    ),
+    from_: datetime = Query(
+        ...,
+        alias="from",
+        description="Start of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-01T00:00:00Z"],
+    ),
+    to: datetime = Query(
+        ...,
+        description="End of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-31T23:59:59Z"],
+    ),
+    vital_type: list[VitalType] | None = Query(
+        None,
+        description="Optional filter by vital types (HR, RR, SBP, DBP, SpO2, BT); repeat for several",
+        examples=[["HR", "SpO2"]],
+    ),
+    limit: int = Query(
+        VitalRepository.MAX_MULTI_PATIENT_PAGE_SIZE,
+        ge=1,
+        le=VitalRepository.MAX_MULTI_PATIENT_PAGE_SIZE,
+        description=(
+            f"Maximum number of items per page across all patients (1 to {VitalRepository.MAX_MULTI_PATIENT_PAGE_SIZE})"
+        ),
+    ),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from the previous page's next_cursor",
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> ORJSONResponse:
+    service = VitalService(db)
+    return ORJSONResponse(
+        await service.get_vitals_for_patients_payload(patient_id, from_, to, vital_type, limit, cursor)
+    )
+
+
+@router.get(
+    "/patient/{patient_id}/stream",
+    response_class=StreamingResponse,
+    summary="Stream vital records by time range",
+    description=(
+        "Streams every vital record of a patient within the time range as NDJSON "
+        '(one `{"recorded_at": ..., "value": ...}` object per line, ordered by recorded_at). '
+        "Rows are read through a server-side cursor and written as they arrive, so the response "
+        "is not paginated and memory use does not depend on the window size."
+    ),
+    responses={
+        200: {
+            "description": "Newline-delimited JSON vital items",
+            "content": {
+                "application/x-ndjson": {
+                    "example": (
+                        '{"recorded_at": "2025-12-01T10:15:00+00:00", "value": 110.0}\n'
+                        '{"recorded_at": "2025-12-01T10:30:00+00:00", "value": 108.0}\n'
+                    )
+                }
+            },
+        },
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        422: {
+            "model": ErrorResponse,
+            "description": "The time range starts before the archive cutoff (archived vitals are not read here)",
+        },
+    },
+)
+async def stream_vitals(
+    patient_id: str = Path(
+        ...,
+        description="Hospital patient identifier",
+        examples=["P00001234"],
+    ),
+    from_: datetime = Query(
+        ...,
+        alias="from",
+        description="Start of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-01T00:00:00Z"],
+    ),
+    to: datetime = Query(
+        ...,
+        description="End of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-31T23:59:59Z"],
+    ),
+    vital_type: VitalType | None = Query(
+        None,
+        description="Optional filter by vital type (HR, RR, SBP, DBP, SpO2, BT)",
+        examples=["HR"],
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> StreamingResponse:
+    service = VitalService(db)
+    return StreamingResponse(
+        service.stream_vitals(patient_id, from_, to, vital_type),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/patient/{patient_id}/aggregate",
+    response_model=VitalAggregateResponse,
+    summary="Query aggregated vital series",
+    description=(
+        "Returns a reduced vital series for charting long windows. "
+        "With `bucket`, values are grouped into fixed-width time buckets in the database and reduced with `agg`. "
+        "With `max_points`, the (raw or bucketed) series is further downsampled with the LTTB algorithm, "
+        "which keeps the visual shape of the curve; a raw series of more than 4 × `max_points` rows is first "
+        "averaged into about 4 × `max_points` time buckets in the database. "
+        "At least one of `bucket` or `max_points` is required."
+    ),
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "Invalid or missing Bearer token",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "missing_token": {
+                            "summary": "No token provided",
+                            "value": {"detail": "Not authenticated"},
+                        },
+                        "invalid_token": {
+                            "summary": "Invalid token",
+                            "value": {"detail": "Invalid token"},
+                        },
+                    }
+                }
+            },
+        },
+        422: {
+            "description": (
+                "Validation error (e.g., neither bucket nor max_points given), "
+                "or the time range starts before the archive cutoff"
+            ),
+        },
+    },
+)
+async def aggregate_vitals(
+    patient_id: str = Path(
+        ...,
+        description="Hospital patient identifier",
+        examples=["P00001234"],
+    ),
+    from_: datetime = Query(
+        ...,
+        alias="from",
+        description="Start of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-01T00:00:00Z"],
+    ),
+    to: datetime = Query(
+        ...,
+        description="End of time range, inclusive (ISO 8601 format)",
+        examples=["2025-12-31T23:59:59Z"],
+    ),
+    vital_type: VitalType = Query(
+        ...,
+        description="Vital type of the series (HR, RR, SBP, DBP, SpO2, BT)",
+        examples=["SpO2"],
+    ),
+    bucket: AggregationBucket | None = Query(
+        None,
+        description="Bucket width (1m, 5m, 1h)",
+        examples=["5m"],
+    ),
+    agg: AggregationFunction = Query(
+        AggregationFunction.AVG,
+        description="Aggregate applied per bucket (avg, min, max, last, count)",
+    ),
+    max_points: int | None = Query(
+        None,
+        ge=3,
+        le=10000,
+        description="Downsample the series to at most this many points with LTTB",
+    ),
+    _: bool = Depends(verify_bearer_token),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> VitalAggregateResponse:
+    if bucket is None and max_points is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Either bucket or max_points is required",
+        )
     service = VitalService(db)
-    return await service.get_vitals(patient_id, from_, to, vital_type)
+    return await service.aggregate_vitals(patient_id, from_, to, vital_type, bucket, agg, max_points)
 
 
 @router.put(
@@ -1,7 +1,9 @@
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 
+import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # Set test BEARER_TOKEN before importing settings
@@ -30,3 +32,16 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession]:
     async with async_session_factory() as session:
         yield session
         await session.rollback()
+
+
+@pytest.fixture
+def statements(test_engine) -> Generator[list[str]]:
+    """SQL statements executed on the test engine while the test runs, in order."""
+    recorded: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
@@ -4,7 +4,7 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.infrastructure.database import get_db_session
+from app.infrastructure.database import get_db_session, get_read_db_session
 from app.main import app
 
 
@@ -19,6 +19,7 @@ async def test_client(test_engine) -> AsyncGenerator[AsyncClient]:
             await session.commit()
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_db_session] = override_get_db_session
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
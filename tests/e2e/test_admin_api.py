@@ -0,0 +1,80 @@
+import json
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.models.patient_model import PatientModel
+
+AUTH_HEADERS = {"Authorization": "Bearer test-bearer-token"}
+
+
+class TestImportVitals:
+    @pytest.mark.asyncio
+    async def test_import_ndjson(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"IMPORT_{uuid4().hex[:8]}"
+        db_session.add(
+            PatientModel(patient_id=patient_id, name="Test Patient", gender="M", birth_date=date(1990, 1, 1))
+        )
+        await db_session.commit()
+
+        body = "\n".join(
+            json.dumps({"patient_id": patient_id, "recorded_at": "2024-01-01T10:00:00Z", "vital_type": vt, "value": 1})
+            for vt in ["HR", "RR", "XX"]
+        )
+        response = await test_client.post(
+            "/api/v1/admin/vitals/import",
+            headers={**AUTH_HEADERS, "Content-Type": "application/x-ndjson"},
+            params={"format": "ndjson"},
+            content=body,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["rejected"] == 1
+        assert data["errors"][0]["line"] == 3
+
+        vitals = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-02T00:00:00Z"},
+        )
+        assert len(vitals.json()["items"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_import_invalid_format(self, test_client: AsyncClient):
+        response = await test_client.post(
+            "/api/v1/admin/vitals/import",
+            headers=AUTH_HEADERS,
+            params={"format": "xml"},
+            content="",
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_import_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.post(
+            "/api/v1/admin/vitals/import",
+            params={"format": "ndjson"},
+            content="",
+        )
+        assert response.status_code == 401
+
+
+class TestDatabasePool:
+    @pytest.mark.asyncio
+    async def test_db_pool_status(self, test_client: AsyncClient):
+        response = await test_client.get("/api/v1/admin/db-pool", headers=AUTH_HEADERS)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pool_class"] == "InstrumentedQueuePool"
+        assert data["size"] == 5
+        assert sum(data["wait_histogram"].values()) == data["checkouts"]
+
+    @pytest.mark.asyncio
+    async def test_db_pool_status_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.get("/api/v1/admin/db-pool")
+        assert response.status_code == 401
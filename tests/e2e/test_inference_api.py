@@ -1,5 +1,13 @@
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
 
 
 class TestInferenceAPI:
@@ -79,3 +87,227 @@ class TestInferenceAPI:
         )
 
         assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_vital_risk_latest_aggregation(self, test_client: AsyncClient):
+        """aggregation=latest -> assessment of the most recent record."""
+        response = await test_client.post(
+            "/api/v1/inference/vital-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            json={
+                "patient_id": "P001",
+                "aggregation": "latest",
+                "records": [
+                    {"recorded_at": "2024-01-01T01:00:00Z", "vitals": {"HR": 80}},
+                    {"recorded_at": "2024-01-01T00:00:00Z", "vitals": {"HR": 130, "SBP": 85, "SpO2": 85}},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["risk_level"] == "LOW"
+
+    @pytest.mark.asyncio
+    async def test_vital_risk_latest_mixes_naive_and_aware(self, test_client: AsyncClient):
+        """Naive recorded_at values are UTC, so they compare with aware ones."""
+        response = await test_client.post(
+            "/api/v1/inference/vital-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            json={
+                "patient_id": "P001",
+                "aggregation": "latest",
+                "records": [
+                    {"recorded_at": "2024-01-01T10:00:00", "vitals": {"HR": 130, "SBP": 85, "SpO2": 85}},
+                    {"recorded_at": "2024-01-01T09:30:00Z", "vitals": {"HR": 80}},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["risk_level"] == "HIGH"
+
+    @pytest.mark.asyncio
+    async def test_vital_risk_unknown_aggregation(self, test_client: AsyncClient):
+        response = await test_client.post(
+            "/api/v1/inference/vital-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            json={
+                "patient_id": "P001",
+                "aggregation": "median",
+                "records": [{"recorded_at": "2024-01-01T00:00:00Z", "vitals": {"HR": 80}}],
+            },
+        )
+
+        assert response.status_code == 422
+
+
+class TestInferenceBatchAPI:
+    @pytest.mark.asyncio
+    async def test_vital_risk_batch_success(self, test_client: AsyncClient):
+        """POST /api/v1/inference/vital-risk/batch -> one result per patient."""
+        response = await test_client.post(
+            "/api/v1/inference/vital-risk/batch",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            json={
+                "requests": [
+                    {
+                        "patient_id": "P001",
+                        "records": [
+                            {"recorded_at": "2024-01-01T00:00:00Z", "vitals": {"HR": 130, "SBP": 85, "SpO2": 85}}
+                        ],
+                    },
+                    {
+                        "patient_id": "P002",
+                        "records": [
+                            {"recorded_at": "2024-01-01T00:00:00Z", "vitals": {"HR": 80, "SBP": 120, "SpO2": 98}}
+                        ],
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["patient_id"] for r in results] == ["P001", "P002"]
+        assert [r["risk_level"] for r in results] == ["HIGH", "LOW"]
+
+    @pytest.mark.asyncio
+    async def test_vital_risk_batch_empty(self, test_client: AsyncClient):
+        """Empty requests list -> 422."""
+        response = await test_client.post(
+            "/api/v1/inference/vital-risk/batch",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            json={"requests": []},
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_vital_risk_batch_unauthorized(self, test_client: AsyncClient):
+        """No token -> 401."""
+        response = await test_client.post("/api/v1/inference/vital-risk/batch", json={"requests": []})
+
+        assert response.status_code == 401
+
+
+class TestStoredVitalRiskAPI:
+    @pytest.mark.asyncio
+    async def test_stored_vital_risk_success(self, test_client: AsyncClient, db_session: AsyncSession):
+        """GET /api/v1/inference/patients/{id}/vital-risk -> scored from stored vitals."""
+        patient_id = f"INF_{uuid4().hex[:8]}"
+        db_session.add(
+            PatientModel(patient_id=patient_id, name="Test Patient", gender="M", birth_date=date(1990, 1, 1))
+        )
+        await db_session.flush()
+        recorded_at = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+        for vital_type, value in [("HR", "130"), ("SBP", "85"), ("SpO2", "85")]:
+            db_session.add(
+                VitalModel(patient_id=patient_id, recorded_at=recorded_at, vital_type=vital_type, value=Decimal(value))
+            )
+        await db_session.commit()
+
+        response = await test_client.get(
+            f"/api/v1/inference/patients/{patient_id}/vital-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["patient_id"] == patient_id
+        assert data["risk_level"] == "HIGH"
+        assert len(data["checked_rules"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_stored_vital_risk_patient_not_found(self, test_client: AsyncClient):
+        """Unknown patient -> 404."""
+        response = await test_client.get(
+            "/api/v1/inference/patients/UNKNOWN/vital-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_stored_vital_risk_unauthorized(self, test_client: AsyncClient):
+        """No token -> 401."""
+        response = await test_client.get(
+            "/api/v1/inference/patients/P001/vital-risk",
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+
+        assert response.status_code == 401
+
+
+class TestCurrentRiskAPI:
+    @pytest.mark.asyncio
+    async def test_current_risk_follows_vital_writes(self, test_client: AsyncClient, db_session: AsyncSession):
+        """GET /api/v1/inference/patients/{id}/current-risk reflects vitals posted through the API."""
+        patient_id = f"CUR_{uuid4().hex[:8]}"
+        db_session.add(
+            PatientModel(patient_id=patient_id, name="Test Patient", gender="M", birth_date=date(1990, 1, 1))
+        )
+        await db_session.commit()
+
+        for vital_type, value in [("HR", 130), ("SBP", 85)]:
+            response = await test_client.post(
+                "/api/v1/vitals",
+                headers={"Authorization": "Bearer test-bearer-token"},
+                json={
+                    "patient_id": patient_id,
+                    "recorded_at": "2024-01-01T10:00:00Z",
+                    "vital_type": vital_type,
+                    "value": value,
+                },
+            )
+            assert response.status_code == 201
+
+        response = await test_client.get(
+            f"/api/v1/inference/patients/{patient_id}/current-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["risk_level"] == "MEDIUM"
+        assert data["checked_rules"] == ["HR > 120", "SBP < 90"]
+        assert data["vitals"] == {"HR": 130.0, "SBP": 85.0}
+
+    @pytest.mark.asyncio
+    async def test_current_risk_patient_not_found(self, test_client: AsyncClient):
+        """Unknown patient -> 404."""
+        response = await test_client.get(
+            "/api/v1/inference/patients/UNKNOWN/current-risk",
+            headers={"Authorization": "Bearer test-bearer-token"},
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_current_risk_unauthorized(self, test_client: AsyncClient):
+        """No token -> 401."""
+        response = await test_client.get("/api/v1/inference/patients/P001/current-risk")
+
+        assert response.status_code == 401
+
+
+class TestInferenceCacheStatsAPI:
+    @pytest.mark.asyncio
+    async def test_cache_stats_success(self, test_client: AsyncClient):
+        """GET /api/v1/inference/cache/stats -> 200 with the cache counters."""
+        response = await test_client.get(
+            "/api/v1/inference/cache/stats",
+            headers={"Authorization": "Bearer test-bearer-token"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_size"] > 0
+        assert {"size", "hits", "misses", "evictions", "expirations", "hit_ratio"} <= data.keys()
+
+    @pytest.mark.asyncio
+    async def test_cache_stats_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.get("/api/v1/inference/cache/stats")
+
+        assert response.status_code == 401
@@ -0,0 +1,112 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+HEADERS = {"Authorization": "Bearer test-bearer-token"}
+
+
+async def create_patient(test_client: AsyncClient) -> str:
+    patient_id = f"SQL_{uuid4().hex[:8]}"
+    response = await test_client.post(
+        "/api/v1/patients",
+        headers=HEADERS,
+        json={"patient_id": patient_id, "name": "Count Patient", "gender": "M", "birth_date": "1990-01-01"},
+    )
+    assert response.status_code == 201
+    return patient_id
+
+
+class TestStatementCounts:
+    """Round-trips per request; a failing count means a path grew a query (e.g. a refresh)."""
+
+    @pytest.mark.asyncio
+    async def test_create_patient(self, test_client: AsyncClient, statements: list[str]):
+        await create_patient(test_client)
+
+        assert len(statements) == 1  # INSERT ... ON CONFLICT DO NOTHING RETURNING
+
+    @pytest.mark.asyncio
+    async def test_create_vital(self, test_client: AsyncClient, statements: list[str]):
+        patient_id = await create_patient(test_client)
+        body = {"patient_id": patient_id, "recorded_at": "2024-01-01T00:00:00Z", "vital_type": "HR", "value": 130}
+        await test_client.post("/api/v1/vitals", headers=HEADERS, json=body)  # Creates the current-risk row
+        statements.clear()
+
+        response = await test_client.post(
+            "/api/v1/vitals", headers=HEADERS, json={**body, "recorded_at": "2024-01-01T00:01:00Z"}
+        )
+
+        assert response.status_code == 201
+        # INSERT vitals RETURNING, then the current-risk row: INSERT ON CONFLICT DO UPDATE RETURNING, UPDATE
+        assert len(statements) == 3
+
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk(self, test_client: AsyncClient, statements: list[str]):
+        patient_id = await create_patient(test_client)
+        items = [
+            {"patient_id": patient_id, "recorded_at": "2024-01-01T00:00:00Z", "vital_type": vital_type, "value": 80}
+            for vital_type in ("HR", "SBP", "SpO2")
+        ]
+        await test_client.post("/api/v1/vitals", headers=HEADERS, json=items[0])  # Creates the current-risk row
+        statements.clear()
+
+        response = await test_client.post("/api/v1/vitals/bulk", headers=HEADERS, json={"items": items})
+
+        assert response.status_code == 201
+        # Patient lookup, one multi-row INSERT RETURNING, then the current-risk row as for a single vital
+        assert len(statements) == 4
+
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk_many_patients(self, test_client: AsyncClient, statements: list[str]):
+        patient_ids = [await create_patient(test_client) for _ in range(3)]
+        items = [
+            {"patient_id": patient_id, "recorded_at": "2024-01-01T00:00:00Z", "vital_type": "HR", "value": 80}
+            for patient_id in patient_ids
+        ]
+        for item in items:
+            await test_client.post("/api/v1/vitals", headers=HEADERS, json=item)  # Creates the current-risk rows
+        statements.clear()
+
+        response = await test_client.post(
+            "/api/v1/vitals/bulk",
+            headers=HEADERS,
+            json={"items": [{**item, "recorded_at": "2024-01-01T00:01:00Z"} for item in items]},
+        )
+
+        assert response.status_code == 201
+        # Patient lookup, one multi-row INSERT RETURNING, one upsert locking every current-risk row, an UPDATE each
+        assert len(statements) == 3 + len(patient_ids)
+
+    @pytest.mark.asyncio
+    async def test_get_latest_vitals(self, test_client: AsyncClient, statements: list[str]):
+        patient_ids = [await create_patient(test_client) for _ in range(3)]
+        for patient_id in patient_ids:
+            body = {"patient_id": patient_id, "recorded_at": "2024-01-01T00:00:00Z", "vital_type": "HR", "value": 80}
+            await test_client.post("/api/v1/vitals", headers=HEADERS, json=body)
+        statements.clear()
+
+        response = await test_client.get(
+            "/api/v1/vitals/latest", headers=HEADERS, params=[("patient_id", patient_id) for patient_id in patient_ids]
+        )
+
+        assert response.status_code == 200
+        assert len(statements) == 1  # One patient_risks lookup for all patients
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_for_patients(self, test_client: AsyncClient, statements: list[str]):
+        patient_ids = [await create_patient(test_client) for _ in range(3)]
+        statements.clear()
+
+        response = await test_client.get(
+            "/api/v1/vitals/patients",
+            headers=HEADERS,
+            params=[
+                *(("patient_id", patient_id) for patient_id in patient_ids),
+                ("from", "2024-01-01T00:00:00Z"),
+                ("to", "2024-01-02T00:00:00Z"),
+            ],
+        )
+
+        assert response.status_code == 200
+        assert len(statements) == 1  # One patient_id = ANY(...) query for all patients
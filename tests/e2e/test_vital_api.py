@@ -1,4 +1,5 @@
-from datetime import UTC, date, datetime
+import json
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from uuid import uuid4
 
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.models.patient_model import PatientModel
 from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.vital_archive import vital_archive
 
 BEARER_TOKEN = "test-bearer-token"
 AUTH_HEADERS = {"Authorization": f"Bearer {BEARER_TOKEN}"}
@@ -121,6 +123,76 @@ class TestCreateVital:
         assert response.status_code == 401
 
 
+class TestCreateVitalsBulk:
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk_success(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"BULK_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        await db_session.commit()
+
+        response = await test_client.post(
+            "/api/v1/vitals/bulk",
+            headers=AUTH_HEADERS,
+            json={
+                "items": [
+                    {
+                        "patient_id": patient_id,
+                        "recorded_at": "2024-01-01T10:00:00Z",
+                        "vital_type": vital_type,
+                        "value": value,
+                    }
+                    for vital_type, value in [("HR", 72.0), ("SBP", 120.0), ("SpO2", 97.5)]
+                ]
+            },
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["errors"] == []
+        assert [v["vital_type"] for v in data["created"]] == ["HR", "SBP", "SpO2"]
+        assert data["created"][2]["value"] == 97.5
+
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk_partial_failure(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"BULK_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        await db_session.commit()
+
+        response = await test_client.post(
+            "/api/v1/vitals/bulk",
+            headers=AUTH_HEADERS,
+            json={
+                "items": [
+                    {
+                        "patient_id": pid,
+                        "recorded_at": "2024-01-01T10:00:00Z",
+                        "vital_type": "HR",
+                        "value": 72.0,
+                    }
+                    for pid in ["UNKNOWN_PATIENT", patient_id]
+                ]
+            },
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert len(data["created"]) == 1
+        assert data["errors"][0]["index"] == 0
+        assert "not found" in data["errors"][0]["detail"].lower()
+
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk_empty(self, test_client: AsyncClient):
+        response = await test_client.post(
+            "/api/v1/vitals/bulk",
+            headers=AUTH_HEADERS,
+            json={"items": []},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_create_vitals_bulk_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.post("/api/v1/vitals/bulk", json={"items": []})
+        assert response.status_code == 401
+
+
 class TestGetVitals:
     @pytest.mark.asyncio
     async def test_get_vitals_success(self, test_client: AsyncClient, db_session: AsyncSession):
@@ -219,6 +291,48 @@ class TestGetVitals:
         data = response.json()
         assert data["items"] == []
 
+    @pytest.mark.asyncio
+    async def test_get_vitals_pagination(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"PAGE_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        for hour in [8, 10, 12]:
+            await create_test_vital(db_session, patient_id, datetime(2024, 1, 1, hour, 0, 0, tzinfo=UTC))
+        await db_session.commit()
+
+        params = {"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "limit": 2}
+        first = await test_client.get(f"/api/v1/vitals/patient/{patient_id}", headers=AUTH_HEADERS, params=params)
+        assert first.status_code == 200
+        assert len(first.json()["items"]) == 2
+        assert first.json()["next_cursor"] is not None
+
+        second = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}",
+            headers=AUTH_HEADERS,
+            params={**params, "cursor": first.json()["next_cursor"]},
+        )
+        assert second.status_code == 200
+        assert [item["recorded_at"] for item in second.json()["items"]] == ["2024-01-01T12:00:00Z"]
+        assert second.json()["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_limit_too_large(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patient/P001",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "limit": 100000},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_invalid_cursor(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patient/P001",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "cursor": "garbage"},
+        )
+        assert response.status_code == 400
+        assert "cursor" in response.json()["detail"].lower()
+
     @pytest.mark.asyncio
     async def test_get_vitals_unauthorized(self, test_client: AsyncClient):
         response = await test_client.get(
@@ -231,6 +345,134 @@ class TestGetVitals:
         assert response.status_code == 401
 
 
+class TestGetVitalsForPatients:
+    @pytest.mark.asyncio
+    async def test_get_vitals_for_patients_grouped(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_ids = [f"MULTI_{uuid4().hex[:8]}" for _ in range(3)]
+        for patient_id in patient_ids:
+            await create_test_patient(db_session, patient_id)
+        for hour, vital_type in [(10, "HR"), (11, "SpO2"), (12, "RR")]:
+            await create_test_vital(db_session, patient_ids[0], datetime(2024, 1, 1, hour, tzinfo=UTC), vital_type)
+        await create_test_vital(db_session, patient_ids[1], datetime(2024, 1, 1, 9, tzinfo=UTC), "HR", 65.0)
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/v1/vitals/patients",
+            headers=AUTH_HEADERS,
+            params=[
+                *(("patient_id", patient_id) for patient_id in reversed(patient_ids)),
+                ("from", "2024-01-01T00:00:00Z"),
+                ("to", "2024-01-01T23:59:59Z"),
+                ("vital_type", "SpO2"),
+                ("vital_type", "HR"),
+            ],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["vital_types"] == ["HR", "SpO2"]
+        assert [series["patient_id"] for series in data["patients"]] == list(reversed(patient_ids))
+        items = {series["patient_id"]: series["items"] for series in data["patients"]}
+        assert [item["vital_type"] for item in items[patient_ids[0]]] == ["HR", "SpO2"]
+        assert items[patient_ids[1]] == [{"recorded_at": "2024-01-01T09:00:00Z", "vital_type": "HR", "value": 65.0}]
+        assert items[patient_ids[2]] == []
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_for_patients_pagination(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_ids = [f"MULTI_{uuid4().hex[:8]}" for _ in range(2)]
+        for patient_id in patient_ids:
+            await create_test_patient(db_session, patient_id)
+            for minute in range(3):
+                await create_test_vital(db_session, patient_id, datetime(2024, 1, 2, 10, minute, tzinfo=UTC))
+        await db_session.commit()
+
+        params = [
+            *(("patient_id", patient_id) for patient_id in patient_ids),
+            ("from", "2024-01-02T00:00:00Z"),
+            ("to", "2024-01-02T23:59:59Z"),
+            ("limit", "4"),
+        ]
+        seen: dict[str, int] = {}
+        cursor = None
+        for _ in range(3):
+            response = await test_client.get(
+                "/api/v1/vitals/patients",
+                headers=AUTH_HEADERS,
+                params=params + ([("cursor", cursor)] if cursor else []),
+            )
+            assert response.status_code == 200
+            data = response.json()
+            for series in data["patients"]:
+                seen[series["patient_id"]] = seen.get(series["patient_id"], 0) + len(series["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        assert cursor is None
+        assert seen == {patient_id: 3 for patient_id in patient_ids}
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_for_patients_invalid_cursor(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patients",
+            headers=AUTH_HEADERS,
+            params={"patient_id": "P001", "from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "cursor": "x"},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_get_vitals_for_patients_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patients",
+            params={"patient_id": "P001", "from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+        assert response.status_code == 401
+
+
+class TestGetLatestVitals:
+    @pytest.mark.asyncio
+    async def test_get_latest_vitals_success(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_ids = [f"LAT_{uuid4().hex[:8]}" for _ in range(2)]
+        for patient_id in patient_ids:
+            await create_test_patient(db_session, patient_id)
+        await db_session.commit()
+        for hour, vital_type, value in [(10, "HR", 80), (11, "HR", 90), (9, "SpO2", 97)]:
+            response = await test_client.post(
+                "/api/v1/vitals",
+                headers=AUTH_HEADERS,
+                json={
+                    "patient_id": patient_ids[0],
+                    "recorded_at": f"2024-01-01T{hour:02d}:00:00Z",
+                    "vital_type": vital_type,
+                    "value": value,
+                },
+            )
+            assert response.status_code == 201
+
+        response = await test_client.get(
+            "/api/v1/vitals/latest",
+            headers=AUTH_HEADERS,
+            params=[("patient_id", patient_ids[0]), ("patient_id", "LAT_MISSING"), ("patient_id", patient_ids[1])],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["patient_id"] for item in data["items"]] == patient_ids
+        assert data["not_found"] == ["LAT_MISSING"]
+        vitals = data["items"][0]["vitals"]
+        assert {vital_type: entry["value"] for vital_type, entry in vitals.items()} == {"HR": 90.0, "SpO2": 97.0}
+        assert vitals["HR"]["recorded_at"] == "2024-01-01T11:00:00Z"
+        assert data["items"][1]["vitals"] == {}
+
+    @pytest.mark.asyncio
+    async def test_get_latest_vitals_requires_patient_id(self, test_client: AsyncClient):
+        response = await test_client.get("/api/v1/vitals/latest", headers=AUTH_HEADERS)
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_get_latest_vitals_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.get("/api/v1/vitals/latest", params={"patient_id": "P001"})
+        assert response.status_code == 401
+
+
 class TestUpdateVital:
     @pytest.mark.asyncio
     async def test_update_vital_success(self, test_client: AsyncClient, db_session: AsyncSession):
@@ -330,3 +572,156 @@ class TestUpdateVital:
         )
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
+
+
+class TestStreamVitals:
+    @pytest.mark.asyncio
+    async def test_stream_vitals_ndjson(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"STREAM_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        for minute in range(3):
+            await create_test_vital(
+                db_session, patient_id, datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC), value=70.0 + minute
+            )
+        await create_test_vital(db_session, patient_id, datetime(2024, 1, 1, 10, 5, 0, tzinfo=UTC), vital_type="RR")
+        await db_session.commit()
+
+        async with test_client.stream(
+            "GET",
+            f"/api/v1/vitals/patient/{patient_id}/stream",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "vital_type": "HR"},
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(line) async for line in response.aiter_lines() if line]
+
+        assert [line["value"] for line in lines] == [70.0, 71.0, 72.0]
+        assert datetime.fromisoformat(lines[0]["recorded_at"]) == datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_stream_vitals_empty(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patient/UNKNOWN/stream",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+        assert response.status_code == 200
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_stream_vitals_unauthorized(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patient/P001/stream",
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z"},
+        )
+        assert response.status_code == 401
+
+
+class TestAggregateVitals:
+    @pytest.mark.asyncio
+    async def test_aggregate_vitals_bucketed(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"AGG_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        for minute, value in [(0, 95.0), (1, 97.0), (61, 90.0)]:
+            await create_test_vital(
+                db_session,
+                patient_id,
+                datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC) + timedelta(minutes=minute),
+                vital_type="SpO2",
+                value=value,
+            )
+        await db_session.commit()
+
+        response = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}/aggregate",
+            headers=AUTH_HEADERS,
+            params={
+                "from": "2024-01-01T00:00:00Z",
+                "to": "2024-01-01T23:59:59Z",
+                "vital_type": "SpO2",
+                "bucket": "1h",
+                "agg": "max",
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bucket"] == "1h"
+        assert data["agg"] == "max"
+        assert data["items"] == [
+            {"recorded_at": "2024-01-01T10:00:00Z", "value": 97.0},
+            {"recorded_at": "2024-01-01T11:00:00Z", "value": 90.0},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aggregate_vitals_downsampled(self, test_client: AsyncClient, db_session: AsyncSession):
+        patient_id = f"AGG_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        for minute in range(10):
+            await create_test_vital(
+                db_session, patient_id, datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC), value=70.0 + minute
+            )
+        await db_session.commit()
+
+        response = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}/aggregate",
+            headers=AUTH_HEADERS,
+            params={
+                "from": "2024-01-01T00:00:00Z",
+                "to": "2024-01-01T23:59:59Z",
+                "vital_type": "HR",
+                "max_points": 4,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bucket"] is None
+        assert len(data["items"]) == 4
+        assert data["items"][0]["value"] == 70.0
+        assert data["items"][-1]["value"] == 79.0
+
+    @pytest.mark.asyncio
+    async def test_aggregate_vitals_requires_bucket_or_max_points(self, test_client: AsyncClient):
+        response = await test_client.get(
+            "/api/v1/vitals/patient/P001/aggregate",
+            headers=AUTH_HEADERS,
+            params={"from": "2024-01-01T00:00:00Z", "to": "2024-01-01T23:59:59Z", "vital_type": "HR"},
+        )
+        assert response.status_code == 422
+
+
+class TestArchivedWindows:
+    @pytest.fixture
+    def archive_enabled(self, tmp_path):
+        vital_archive.configure(tmp_path, timedelta(hours=72))
+        yield
+        vital_archive.configure(None, timedelta(hours=72))
+
+    @pytest.mark.asyncio
+    async def test_naive_from_is_read_as_utc(
+        self, test_client: AsyncClient, db_session: AsyncSession, archive_enabled: None
+    ):
+        """Naive bounds are UTC: the list merges the archive, hot-only routes reject the window with 422."""
+        patient_id = f"ARCH_{uuid4().hex[:8]}"
+        await create_test_patient(db_session, patient_id)
+        await create_test_vital(db_session, patient_id, datetime(2025, 12, 1, 10, 0, 0, tzinfo=UTC))
+        await db_session.commit()
+        window = {"from": "2025-12-01T00:00:00", "to": "2025-12-01T23:59:59"}
+
+        listed = await test_client.get(f"/api/v1/vitals/patient/{patient_id}", headers=AUTH_HEADERS, params=window)
+        streamed = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}/stream", headers=AUTH_HEADERS, params=window
+        )
+        aggregated = await test_client.get(
+            f"/api/v1/vitals/patient/{patient_id}/aggregate",
+            headers=AUTH_HEADERS,
+            params={**window, "vital_type": "HR", "max_points": 10},
+        )
+        evaluated = await test_client.get(
+            f"/api/v1/inference/patients/{patient_id}/vital-risk", headers=AUTH_HEADERS, params=window
+        )
+
+        assert listed.status_code == 200
+        assert len(listed.json()["items"]) == 1
+        assert [streamed.status_code, aggregated.status_code, evaluated.status_code] == [422, 422, 422]
+        assert "archived" in streamed.json()["detail"]
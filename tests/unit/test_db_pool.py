@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.config import get_settings
+from app.infrastructure.database import build_engine, engine_options
+from app.infrastructure.db_pool import InstrumentedNullPool, PoolWaitStats, pool_status
+
+settings = get_settings()
+
+
+def pool_settings(**overrides):
+    return settings.model_copy(update=overrides)
+
+
+def test_wait_histogram_buckets():
+    stats = PoolWaitStats()
+
+    for wait in (0.0002, 0.001, 0.03, 12.0):
+        stats.record(wait)
+
+    assert stats.checkouts == 4
+    assert stats.max_wait == 12.0
+    assert stats.histogram[0] == 2  # Bucket bounds are inclusive
+    assert stats.histogram[PoolWaitStats.BUCKETS.index(0.05)] == 1
+    assert stats.histogram[-1] == 1
+
+
+async def test_checkouts_are_counted():
+    engine = build_engine(settings.TEST_DATABASE_URL, pool_settings(DB_POOL_SIZE=2))
+    try:
+        for _ in range(3):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        status = pool_status(engine.pool)
+    finally:
+        await engine.dispose()
+
+    assert status["pool_class"] == "InstrumentedQueuePool"
+    assert status["size"] == 2
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 3
+    assert status["timeouts"] == 0
+    assert sum(status["wait_histogram"].values()) == 3
+
+
+async def test_exhausted_pool_counts_timeout():
+    engine = build_engine(
+        settings.TEST_DATABASE_URL, pool_settings(DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.05)
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                await asyncio.wait_for(engine.connect().__aenter__(), timeout=5)
+        status = pool_status(engine.pool)
+    finally:
+        await engine.dispose()
+
+    assert status["checkouts"] == 2
+    assert status["timeouts"] == 1
+    assert status["wait_seconds_max"] >= 0.05
+
+
+async def test_pgbouncer_mode_disables_statement_caching():
+    options = engine_options(pool_settings(DB_PGBOUNCER=True))
+
+    assert options["poolclass"] is InstrumentedNullPool
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    name_func = options["connect_args"]["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+    engine = build_engine(settings.TEST_DATABASE_URL, pool_settings(DB_PGBOUNCER=True))
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT CAST(:n AS int)"), {"n": 1})).scalar() == 1
+        status = pool_status(engine.pool)
+    finally:
+        await engine.dispose()
+
+    assert status["size"] is None
+    assert status["checkouts"] == 1
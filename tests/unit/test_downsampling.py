@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domain.downsampling import lttb
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def series(values: list[float]) -> list[tuple[datetime, float]]:
+    return [(START + timedelta(seconds=i), value) for i, value in enumerate(values)]
+
+
+class TestLttb:
+    def test_keeps_short_series(self):
+        """Series at or below the threshold are returned unchanged."""
+        points = series([1.0, 2.0, 3.0])
+        assert lttb(points, 3) == points
+
+    def test_reduces_to_threshold_keeping_endpoints(self):
+        """Output has exactly threshold points and keeps first and last."""
+        points = series([float(i % 7) for i in range(1000)])
+        sampled = lttb(points, 50)
+
+        assert len(sampled) == 50
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert [p[0] for p in sampled] == sorted(p[0] for p in sampled)
+
+    def test_preserves_spike(self):
+        """A single outlier survives downsampling."""
+        values = [60.0] * 500
+        values[250] = 180.0
+        sampled = lttb(series(values), 10)
+
+        assert max(value for _, value in sampled) == 180.0
+
+    def test_threshold_too_small(self):
+        """Threshold below 3 is rejected."""
+        with pytest.raises(ValueError):
+            lttb(series([1.0, 2.0, 3.0, 4.0]), 2)
@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+from app.application.inference_executor import InferenceExecutor, pack_batch, unpack_batch
+from app.domain.inference import ExecutionMode, InferenceFactory, RuleBasedInference, to_columns
+
+VITALS = [
+    {"HR": 130, "SBP": 85, "SpO2": 88},
+    {"HR": 80, "SBP": 120},
+    {"SpO2": 85},
+    {},
+]
+
+
+@pytest.fixture
+def strategy():
+    """Register a throwaway strategy (RuleBasedInference by default) and clean it up afterwards."""
+    names = []
+
+    def register(name, mode=ExecutionMode.INLINE, strategy_class=RuleBasedInference, **options):
+        InferenceFactory.register(name, strategy_class, execution_mode=mode, **options)
+        names.append(name)
+        return name
+
+    yield register
+    InferenceExecutor.shutdown()
+    for name in names:
+        for registry in (
+            InferenceFactory._strategies,
+            InferenceFactory._options,
+            InferenceFactory._execution_modes,
+            InferenceFactory._instances,
+        ):
+            registry.pop(name, None)
+        InferenceFactory.result_cache.invalidate(name)
+
+
+def test_pack_round_trip():
+    """Packed batches unpack to the same scores, levels and matches."""
+    batch = RuleBasedInference().evaluate_batch(to_columns(VITALS), len(VITALS))
+
+    restored = unpack_batch(pack_batch(batch))
+
+    np.testing.assert_array_equal(restored.risk_scores, batch.risk_scores)
+    assert list(restored.risk_levels) == list(batch.risk_levels)
+    np.testing.assert_array_equal(restored.matched, batch.matched)
+    assert [restored.result(i) for i in range(len(VITALS))] == [batch.result(i) for i in range(len(VITALS))]
+
+
+def test_unknown_execution_mode_strategy():
+    with pytest.raises(ValueError, match="Unknown inference strategy"):
+        InferenceFactory.execution_mode("missing")
+
+
+@pytest.mark.parametrize("mode", [ExecutionMode.THREAD, ExecutionMode.PROCESS])
+async def test_offloaded_matches_inline(strategy, mode):
+    """Thread and process execution give the same results as evaluating inline."""
+    name = strategy(f"rule_based_{mode}", mode)
+    inline = RuleBasedInference()
+
+    batch = await InferenceExecutor.evaluate_batch(name, to_columns(VITALS), len(VITALS))
+    single = await InferenceExecutor.evaluate(name, VITALS[0])
+
+    assert [batch.result(i) for i in range(len(VITALS))] == [inline.evaluate(v) for v in VITALS]
+    assert single == inline.evaluate(VITALS[0])
+
+
+async def test_process_strategy_not_built_in_parent(strategy):
+    """Process-mode strategies are only constructed inside the workers."""
+    name = strategy("rule_based_worker_only", ExecutionMode.PROCESS)
+
+    InferenceFactory.startup()
+    await InferenceExecutor.evaluate(name, VITALS[0])
+
+    assert name not in InferenceFactory._instances
+
+
+async def test_reregister_restarts_process_pool(strategy):
+    name = strategy("rule_based_restart", ExecutionMode.PROCESS)
+    await InferenceExecutor.evaluate(name, VITALS[0])
+    first_pool = InferenceExecutor._process_pool
+
+    strategy("rule_based_other", ExecutionMode.PROCESS)
+    result = await InferenceExecutor.evaluate("rule_based_other", VITALS[1])
+
+    assert InferenceExecutor._process_pool is not first_pool
+    assert result == RuleBasedInference().evaluate(VITALS[1])
+
+
+class CachedRuleInference(RuleBasedInference):
+    CACHE_RESULTS = True
+
+
+class CountingInference(CachedRuleInference):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = 0
+
+    def evaluate(self, vitals):
+        self.evaluated += 1
+        return super().evaluate(vitals)
+
+
+async def test_repeat_evaluation_is_cached(strategy):
+    """A repeated record is answered from the result cache until the strategy is registered again."""
+    name = strategy("counting", strategy_class=CountingInference)
+    counting = InferenceFactory.get(name)
+
+    first = await InferenceExecutor.evaluate(name, {"HR": 130.0, "SBP": 85.0})
+    again = await InferenceExecutor.evaluate(name, {"SBP": 85.0, "HR": 130.0})
+
+    assert again is first
+    assert counting.evaluated == 1
+
+    strategy(name, strategy_class=CountingInference)
+    await InferenceExecutor.evaluate(name, {"HR": 130.0, "SBP": 85.0})
+
+    assert InferenceFactory.get(name).evaluated == 1  # The new instance had to evaluate
+
+
+async def test_cache_key_follows_rule_version(strategy, tmp_path):
+    """Reloaded rules change the strategy version, so earlier cached results are not served."""
+    rules = tmp_path / "rules.json"
+    rules.write_text(
+        '{"version": "v1", "score_ladder": [{"score": 0.1, "level": "LOW"}, {"score": 0.9, "level": "HIGH"}],'
+        ' "rules": [{"vital_type": "HR", "op": ">", "threshold": 120}]}'
+    )
+    name = strategy("rules_file_cached", strategy_class=CachedRuleInference, rules_path=rules, reload_interval=0)
+    assert (await InferenceExecutor.evaluate(name, {"HR": 110.0})).risk_score == 0.1
+
+    rules.write_text(rules.read_text().replace('"v1"', '"v2"').replace("120", "100"))
+
+    assert (await InferenceExecutor.evaluate(name, {"HR": 110.0})).risk_score == 0.9
+
+
+async def test_thread_mode_is_cached_on_quantized_vitals(strategy):
+    """Off-loop strategies are cached even with CACHE_RESULTS = False; jitter below 2 decimals hits."""
+    name = strategy("rule_based_thread", ExecutionMode.THREAD)
+    before = InferenceFactory.result_cache.stats()
+
+    first = await InferenceExecutor.evaluate(name, {"HR": 130.001, "SBP": 85.0})
+    again = await InferenceExecutor.evaluate(name, {"HR": 129.999, "SBP": 85.0})
+
+    after = InferenceFactory.result_cache.stats()
+    assert again is first
+    assert (after.hits - before.hits, after.misses - before.misses) == (1, 1)
+
+
+async def test_rule_based_inline_is_not_cached():
+    before = InferenceFactory.result_cache.stats()
+
+    await InferenceExecutor.evaluate("rule_based", VITALS[0])
+    await InferenceExecutor.evaluate("rule_based", VITALS[0])
+
+    assert InferenceFactory.result_cache.stats() == before
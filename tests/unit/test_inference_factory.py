@@ -36,3 +36,55 @@ class TestInferenceFactory:
 
         # Cleanup - remove custom strategy
         del InferenceFactory._strategies["custom"]
+
+    def test_get_reuses_instance(self):
+        """Stateless strategies are created once and shared."""
+        assert InferenceFactory.get("rule_based") is InferenceFactory.get("rule_based")
+
+    def test_lifecycle_hooks(self):
+        """startup() runs when the instance is created; shutdown() on re-register and factory shutdown."""
+        events = []
+
+        class StatefulInference(BaseInference):
+            def startup(self) -> None:
+                events.append(("startup", self))
+
+            def shutdown(self) -> None:
+                events.append(("shutdown", self))
+
+            def evaluate(self, vitals: dict[str, float]) -> InferenceResult:
+                return InferenceResult(0.0, RiskLevel.LOW, [])
+
+        InferenceFactory.register("stateful", StatefulInference)
+        try:
+            first = InferenceFactory.get("stateful")
+            assert InferenceFactory.get("stateful") is first
+
+            InferenceFactory.register("stateful", StatefulInference)
+            second = InferenceFactory.get("stateful")
+            assert second is not first
+
+            InferenceFactory.shutdown()
+            assert events == [("startup", first), ("shutdown", first), ("startup", second), ("shutdown", second)]
+
+            InferenceFactory.startup()
+            assert isinstance(InferenceFactory.get("rule_based"), RuleBasedInference)
+        finally:
+            del InferenceFactory._strategies["stateful"]
+            InferenceFactory._instances.pop("stateful", None)
+            InferenceFactory._options.pop("stateful", None)
+
+    def test_register_with_options(self, tmp_path):
+        """Registration options are passed to the strategy constructor."""
+        path = tmp_path / "rules.json"
+        path.write_text('{"version": "custom", "score_ladder": [{"score": 0.3, "level": "LOW"}], "rules": []}')
+
+        InferenceFactory.register("rules_file", RuleBasedInference, rules_path=path)
+        try:
+            inference = InferenceFactory.get("rules_file")
+            assert isinstance(inference, RuleBasedInference)
+            assert inference.version == "custom"
+        finally:
+            del InferenceFactory._strategies["rules_file"]
+            InferenceFactory._instances.pop("rules_file", None)
+            InferenceFactory._options.pop("rules_file", None)
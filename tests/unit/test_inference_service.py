@@ -1,7 +1,16 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
 
 from app.application.inference_service import InferenceService
+from app.application.stored_inference_service import StoredInferenceService
+from app.domain.exceptions import PatientNotFoundError, VitalNotFoundError, VitalWindowTooLargeError
+from app.domain.inference import AggregationPolicy, InferenceFactory, RuleBasedInference
 from app.domain.risk_level import RiskLevel
+from app.domain.vital_type import VitalType
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
 from app.presentation.schemas.inference_schema import InferenceRequest, VitalRecord
 
 
@@ -9,7 +18,7 @@ class TestInferenceService:
     def setup_method(self):
         self.service = InferenceService()
 
-    def test_evaluate_single_record(self):
+    async def test_evaluate_single_record(self):
         """Single record evaluation."""
         request = InferenceRequest(
             patient_id="P001",
@@ -21,14 +30,14 @@ class TestInferenceService:
             ],
         )
 
-        response = self.service.evaluate(request)
+        response = await self.service.evaluate(request)
 
         assert response.patient_id == "P001"
         assert response.risk_score == 0.5
         assert response.risk_level == RiskLevel.MEDIUM
         assert "HR > 120" in response.checked_rules
 
-    def test_evaluate_multiple_returns_max(self):
+    async def test_evaluate_multiple_returns_max(self):
         """Multiple records -> max risk_score."""
         request = InferenceRequest(
             patient_id="P001",
@@ -48,13 +57,13 @@ class TestInferenceService:
             ],
         )
 
-        response = self.service.evaluate(request)
+        response = await self.service.evaluate(request)
 
         assert response.risk_score == 0.9
         assert response.risk_level == RiskLevel.HIGH
         assert len(response.checked_rules) == 3
 
-    def test_response_has_evaluated_at(self):
+    async def test_response_has_evaluated_at(self):
         """Response includes evaluated_at."""
         before = datetime.now(UTC)
 
@@ -68,7 +77,165 @@ class TestInferenceService:
             ],
         )
 
-        response = self.service.evaluate(request)
+        response = await self.service.evaluate(request)
 
         after = datetime.now(UTC)
         assert before <= response.evaluated_at <= after
+
+    async def test_evaluate_many_per_patient_max(self):
+        """Each patient gets the max of its own records, in request order."""
+        requests = [
+            InferenceRequest(
+                patient_id=patient_id,
+                records=[
+                    VitalRecord(recorded_at=datetime(2024, 1, 1, hour, tzinfo=UTC), vitals=vitals)
+                    for hour, vitals in enumerate(records)
+                ],
+            )
+            for patient_id, records in [
+                ("P001", [{"HR": 80}, {"HR": 130, "SBP": 85}]),  # MEDIUM (0.7)
+                ("P002", [{"HR": 80, "SBP": 120, "SpO2": 98}]),  # LOW (0.2)
+                ("P003", [{"HR": 130, "SBP": 85, "SpO2": 85}, {"HR": 130}]),  # HIGH (0.9)
+            ]
+        ]
+
+        responses = await self.service.evaluate_many(requests)
+
+        assert [r.patient_id for r in responses] == ["P001", "P002", "P003"]
+        assert [r.risk_score for r in responses] == [0.7, 0.2, 0.9]
+        assert responses[0].checked_rules == ["HR > 120", "SBP < 90"]
+        assert responses[1].risk_level == RiskLevel.LOW
+        assert len({r.evaluated_at for r in responses}) == 1
+
+    async def test_evaluate_many_latest(self):
+        """Aggregation is chosen per request in a batch."""
+        records = [
+            VitalRecord(recorded_at=datetime(2024, 1, 1, 1, tzinfo=UTC), vitals={"HR": 130, "SBP": 85}),
+            VitalRecord(recorded_at=datetime(2024, 1, 1, 2, tzinfo=UTC), vitals={"HR": 80}),
+        ]
+        requests = [
+            InferenceRequest(patient_id="P001", records=records),
+            InferenceRequest(patient_id="P001", records=records, aggregation=AggregationPolicy.LATEST),
+        ]
+
+        responses = await self.service.evaluate_many(requests)
+
+        assert [r.risk_score for r in responses] == [0.7, 0.2]
+        assert responses[1].checked_rules == []
+
+    async def test_evaluate_latest(self):
+        """latest reports the most recent record, wherever it is in the list."""
+        request = InferenceRequest(
+            patient_id="P001",
+            records=[
+                VitalRecord(recorded_at=datetime(2024, 1, 1, 2, tzinfo=UTC), vitals={"HR": 130}),
+                VitalRecord(recorded_at=datetime(2024, 1, 1, 3, tzinfo=UTC), vitals={"SpO2": 85}),
+                VitalRecord(recorded_at=datetime(2024, 1, 1, 1, tzinfo=UTC), vitals={"HR": 130, "SBP": 85}),
+            ],
+            aggregation=AggregationPolicy.LATEST,
+        )
+
+        response = await self.service.evaluate(request)
+
+        assert response.risk_score == 0.5
+        assert response.checked_rules == ["SpO2 < 90"]
+
+    async def test_evaluate_time_weighted(self):
+        """time_weighted averages scores with weights halving per hour of age."""
+        request = InferenceRequest(
+            patient_id="P001",
+            records=[
+                VitalRecord(recorded_at=datetime(2024, 1, 1, 0, tzinfo=UTC), vitals={"HR": 130, "SBP": 85, "SpO2": 85}),
+                VitalRecord(recorded_at=datetime(2024, 1, 1, 1, tzinfo=UTC), vitals={"HR": 80}),
+            ],
+            aggregation=AggregationPolicy.TIME_WEIGHTED,
+        )
+
+        response = await self.service.evaluate(request)
+
+        # (0.5 * 0.9 + 1 * 0.2) / 1.5
+        assert response.risk_score == pytest.approx(0.65 / 1.5)
+        assert response.risk_level == RiskLevel.MEDIUM
+        assert response.checked_rules == ["HR > 120", "SBP < 90", "SpO2 < 90"]
+
+
+class CountingInference(RuleBasedInference):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = 0
+
+    def evaluate_batch(self, columns, size=None):
+        result = super().evaluate_batch(columns, size)
+        self.evaluated += len(result)
+        return result
+
+
+async def test_max_stops_at_max_score():
+    """Max aggregation stops once a chunk contains a record with the highest possible score."""
+    InferenceFactory.register("counting", CountingInference)
+    try:
+        records = [{"HR": 80}] * 10 + [{"HR": 130, "SBP": 85, "SpO2": 85}] + [{"HR": 130}] * 1000
+        request = InferenceRequest(
+            patient_id="P001",
+            records=[
+                VitalRecord(recorded_at=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=i), vitals=vitals)
+                for i, vitals in enumerate(records)
+            ],
+        )
+
+        response = await InferenceService("counting").evaluate(request)
+
+        assert response.risk_score == 0.9
+        assert response.checked_rules == ["HR > 120", "SBP < 90", "SpO2 < 90"]
+        assert InferenceFactory.get("counting").evaluated == InferenceService.FIRST_CHUNK
+    finally:
+        InferenceFactory._strategies.pop("counting", None)
+        InferenceFactory._instances.pop("counting", None)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_stored_pivots_by_recorded_at(db_session):
+    """Stored rows sharing a recorded_at are scored as one record."""
+    db_session.add(PatientModel(patient_id="INF_S001", name="Stored", gender="F", birth_date=date(1980, 1, 1)))
+    await db_session.flush()
+    t0 = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+    t1 = datetime(2024, 1, 1, 11, 0, tzinfo=UTC)
+    for recorded_at, vital_type, value in [
+        (t0, VitalType.HR, "130"),
+        (t0, VitalType.SBP, "85"),
+        (t1, VitalType.HR, "80"),
+        (t1, VitalType.SPO2, "85"),
+    ]:
+        db_session.add(
+            VitalModel(
+                patient_id="INF_S001", recorded_at=recorded_at, vital_type=vital_type.value, value=Decimal(value)
+            )
+        )
+    await db_session.flush()
+
+    service = StoredInferenceService(db_session)
+    response = await service.evaluate_stored("INF_S001", t0, t1)
+
+    assert response.patient_id == "INF_S001"
+    assert response.risk_score == 0.7
+    assert response.checked_rules == ["HR > 120", "SBP < 90"]
+
+    with pytest.raises(VitalNotFoundError):
+        await service.evaluate_stored("INF_S001", t1 + timedelta(hours=1), t1 + timedelta(hours=2))
+    with pytest.raises(PatientNotFoundError):
+        await service.evaluate_stored("INF_MISSING", t0, t1)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_stored_rejects_too_many_readings(db_session, monkeypatch):
+    t0 = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+    db_session.add(PatientModel(patient_id="INF_S002", name="Stored", gender="M", birth_date=date(1950, 1, 1)))
+    db_session.add_all(
+        VitalModel(patient_id="INF_S002", recorded_at=t0 + timedelta(minutes=m), vital_type="HR", value=80)
+        for m in range(4)
+    )
+    await db_session.flush()
+    monkeypatch.setattr(StoredInferenceService, "MAX_READINGS", 3)
+
+    with pytest.raises(VitalWindowTooLargeError):
+        await StoredInferenceService(db_session).evaluate_stored("INF_S002", t0, t0 + timedelta(hours=1))
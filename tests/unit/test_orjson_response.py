@@ -0,0 +1,60 @@
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.vital_service import VitalService
+from app.infrastructure.repositories.vital_repository import ArchivedValue
+from app.presentation.responses import ORJSONResponse
+from app.presentation.schemas.vital_schema import VitalListResponse, VitalMultiPatientListResponse
+
+
+class StaticRows:
+    """Stands in for VitalRepository, returning fixed rows."""
+
+    def __init__(self, rows: list[tuple]):
+        self.rows = rows
+
+    async def find_values_by_time_range(self, **_) -> list[tuple]:
+        return self.rows
+
+    async def find_values_for_patients(self, **_) -> list[tuple]:
+        return self.rows
+
+
+WINDOW = (datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC))
+
+
+@pytest.mark.asyncio
+async def test_payload_encodes_like_response_model(db_session: AsyncSession):
+    """The orjson body is byte-for-byte what pydantic writes for the same response model."""
+    service = VitalService(db_session)
+    service.vital_repo = StaticRows(
+        [
+            ArchivedValue(datetime(2024, 1, 1, 10, tzinfo=UTC), Decimal("72.00"), uuid4()),
+            # Parquet segments come back with ZoneInfo("UTC") rather than datetime.UTC
+            ArchivedValue(datetime(2024, 1, 1, 10, 0, 0, 450, tzinfo=ZoneInfo("UTC")), Decimal("36.55"), uuid4()),
+        ]
+    )
+
+    payload = await service.get_vitals_payload("P1", *WINDOW)
+
+    body = bytes(ORJSONResponse(payload).body)
+    assert body == VitalListResponse.model_validate(payload).model_dump_json().encode()
+    assert json.loads(body)["items"][1] == {"recorded_at": "2024-01-01T10:00:00.000450Z", "value": 36.55}
+
+
+@pytest.mark.asyncio
+async def test_multi_patient_payload_encodes_like_response_model(db_session: AsyncSession):
+    service = VitalService(db_session)
+    service.vital_repo = StaticRows([("P2", datetime(2024, 1, 1, 10, tzinfo=UTC), "HR", Decimal("80.00"), uuid4())])
+
+    payload = await service.get_vitals_for_patients_payload(["P1", "P2"], *WINDOW)
+
+    assert (
+        ORJSONResponse(payload).body == VitalMultiPatientListResponse.model_validate(payload).model_dump_json().encode()
+    )
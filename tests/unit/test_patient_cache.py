@@ -0,0 +1,77 @@
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.patient_service import PatientService
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.patient_cache import PatientExistenceCache, patient_existence_cache
+from app.infrastructure.repositories.patient_repository import PatientRepository
+from app.presentation.schemas.patient_schema import PatientCreateRequest
+
+
+class TestPatientExistenceCache:
+    def test_evicts_least_recently_used(self):
+        cache = PatientExistenceCache(max_size=2)
+        cache.add("P001")
+        cache.add("P002")
+        assert "P001" in cache  # P002 is now the least recently used
+
+        cache.add("P003")
+
+        assert "P002" not in cache
+        assert "P001" in cache
+        assert "P003" in cache
+
+    def test_discard(self):
+        cache = PatientExistenceCache()
+        cache.add("P001")
+
+        cache.discard("P001")
+        cache.discard("P404")
+
+        assert "P001" not in cache
+
+    def test_disabled(self):
+        cache = PatientExistenceCache(max_size=0)
+
+        cache.add("P001")
+
+        assert "P001" not in cache
+
+
+@pytest.mark.asyncio
+async def test_warm_loads_newest_patients(db_session: AsyncSession):
+    prefix = f"W{uuid4().hex[:6]}"
+    now = datetime.now(UTC) + timedelta(days=1)  # Newer than anything else in the table
+    for age in range(3):
+        db_session.add(
+            PatientModel(
+                patient_id=f"{prefix}_{age}",
+                name="Test Patient",
+                gender="F",
+                birth_date=date(1990, 1, 1),
+                created_at=now - timedelta(minutes=age),
+            )
+        )
+    await db_session.flush()
+    cache = PatientExistenceCache(max_size=2)
+
+    loaded = await cache.warm(PatientRepository(db_session))
+
+    assert loaded == 2
+    assert f"{prefix}_0" in cache
+    assert f"{prefix}_1" in cache
+    assert f"{prefix}_2" not in cache
+
+
+@pytest.mark.asyncio
+async def test_create_patient_adds_to_cache(db_session: AsyncSession):
+    patient_id = f"NEW_{uuid4().hex[:8]}"
+
+    await PatientService(db_session).create_patient(
+        PatientCreateRequest(patient_id=patient_id, name="Test Patient", gender="M", birth_date=date(1990, 1, 1))
+    )
+
+    assert patient_id in patient_existence_cache
@@ -0,0 +1,185 @@
+import operator
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.patient_risk_service import PatientRiskService
+from app.application.vital_service import VitalService
+from app.domain.exceptions import PatientNotFoundError
+from app.domain.inference import Rule, compile_rules
+from app.domain.risk_level import RiskLevel
+from app.domain.vital_type import VitalType
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
+from app.presentation.schemas.vital_schema import VitalBulkCreateRequest, VitalCreateRequest, VitalUpdateRequest
+
+
+async def create_patient(db_session: AsyncSession) -> str:
+    """Helper to create a patient and return its patient_id."""
+    patient_id = f"RISK_{uuid4().hex[:8]}"
+    db_session.add(PatientModel(patient_id=patient_id, name="Risk Patient", gender="F", birth_date=date(1980, 1, 1)))
+    await db_session.flush()
+    return patient_id
+
+
+def vital_request(patient_id: str, hour: int, vital_type: VitalType, value: float) -> VitalCreateRequest:
+    return VitalCreateRequest(
+        patient_id=patient_id,
+        recorded_at=datetime(2024, 1, 1, hour, tzinfo=UTC),
+        vital_type=vital_type,
+        value=value,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_vital_updates_current_risk(db_session: AsyncSession):
+    """Each write re-scores the changed type; older backfilled vitals do not replace newer ones."""
+    patient_id = await create_patient(db_session)
+    vital_service = VitalService(db_session)
+    risk_service = PatientRiskService(db_session)
+
+    await vital_service.create_vital(vital_request(patient_id, 10, VitalType.HR, 130))
+    await vital_service.create_vital(vital_request(patient_id, 10, VitalType.SBP, 85))
+    risk = await risk_service.get_current_risk(patient_id)
+    assert risk.risk_score == 0.7
+    assert risk.checked_rules == ["HR > 120", "SBP < 90"]
+    assert risk.vitals == {"HR": 130.0, "SBP": 85.0}
+
+    await vital_service.create_vital(vital_request(patient_id, 11, VitalType.HR, 80))
+    await vital_service.create_vital(vital_request(patient_id, 9, VitalType.HR, 150))
+    risk = await risk_service.get_current_risk(patient_id)
+    assert risk.checked_rules == ["SBP < 90"]
+    assert risk.risk_level == RiskLevel.MEDIUM
+    assert risk.vitals["HR"] == 80.0
+
+
+@pytest.mark.asyncio
+async def test_update_vital_type_change_falls_back(db_session: AsyncSession):
+    """Moving the latest vital to another type restores the previous latest of the old type."""
+    patient_id = await create_patient(db_session)
+    vital_service = VitalService(db_session)
+
+    await vital_service.create_vital(vital_request(patient_id, 9, VitalType.SPO2, 85))
+    latest = await vital_service.create_vital(vital_request(patient_id, 10, VitalType.SPO2, 97))
+    await vital_service.update_vital(latest.id, VitalUpdateRequest(vital_type=VitalType.SBP, value=85, version=1))
+
+    risk = await PatientRiskService(db_session).get_current_risk(patient_id)
+    assert risk.vitals == {"SpO2": 85.0, "SBP": 85.0}
+    assert risk.checked_rules == ["SBP < 90", "SpO2 < 90"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_updates_current_risk(db_session: AsyncSession):
+    """A bulk write scores each patient once with all of its vitals."""
+    first = await create_patient(db_session)
+    second = await create_patient(db_session)
+
+    await VitalService(db_session).create_vitals_bulk(
+        VitalBulkCreateRequest(
+            items=[
+                vital_request(first, 10, VitalType.HR, 130),
+                vital_request(second, 10, VitalType.HR, 80),
+                vital_request(first, 10, VitalType.SBP, 85),
+                vital_request(first, 10, VitalType.SPO2, 85),
+            ]
+        )
+    )
+
+    risk_service = PatientRiskService(db_session)
+    assert (await risk_service.get_current_risk(first)).risk_level == RiskLevel.HIGH
+    assert (await risk_service.get_current_risk(second)).risk_level == RiskLevel.LOW
+
+
+@pytest.mark.asyncio
+async def test_get_current_risk_rebuilds_missing_state(db_session: AsyncSession):
+    """Vitals written outside the service are picked up the first time the risk is read."""
+    patient_id = await create_patient(db_session)
+    for vital_type, value in [(VitalType.HR, 130), (VitalType.SPO2, 85)]:
+        db_session.add(
+            VitalModel(
+                patient_id=patient_id,
+                recorded_at=datetime(2024, 1, 1, 10, tzinfo=UTC),
+                vital_type=vital_type.value,
+                value=value,
+            )
+        )
+    await db_session.flush()
+
+    risk = await PatientRiskService(db_session).get_current_risk(patient_id)
+
+    assert risk.checked_rules == ["HR > 120", "SpO2 < 90"]
+
+
+@pytest.mark.asyncio
+async def test_reloaded_rules_rebuild_current_risk(db_session: AsyncSession):
+    """A rule added by a reload fires on an unchanged vital type, on read and on the next write."""
+    patient_id = await create_patient(db_session)
+    vital_service = VitalService(db_session)
+    risk_service = PatientRiskService(db_session)
+    await vital_service.create_vital(vital_request(patient_id, 10, VitalType.RR, 30))
+    assert (await risk_service.get_current_risk(patient_id)).checked_rules == []
+
+    inference = risk_service.inference
+    builtin = inference.compiled
+    inference.compiled = compile_rules(
+        [*inference.RULES, Rule("RR > 25", VitalType.RR, operator.gt, 25)], inference.SCORES, inference.LEVELS, "v2"
+    )
+    try:
+        assert (await risk_service.get_current_risk(patient_id)).checked_rules == ["RR > 25"]
+
+        inference.compiled = builtin
+        await vital_service.create_vital(vital_request(patient_id, 11, VitalType.HR, 130))
+        risk = await risk_service.get_current_risk(patient_id)
+        assert risk.checked_rules == ["HR > 120"]  # RR > 25 is gone with the v2 rules
+    finally:
+        inference.compiled = builtin
+
+
+@pytest.mark.asyncio
+async def test_get_current_risk_patient_not_found(db_session: AsyncSession):
+    with pytest.raises(PatientNotFoundError):
+        await PatientRiskService(db_session).get_current_risk("RISK_MISSING")
+
+
+@pytest.mark.asyncio
+async def test_get_latest_vitals_for_many_patients(db_session: AsyncSession, statements: list[str]):
+    """Patients with a snapshot, without one yet, and unknown IDs are answered in request order."""
+    tracked = await create_patient(db_session)
+    untracked = await create_patient(db_session)
+    other_untracked = await create_patient(db_session)
+    await VitalService(db_session).create_vital(vital_request(tracked, 10, VitalType.HR, 130))
+    await VitalService(db_session).create_vital(vital_request(tracked, 9, VitalType.HR, 150))
+    db_session.add_all(
+        VitalModel(
+            patient_id=patient_id,
+            recorded_at=datetime(2024, 1, 1, hour, tzinfo=UTC),
+            vital_type=vital_type.value,
+            value=value,
+        )
+        for patient_id, hour, vital_type, value in (
+            (untracked, 8, VitalType.SPO2, 95),
+            (other_untracked, 8, VitalType.HR, 70),
+            (other_untracked, 9, VitalType.HR, 75),
+            (other_untracked, 7, VitalType.RR, 18),
+        )
+    )
+    await db_session.flush()
+
+    statements.clear()
+    response = await PatientRiskService(db_session).get_latest_vitals(
+        [untracked, "RISK_MISSING", tracked, other_untracked, untracked]
+    )
+
+    # Snapshots, existing patients and the latest vitals of every untracked patient: one query each.
+    assert len(statements) == 3
+    assert [item.patient_id for item in response.items] == [untracked, tracked, other_untracked]
+    assert response.not_found == ["RISK_MISSING"]
+    assert response.items[0].vitals["SpO2"].value == 95.0
+    latest_hr = response.items[1].vitals["HR"]
+    assert (latest_hr.value, latest_hr.recorded_at) == (130.0, datetime(2024, 1, 1, 10, tzinfo=UTC))
+    assert {vital_type: vital.value for vital_type, vital in response.items[2].vitals.items()} == {
+        "HR": 75.0,
+        "RR": 18.0,
+    }
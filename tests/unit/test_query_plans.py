@@ -0,0 +1,124 @@
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.vital_partition_service import VitalPartitionService
+from app.domain.vital_cursor import VitalCursor
+from app.domain.vital_partition import PartitionInterval
+from app.domain.vital_type import VitalType
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.repositories.vital_repository import VitalRepository
+
+
+def plan_nodes(plan: dict) -> list[dict]:
+    """Flatten an EXPLAIN (FORMAT JSON) plan tree."""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+async def explain(db_session: AsyncSession, stmt: Select) -> list[dict]:
+    """EXPLAIN a statement with seq/bitmap scans disabled, so small test tables still plan like large ones.
+
+    Plain index scans are disabled too: the test partitions are never vacuumed, so an index-only scan gets
+    no visibility-map credit and a narrower index plus heap fetches can look cheaper than the covering one.
+    """
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    await db_session.execute(text("SET LOCAL enable_indexscan = off"))
+    result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    return plan_nodes(result.scalar_one()[0]["Plan"])
+
+
+@pytest.fixture
+async def plan_patient(db_session: AsyncSession) -> str:
+    patient_id = "PLAN_P001"
+    db_session.add(PatientModel(patient_id=patient_id, name="Plan Patient", gender="M", birth_date=date(1990, 1, 1)))
+    await db_session.flush()
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    db_session.add_all(
+        VitalModel(
+            patient_id=patient_id,
+            recorded_at=start + timedelta(minutes=i),
+            vital_type=list(VitalType)[i % len(VitalType)].value,
+            value=Decimal(str(60 + i % 40)),
+        )
+        for i in range(300)
+    )
+    await db_session.flush()
+    await db_session.execute(text("ANALYZE vitals"))
+    return patient_id
+
+
+async def parent_index(db_session: AsyncSession, index_name: str) -> str:
+    """The partitioned index on vitals that a partition's index belongs to."""
+    result = await db_session.execute(
+        text(
+            "SELECT parent.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE pg_inherits.inhrelid = CAST(:index AS regclass)"
+        ),
+        {"index": index_name},
+    )
+    return result.scalar_one()
+
+
+async def assert_index_only_without_sort(db_session: AsyncSession, nodes: list[dict]) -> None:
+    scans = [node for node in nodes if node["Node Type"] == "Index Only Scan"]
+    assert [await parent_index(db_session, scan["Index Name"]) for scan in scans] == [
+        "ix_vitals_patient_type_recorded_at_id"
+    ]
+    assert not any(node["Node Type"] in ("Sort", "Incremental Sort") for node in nodes)
+
+
+@pytest.mark.asyncio
+async def test_time_range_with_type_is_index_only_without_sort(db_session: AsyncSession, plan_patient: str):
+    """(patient_id, vital_type, recorded_at) range query is served by the covering index in order."""
+    stmt = VitalRepository(db_session).time_range_values_query(
+        plan_patient,
+        datetime(2024, 1, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 1, 3, tzinfo=UTC),
+        VitalType.HR,
+    )
+
+    await assert_index_only_without_sort(db_session, await explain(db_session, stmt))
+
+
+@pytest.mark.asyncio
+async def test_keyset_page_is_index_only_without_sort(db_session: AsyncSession, plan_patient: str):
+    """A page after a (recorded_at, id) cursor seeks into the same index instead of sorting."""
+    stmt = VitalRepository(db_session).time_range_values_query(
+        plan_patient,
+        datetime(2024, 1, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 1, 3, tzinfo=UTC),
+        VitalType.HR,
+        limit=10,
+        after=VitalCursor(datetime(2024, 1, 1, 2, tzinfo=UTC), uuid4()),
+    )
+
+    await assert_index_only_without_sort(db_session, await explain(db_session, stmt))
+
+
+@pytest.mark.asyncio
+async def test_time_range_scans_only_matching_partitions(db_session: AsyncSession, plan_patient: str):
+    """A recorded_at range is pruned to the partitions it overlaps (default partition included only if needed)."""
+    await VitalPartitionService(db_session, PartitionInterval.DAY).maintain(datetime(2023, 12, 30, tzinfo=UTC), ahead=5)
+    stmt = VitalRepository(db_session).time_range_values_query(
+        plan_patient,
+        datetime(2024, 1, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 2, 3, tzinfo=UTC),
+        VitalType.HR,
+    )
+
+    scanned = {node["Relation Name"] for node in await explain(db_session, stmt) if "Relation Name" in node}
+
+    assert scanned == {"vitals_p20240101", "vitals_p20240102"}
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from starlette.requests import Request
+
+from app.infrastructure import database
+from app.infrastructure.read_routing import PRIMARY_PIN_COOKIE, PrimaryPinMiddleware, pinned_to_primary
+
+
+def request_with_cookie(value: str | None) -> Request:
+    headers = [(b"cookie", f"{PRIMARY_PIN_COOKIE}={value}".encode())] if value is not None else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def read_items():
+        return []
+
+    @app.post("/items")
+    async def create_item():
+        return {}
+
+    @app.post("/rejected")
+    async def reject_item():
+        raise HTTPException(status_code=409)
+
+    app.add_middleware(PrimaryPinMiddleware, pin_seconds=5)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_successful_write_pins_client(client):
+    response = await client.post("/items")
+
+    until = float(response.cookies[PRIMARY_PIN_COOKIE])
+    assert time.time() < until <= time.time() + 5
+    assert "Max-Age=5" in response.headers["set-cookie"]
+
+
+@pytest.mark.parametrize(("method", "path"), [("GET", "/items"), ("POST", "/rejected")])
+async def test_reads_and_failed_writes_do_not_pin(client, method, path):
+    response = await client.request(method, path)
+
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+
+
+@pytest.mark.parametrize(
+    ("cookie", "pinned"),
+    [(None, False), ("not-a-time", False), (str(time.time() - 1), False), (str(time.time() + 60), True)],
+)
+def test_pinned_to_primary(cookie, pinned):
+    assert pinned_to_primary(request_with_cookie(cookie)) is pinned
+
+
+@pytest.mark.parametrize(("cookie", "expected"), [(None, "replica"), (str(time.time() + 60), "primary")])
+async def test_read_session_routing(monkeypatch, cookie, expected):
+    monkeypatch.setattr(database, "async_session_factory", lambda: FakeSession("primary"))
+    monkeypatch.setattr(database, "read_session_factory", lambda: FakeSession("replica"))
+
+    async for session in database.get_read_db_session(request_with_cookie(cookie)):
+        assert session.target == expected
+
+
+class FakeSession:
+    def __init__(self, target: str):
+        self.target = target
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
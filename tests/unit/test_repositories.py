@@ -3,7 +3,9 @@ from decimal import Decimal
 
 import pytest
 
-from app.domain.exceptions import OptimisticLockError
+from app.domain.exceptions import OptimisticLockError, PatientNotFoundError
+from app.domain.vital_aggregation import AggregationFunction
+from app.domain.vital_cursor import VitalCursor
 from app.domain.vital_type import VitalType
 from app.infrastructure.models.patient_model import PatientModel
 from app.infrastructure.models.vital_model import VitalModel
@@ -48,6 +50,25 @@ async def test_patient_repo_exists(db_session):
     assert await repo.exists("NONEXISTENT") is False
 
 
+@pytest.mark.asyncio
+async def test_patient_repo_insert_if_absent(db_session, statements):
+    """One INSERT ... RETURNING creates the patient with its server defaults; a taken id returns None."""
+    repo = PatientRepository(db_session)
+
+    created = await repo.insert_if_absent(
+        patient_id="REPO_INS1", name="Inserted", gender="F", birth_date=date(1980, 2, 3)
+    )
+    duplicate = await repo.insert_if_absent(
+        patient_id="REPO_INS1", name="Other", gender="M", birth_date=date(1980, 2, 3)
+    )
+
+    assert created is not None
+    assert (created.version, created.name) == (1, "Inserted")
+    assert created.id is not None and created.created_at is not None
+    assert duplicate is None
+    assert len(statements) == 2
+
+
 @pytest.mark.asyncio
 async def test_vital_repo_find_by_time_range(db_session):
     """Query by time range."""
@@ -195,3 +216,197 @@ async def test_patient_repo_update_with_version_conflict(db_session):
         )
 
     assert "Version mismatch" in str(exc_info.value)
+    assert "current 2" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_patient_repo_update_with_version_single_statement(db_session, statements):
+    """A successful update and both failure kinds each take one statement."""
+    db_session.add(PatientModel(patient_id="LOCK_P003", name="Original", gender="M", birth_date=date(1990, 1, 1)))
+    await db_session.flush()
+    statements.clear()
+    repo = PatientRepository(db_session)
+
+    updated = await repo.update_with_version(patient_id="LOCK_P003", expected_version=1, name="Updated")
+    assert (updated.name, updated.version) == ("Updated", 2)
+    with pytest.raises(OptimisticLockError):
+        await repo.update_with_version(patient_id="LOCK_P003", expected_version=1, name="Stale")
+    with pytest.raises(PatientNotFoundError):
+        await repo.update_with_version(patient_id="LOCK_MISSING", expected_version=1, name="Nobody")
+
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_patient_repo_find_existing_patient_ids(db_session):
+    """Return only patient_ids that exist."""
+    for patient_id in ["REPO_P005", "REPO_P006"]:
+        db_session.add(
+            PatientModel(
+                patient_id=patient_id,
+                name="Existing Patient",
+                gender="M",
+                birth_date=date(1990, 1, 1),
+            )
+        )
+    await db_session.flush()
+
+    repo = PatientRepository(db_session)
+    found = await repo.find_existing_patient_ids({"REPO_P005", "REPO_P006", "NONEXISTENT"})
+
+    assert found == {"REPO_P005", "REPO_P006"}
+    assert await repo.find_existing_patient_ids(set()) == set()
+
+
+@pytest.mark.asyncio
+async def test_vital_repo_save_many(db_session):
+    """Insert many vitals and return them in input order with server defaults."""
+    patient = PatientModel(
+        patient_id="REPO_P007",
+        name="Bulk Patient",
+        gender="F",
+        birth_date=date(1975, 3, 1),
+    )
+    db_session.add(patient)
+    await db_session.flush()
+
+    now = datetime.now(UTC)
+    values = [
+        {
+            "patient_id": "REPO_P007",
+            "recorded_at": now + timedelta(seconds=i),
+            "vital_type": VitalType.HR.value,
+            "value": Decimal(str(70 + i)),
+        }
+        for i in range(5)
+    ]
+
+    repo = VitalRepository(db_session)
+    saved = await repo.save_many(values)
+
+    assert [v.value for v in saved] == [Decimal(str(70 + i)) for i in range(5)]
+    assert all(v.id is not None and v.version == 1 and v.created_at is not None for v in saved)
+    assert await repo.save_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_vital_repo_find_by_time_range_keyset(db_session):
+    """Pages follow (recorded_at, id) order and the page size is capped."""
+    patient = PatientModel(
+        patient_id="REPO_P008",
+        name="Page Patient",
+        gender="M",
+        birth_date=date(1970, 1, 1),
+    )
+    db_session.add(patient)
+    await db_session.flush()
+
+    now = datetime.now(UTC)
+    repo = VitalRepository(db_session)
+    await repo.save_many(
+        [
+            {
+                "patient_id": "REPO_P008",
+                "recorded_at": now + timedelta(seconds=i // 2),  # pairs share a timestamp
+                "vital_type": VitalType.HR.value,
+                "value": Decimal(i),
+            }
+            for i in range(5)
+        ]
+    )
+
+    seen = []
+    after = None
+    while True:
+        page = await repo.find_by_time_range("REPO_P008", now, now + timedelta(minutes=1), limit=2, after=after)
+        seen.extend(page)
+        if len(page) < 2:
+            break
+        after = VitalCursor(page[-1].recorded_at, page[-1].id)
+
+    assert len(seen) == 5
+    assert len({v.id for v in seen}) == 5
+    assert [v.recorded_at for v in seen] == sorted(v.recorded_at for v in seen)
+
+    capped = await repo.find_by_time_range("REPO_P008", now, now + timedelta(minutes=1), limit=10**6)
+    assert len(capped) == 5
+
+
+@pytest.mark.asyncio
+async def test_vital_repo_find_values_for_patients(db_session):
+    """One query returns several patients' vitals ordered by patient, then time; types are filtered."""
+    for patient_id in ("REPO_P010", "REPO_P011"):
+        db_session.add(PatientModel(patient_id=patient_id, name="Ward", gender="F", birth_date=date(1970, 1, 1)))
+    await db_session.flush()
+
+    now = datetime.now(UTC)
+    repo = VitalRepository(db_session)
+    await repo.save_many(
+        [
+            {
+                "patient_id": patient_id,
+                "recorded_at": now + timedelta(seconds=offset),
+                "vital_type": vital_type.value,
+                "value": Decimal(offset),
+            }
+            for patient_id in ("REPO_P011", "REPO_P010")
+            for offset, vital_type in ((2, VitalType.HR), (1, VitalType.SBP), (0, VitalType.SPO2))
+        ]
+    )
+    window = (now, now + timedelta(minutes=1))
+
+    rows = await repo.find_values_for_patients(["REPO_P011", "REPO_P010", "REPO_MISSING"], *window)
+    filtered = await repo.find_values_for_patients(
+        ["REPO_P010", "REPO_P011"], *window, vital_types=[VitalType.HR, VitalType.SBP]
+    )
+
+    assert [(row.patient_id, row.vital_type) for row in rows] == [
+        ("REPO_P010", "SpO2"),
+        ("REPO_P010", "SBP"),
+        ("REPO_P010", "HR"),
+        ("REPO_P011", "SpO2"),
+        ("REPO_P011", "SBP"),
+        ("REPO_P011", "HR"),
+    ]
+    assert {row.vital_type for row in filtered} == {"HR", "SBP"}
+    assert len(filtered) == 4
+    assert await repo.find_values_for_patients([], *window) == []
+
+
+@pytest.mark.asyncio
+async def test_vital_repo_aggregate_by_time_range(db_session):
+    """Values are grouped into aligned buckets per aggregate function."""
+    patient = PatientModel(
+        patient_id="REPO_P009",
+        name="Aggregate Patient",
+        gender="F",
+        birth_date=date(1970, 1, 1),
+    )
+    db_session.add(patient)
+    await db_session.flush()
+
+    start = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+    repo = VitalRepository(db_session)
+    await repo.save_many(
+        [
+            {
+                "patient_id": "REPO_P009",
+                "recorded_at": start + timedelta(minutes=minute),
+                "vital_type": VitalType.SPO2.value,
+                "value": Decimal(90 + minute),
+            }
+            for minute in range(10)
+        ]
+    )
+
+    async def aggregate(agg: AggregationFunction) -> list[tuple[datetime, float]]:
+        rows = await repo.aggregate_by_time_range(
+            "REPO_P009", start, start + timedelta(hours=1), VitalType.SPO2, timedelta(minutes=5), agg
+        )
+        return [tuple(row) for row in rows]
+
+    assert await aggregate(AggregationFunction.AVG) == [(start, 92.0), (start + timedelta(minutes=5), 97.0)]
+    assert [v for _, v in await aggregate(AggregationFunction.MIN)] == [90.0, 95.0]
+    assert [v for _, v in await aggregate(AggregationFunction.MAX)] == [94.0, 99.0]
+    assert [v for _, v in await aggregate(AggregationFunction.LAST)] == [94.0, 99.0]
+    assert [v for _, v in await aggregate(AggregationFunction.COUNT)] == [5.0, 5.0]
@@ -0,0 +1,97 @@
+import pytest
+
+from app.domain.inference import InferenceResult, InferenceResultCache
+from app.domain.inference import result_cache as result_cache_module
+from app.domain.risk_level import RiskLevel
+
+LOW = InferenceResult(0.2, RiskLevel.LOW, [])
+HIGH = InferenceResult(0.9, RiskLevel.HIGH, ["HR > 120", "SBP < 90", "SpO2 < 90"])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestInferenceResultCache:
+    def test_key_ignores_vital_order(self):
+        assert InferenceResultCache.key("rule_based", "v1", {"HR": 80.0, "SBP": 120.0}) == InferenceResultCache.key(
+            "rule_based", "v1", {"SBP": 120, "HR": 80}
+        )
+
+    def test_key_is_quantized(self):
+        """Jitter below the stored 2 decimals shares an entry; a change at 2 decimals does not."""
+        key = InferenceResultCache.key("rule_based", "v1", {"HR": 120.004})
+
+        assert key == InferenceResultCache.key("rule_based", "v1", {"HR": 119.996})
+        assert key != InferenceResultCache.key("rule_based", "v1", {"HR": 120.01})
+        assert InferenceResultCache.quantize({"HR": 120.004, "SpO2": 95}) == {"HR": 120.0, "SpO2": 95.0}
+
+    def test_hit_and_miss_counters(self):
+        cache = InferenceResultCache()
+        key = cache.key("rule_based", "v1", {"HR": 80.0})
+
+        assert cache.get(key) is None
+        cache.put(key, LOW)
+
+        assert cache.get(key) is LOW
+        assert cache.get(cache.key("rule_based", "v2", {"HR": 80.0})) is None  # Another version is another entry
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+        assert stats.hit_ratio == pytest.approx(1 / 3)
+
+    def test_evicts_least_recently_used(self):
+        cache = InferenceResultCache(max_size=2)
+        first, second, third = (cache.key("rule_based", "v1", {"HR": hr}) for hr in (80.0, 90.0, 100.0))
+        cache.put(first, LOW)
+        cache.put(second, LOW)
+        cache.get(first)  # second is now the least recently used
+
+        cache.put(third, HIGH)
+
+        assert cache.get(second) is None
+        assert cache.get(first) is LOW
+        assert cache.stats().evictions == 1
+
+    def test_entries_expire(self, clock):
+        cache = InferenceResultCache(ttl_seconds=10)
+        key = cache.key("rule_based", "v1", {"HR": 80.0})
+        cache.put(key, LOW)
+
+        clock[0] += 9.9
+        assert cache.get(key) is LOW
+        clock[0] += 0.1
+        assert cache.get(key) is None
+        assert cache.stats().expirations == 1
+
+    def test_zero_ttl_never_expires(self, clock):
+        cache = InferenceResultCache(ttl_seconds=0)
+        key = cache.key("rule_based", "v1", {"HR": 80.0})
+        cache.put(key, LOW)
+
+        clock[0] += 1e9
+
+        assert cache.get(key) is LOW
+
+    def test_disabled(self):
+        cache = InferenceResultCache(max_size=0)
+        key = cache.key("rule_based", "v1", {"HR": 80.0})
+
+        cache.put(key, LOW)
+
+        assert not cache.enabled
+        assert cache.get(key) is None
+
+    def test_invalidate_one_strategy(self):
+        cache = InferenceResultCache()
+        kept = cache.key("rule_based", "v1", {"HR": 80.0})
+        dropped = cache.key("ml", "v1", {"HR": 80.0})
+        cache.put(kept, LOW)
+        cache.put(dropped, HIGH)
+
+        cache.invalidate("ml")
+
+        assert cache.get(kept) is LOW
+        assert cache.get(dropped) is None
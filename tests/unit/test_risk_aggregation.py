@@ -0,0 +1,77 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.domain.inference.risk_aggregation import LatestAggregator, MaxAggregator, TimeWeightedAggregator
+from app.domain.risk_level import RiskLevel
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def times(*hours):
+    return [START + timedelta(hours=hour) for hour in hours]
+
+
+class TestMaxAggregator:
+    def test_first_highest_wins_across_chunks(self):
+        aggregator = MaxAggregator(times(0, 1, 2, 3))
+
+        assert not aggregator.feed(np.array([0, 1]), np.array([0.2, 0.7]))
+        assert not aggregator.feed(np.array([2, 3]), np.array([0.7, 0.5]))
+        assert aggregator.winner == 1
+        assert aggregator.score() is None
+
+    def test_done_at_max_score(self):
+        aggregator = MaxAggregator(times(0, 1, 2), max_score=0.9)
+
+        assert aggregator.feed(np.array([0, 1]), np.array([0.9, 0.2]))
+        assert aggregator.winner == 0
+
+    def test_never_done_without_max_score(self):
+        assert not MaxAggregator(times(0)).feed(np.array([0]), np.array([1.0]))
+
+
+class TestLatestAggregator:
+    def test_only_latest_is_evaluated(self):
+        aggregator = LatestAggregator(times(2, 5, 1, 5))
+
+        assert aggregator.order().tolist() == [3]  # Last listed wins a tie
+        assert aggregator.feed(np.array([3]), np.array([0.5]))
+        assert aggregator.winner == 3
+
+    def test_naive_timestamps_are_utc(self):
+        naive = START.replace(tzinfo=None)
+
+        assert LatestAggregator([naive + timedelta(hours=1), START]).winner == 0
+
+
+class TestTimeWeightedAggregator:
+    def test_weights_halve_per_half_life(self):
+        aggregator = TimeWeightedAggregator(times(0, 1, 2))
+
+        aggregator.feed(np.array([0]), np.array([0.9]))
+        aggregator.feed(np.array([1, 2]), np.array([0.2, 0.5]))
+
+        assert aggregator.score() == pytest.approx((0.25 * 0.9 + 0.5 * 0.2 + 0.5) / 1.75)
+        assert aggregator.winner == 2
+
+    def test_naive_timestamps_are_utc(self):
+        aware = TimeWeightedAggregator(times(0, 1))
+        mixed = TimeWeightedAggregator([START.replace(tzinfo=None), START + timedelta(hours=1)])
+
+        assert mixed.weights.tolist() == aware.weights.tolist() == [0.5, 1.0]
+
+
+@pytest.mark.parametrize(
+    ("score", "level"),
+    [
+        (0.0, RiskLevel.LOW),
+        (0.3, RiskLevel.LOW),
+        (0.35, RiskLevel.MEDIUM),
+        (0.79, RiskLevel.MEDIUM),
+        (0.8, RiskLevel.HIGH),
+    ],
+)
+def test_risk_level_from_score(score, level):
+    assert RiskLevel.from_score(score) is level
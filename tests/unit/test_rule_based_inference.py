@@ -1,4 +1,10 @@
-from app.domain.inference import RuleBasedInference
+import json
+import os
+
+import numpy as np
+import pytest
+
+from app.domain.inference import BaseInference, InferenceResult, RuleBasedInference, to_columns
 from app.domain.risk_level import RiskLevel
 
 
@@ -82,3 +88,133 @@ class TestRuleBasedInference:
         result = self.inference.evaluate(vitals)
 
         assert "SpO2 < 90" not in result.checked_rules
+
+
+class TestRuleBasedInferenceBatch:
+    def setup_method(self):
+        self.inference = RuleBasedInference()
+
+    def test_batch_matches_scalar_evaluate(self):
+        """Vectorized batch gives the same score, level and rules as evaluate() per record."""
+        rng = np.random.default_rng(0)
+        records = [
+            {
+                key: float(value)
+                for key, value in {
+                    "HR": rng.uniform(60, 160),
+                    "SBP": rng.uniform(70, 140),
+                    "SpO2": rng.uniform(80, 100),
+                }.items()
+                if rng.random() > 0.2  # some vitals missing
+            }
+            for _ in range(200)
+        ]
+
+        batch = self.inference.evaluate_batch(to_columns(records), size=len(records))
+
+        assert len(batch) == len(records)
+        for index, vitals in enumerate(records):
+            assert batch.result(index) == self.inference.evaluate(vitals)
+
+    def test_batch_without_vitals(self):
+        """Records without any vitals are LOW."""
+        batch = self.inference.evaluate_batch(to_columns([{}, {}]), size=2)
+
+        assert batch.risk_scores.tolist() == [0.2, 0.2]
+        assert batch.result(1).checked_rules == []
+
+
+class TestDefaultEvaluateBatch:
+    def test_default_batch_uses_evaluate(self):
+        """Strategies without a vectorized path fall back to evaluate() per record."""
+
+        class ThresholdInference(BaseInference):
+            def evaluate(self, vitals: dict[str, float]) -> InferenceResult:
+                if vitals.get("RR", 0) > 30:
+                    return InferenceResult(0.8, RiskLevel.HIGH, ["RR > 30"])
+                return InferenceResult(0.1, RiskLevel.LOW, [])
+
+        batch = ThresholdInference().evaluate_batch(to_columns([{"RR": 35}, {"HR": 80}]))
+
+        assert batch.risk_scores.tolist() == [0.8, 0.1]
+        assert batch.result(0).checked_rules == ["RR > 30"]
+        assert batch.result(1) == InferenceResult(0.1, RiskLevel.LOW, [])
+
+
+class TestRescore:
+    def setup_method(self):
+        self.inference = RuleBasedInference()
+
+    def test_rescore_only_changed_type(self):
+        """Rules on other vital types keep their previous outcome."""
+        result = self.inference.rescore(["HR > 120"], "SBP", 85)
+
+        assert result == InferenceResult(0.7, RiskLevel.MEDIUM, ["HR > 120", "SBP < 90"])
+
+    def test_rescore_clears_rule(self):
+        """A value back in range, or a removed measurement, unmatches the rule."""
+        assert self.inference.rescore(["HR > 120", "SBP < 90"], "HR", 80).checked_rules == ["SBP < 90"]
+        assert self.inference.rescore(["SBP < 90"], "SBP", None) == InferenceResult(0.2, RiskLevel.LOW, [])
+
+    def test_rescore_matches_full_evaluate(self):
+        """Applying vitals one type at a time ends where a full evaluation does."""
+        vitals = {"HR": 130, "SBP": 85, "SpO2": 85, "RR": 20}
+        checked_rules: list[str] = []
+        for vital_type, value in vitals.items():
+            checked_rules = self.inference.rescore(checked_rules, vital_type, value).checked_rules
+
+        assert self.inference.rescore(checked_rules, "RR", 20) == self.inference.evaluate(vitals)
+
+
+class TestRuleFile:
+    def write_rules(self, path, version, threshold):
+        path.write_text(
+            json.dumps(
+                {
+                    "version": version,
+                    "score_ladder": [{"score": 0.1, "level": "LOW"}, {"score": 0.6, "level": "MEDIUM"}],
+                    "rules": [{"vital_type": "HR", "op": ">", "threshold": threshold}],
+                }
+            )
+        )
+
+    def test_load_and_hot_reload(self, tmp_path):
+        """Rule file changes are picked up on the next evaluation; a broken file keeps the previous rules."""
+        path = tmp_path / "rules.json"
+        self.write_rules(path, "v1", 100)
+        inference = RuleBasedInference(rules_path=path, reload_interval=0)
+        inference.startup()
+
+        assert inference.version == "v1"
+        assert inference.evaluate({"HR": 110}) == InferenceResult(0.6, RiskLevel.MEDIUM, ["HR > 100"])
+
+        self.write_rules(path, "v2", 115)
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        assert inference.evaluate({"HR": 110}) == InferenceResult(0.1, RiskLevel.LOW, [])
+        assert inference.version == "v2"
+
+        path.write_text("{broken")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 2_000_000))
+        assert inference.evaluate_batch(to_columns([{"HR": 120}])).rule_names == ["HR > 115"]
+        assert inference.version == "v2"
+
+    def test_reload_is_throttled(self, tmp_path):
+        path = tmp_path / "rules.json"
+        self.write_rules(path, "v1", 100)
+        inference = RuleBasedInference(rules_path=path, reload_interval=3600)
+        inference.evaluate({})
+
+        self.write_rules(path, "v2", 115)
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        inference.evaluate({})
+
+        assert inference.version == "v1"
+        assert inference.reload() is True
+        assert inference.version == "v2"
+
+    def test_broken_file_fails_startup(self, tmp_path):
+        path = tmp_path / "rules.json"
+        path.write_text("[]")
+
+        with pytest.raises(ValueError):
+            RuleBasedInference(rules_path=path).startup()
@@ -0,0 +1,83 @@
+import math
+import operator
+import random
+
+import numpy as np
+import pytest
+
+from app.domain.inference import InferenceResult, Rule, compile_rules, to_columns
+from app.domain.risk_level import RiskLevel
+
+SCORES = (0.1, 0.6, 0.9)
+LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+
+
+class TestCompileRules:
+    def test_groups_rules_per_vital_type(self):
+        """Several rules on one type are all checked; names follow rule order."""
+        compiled = compile_rules(
+            [
+                Rule("HR > 120", "HR", operator.gt, 120),
+                Rule("RR > 30", "RR", operator.gt, 30),
+                Rule("HR > 150", "HR", operator.gt, 150),
+            ],
+            SCORES,
+            LEVELS,
+        )
+
+        assert compiled.evaluate({"HR": 160, "RR": 35}) == InferenceResult(
+            0.9, RiskLevel.HIGH, ["HR > 120", "RR > 30", "HR > 150"]
+        )
+        assert compiled.evaluate({"HR": 130}) == InferenceResult(0.6, RiskLevel.MEDIUM, ["HR > 120"])
+        assert compiled.evaluate({}) == InferenceResult(0.1, RiskLevel.LOW, [])
+
+    def test_custom_compare_and_infinite_threshold(self):
+        """Comparisons without an operator form and non-finite thresholds are bound, not inlined."""
+        compiled = compile_rules(
+            [
+                Rule("BT out of range", "BT", lambda value, limit: abs(value - 37.0) > limit, 1.5),
+                Rule("any SBP", "SBP", operator.lt, float("inf")),
+            ],
+            SCORES,
+            LEVELS,
+        )
+
+        assert compiled.evaluate({"BT": 39.0}).checked_rules == ["BT out of range"]
+        assert compiled.evaluate({"BT": 37.2, "SBP": 120}).checked_rules == ["any SBP"]
+
+    def test_results_are_precomputed(self):
+        """The same match set returns the same shared result."""
+        compiled = compile_rules([Rule("HR > 120", "HR", operator.gt, 120)], SCORES, LEVELS)
+
+        assert compiled.evaluate({"HR": 130}) is compiled.evaluate({"HR": 140})
+        assert compiled.result(1) is compiled.evaluate({"HR": 130})
+
+    def test_invalid_score_table(self):
+        with pytest.raises(ValueError):
+            compile_rules([], (0.1, 0.2), (RiskLevel.LOW,))
+
+    def test_threshold_tables_match_rule_walk(self):
+        """Bisected tables (and the batch path) agree with checking every rule, at and around thresholds."""
+        rng = random.Random(7)
+        rules = [
+            Rule(f"rule {i}", vital_type, compare, float(rng.randint(40, 140)))
+            for i in range(60)
+            for vital_type in [rng.choice(["HR", "SBP", "SpO2"])]
+            for compare in [rng.choice([operator.gt, operator.ge, operator.lt, operator.le])]
+        ]
+        compiled = compile_rules(rules, tuple(i / 60 for i in range(61)), (RiskLevel.LOW,) * 61)
+        assert any(len(table.thresholds) > compiled.INLINE_LIMIT for table in compiled.tables)
+
+        samples = [{"HR": float(rng.randint(35, 145)), "SBP": float(rng.randint(35, 145))} for _ in range(300)]
+        samples += [{"SpO2": rule.threshold} for rule in rules] + [{"HR": math.nan, "SpO2": math.inf}]
+        for vitals in samples:
+            expected = [
+                rule.name
+                for rule in rules
+                if rule.vital_type in vitals and rule.compare(vitals[rule.vital_type], rule.threshold)
+            ]
+            assert compiled.evaluate(vitals).checked_rules == expected, vitals
+
+        batch = compiled.evaluate_batch(to_columns(samples))
+        assert [batch.result(i) for i in range(len(samples))] == [compiled.evaluate(v) for v in samples]
+        assert batch.risk_scores.dtype == np.float64
@@ -0,0 +1,80 @@
+import json
+import operator
+import os
+
+import pytest
+
+from app.domain.inference import Rule, load_rule_set, parse_rule_set
+from app.domain.risk_level import RiskLevel
+
+LADDER = [{"score": 0.1, "level": "LOW"}, {"score": 0.8, "level": "HIGH"}]
+
+
+class TestParseRuleSet:
+    def test_parse(self):
+        rule_set = parse_rule_set(
+            {
+                "version": "v2",
+                "score_ladder": LADDER,
+                "rules": [
+                    {"name": "Tachycardia", "vital_type": "HR", "op": ">=", "threshold": 130},
+                    {"vital_type": "BT", "op": "<", "threshold": 35.5},
+                ],
+            }
+        )
+
+        assert rule_set.version == "v2"
+        assert rule_set.scores == (0.1, 0.8)
+        assert rule_set.levels == (RiskLevel.LOW, RiskLevel.HIGH)
+        assert rule_set.rules == [
+            Rule("Tachycardia", "HR", operator.ge, 130.0),
+            Rule("BT < 35.5", "BT", operator.lt, 35.5),
+        ]
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            {"vital_type": "XX", "op": ">", "threshold": 1},
+            {"vital_type": "HR", "op": "==", "threshold": 1},
+            {"vital_type": "HR", "op": ">", "threshold": "120"},
+            {"vital_type": "HR", "op": ">"},
+        ],
+    )
+    def test_invalid_rule(self, rule):
+        with pytest.raises(ValueError, match=r"rules\[0\]"):
+            parse_rule_set({"score_ladder": LADDER, "rules": [rule]})
+
+    def test_invalid_ladder(self):
+        with pytest.raises(ValueError, match="score_ladder"):
+            parse_rule_set({"score_ladder": [], "rules": []})
+        with pytest.raises(ValueError, match=r"score_ladder\[0\]"):
+            parse_rule_set({"score_ladder": [{"score": 0.1, "level": "CRITICAL"}], "rules": []})
+
+
+class TestLoadRuleSet:
+    def test_load_example_file(self):
+        """The shipped example matches the built-in rules."""
+        rule_set = load_rule_set("inference_rules.example.json")
+
+        assert [rule.name for rule in rule_set.rules] == ["HR > 120", "SBP < 90", "SpO2 < 90"]
+        assert rule_set.scores == (0.2, 0.5, 0.7, 0.9)
+
+    def test_version_defaults_to_content_hash(self, tmp_path):
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"score_ladder": LADDER, "rules": []}))
+        version = load_rule_set(path).version
+
+        assert version.startswith("sha256-")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        assert load_rule_set(path).version == version
+        path.write_text(
+            json.dumps({"score_ladder": LADDER, "rules": [{"vital_type": "HR", "op": ">", "threshold": 1}]})
+        )
+        assert load_rule_set(path).version != version
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "rules.json"
+        path.write_text("{not json")
+
+        with pytest.raises(ValueError, match="invalid JSON"):
+            load_rule_set(path)
@@ -0,0 +1,181 @@
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.stored_inference_service import StoredInferenceService
+from app.application.vital_archive_service import VitalArchiveService
+from app.application.vital_service import VitalService
+from app.domain.exceptions import ArchivedWindowError
+from app.domain.vital_cursor import PatientVitalCursor, VitalCursor
+from app.domain.vital_type import VitalType
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.infrastructure.vital_archive import ArchivedVital, VitalArchive
+
+# Far enough back that no other test's vitals are older than the archive cutoff used here.
+DAY = datetime(1990, 3, 1, tzinfo=UTC)
+
+
+def archived(patient_id: str, minutes: int, vital_type: str = "HR", value: str = "80.00") -> ArchivedVital:
+    recorded_at = DAY + timedelta(minutes=minutes)
+    return ArchivedVital(uuid4(), patient_id, recorded_at, vital_type, Decimal(value), 1, recorded_at, recorded_at)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return VitalArchive(tmp_path, archive_after=timedelta(hours=72))
+
+
+def test_round_trip(archive):
+    vitals = [archived("P/1", 30, "SpO2", "97.50"), archived("P/1", 10), archived("P/1", 60 * 25)]
+
+    assert archive.write(vitals) == 2  # Two UTC days
+
+    assert archive.segment_path("P/1", date(1990, 3, 1)).exists()
+    read = archive.read("P/1", DAY, DAY + timedelta(days=2))
+    assert read == sorted(vitals, key=lambda vital: (vital.recorded_at, vital.id))
+    assert archive.read("P/1", DAY, DAY + timedelta(days=2), [VitalType.SPO2]) == [vitals[0]]
+    assert archive.read("P/1", DAY + timedelta(minutes=20), DAY + timedelta(hours=1)) == [vitals[0]]
+
+
+def test_read_resumes_after_cursor_with_limit(archive):
+    vitals = sorted(
+        (archived("P1", minutes) for minutes in (0, 10, 10, 60 * 24, 60 * 25)),
+        key=lambda vital: (vital.recorded_at, vital.id),
+    )
+    archive.write(vitals)
+    window = ("P1", DAY, DAY + timedelta(days=2))
+
+    assert archive.read(*window, limit=2) == vitals[:2]
+    assert archive.read(*window, after=VitalCursor(vitals[1].recorded_at, vitals[1].id), limit=2) == vitals[2:4]
+    assert archive.read(*window, after=VitalCursor(vitals[3].recorded_at, vitals[3].id)) == vitals[4:]
+
+
+def test_rewrite_merges_segment(archive):
+    first, second = archived("P1", 0), archived("P1", 5)
+    archive.write([first, second])
+
+    updated = second._replace(value=Decimal("99.00"), version=2)
+    archive.write([updated, archived("P1", 10)])
+
+    read = archive.read("P1", DAY, DAY + timedelta(hours=1))
+    assert [vital.id for vital in read] == [first.id, second.id, read[2].id]
+    assert read[1].value == Decimal("99.00")
+
+
+def test_recent_window_skips_archive(archive):
+    archive.write([archived("P1", 0)])
+    now = datetime.now(UTC)
+
+    assert not archive.may_contain(now - timedelta(hours=1))
+    assert archive.read("P1", now - timedelta(hours=1), now) == []
+
+
+def test_disabled_archive_reads_nothing():
+    assert VitalArchive(None).read("P1", DAY, DAY + timedelta(days=1)) == []
+
+
+async def test_time_range_merges_hot_and_cold(db_session: AsyncSession, archive):
+    patient_id = f"ARCH_{uuid4().hex[:8]}"
+    db_session.add(PatientModel(patient_id=patient_id, name="Archive", gender="F", birth_date=date(1950, 1, 1)))
+    await db_session.flush()
+    cold = [archived(patient_id, 0), archived(patient_id, 20)]
+    archive.write(cold)
+    db_session.add_all(
+        VitalModel(patient_id=patient_id, recorded_at=DAY + timedelta(minutes=m), vital_type="HR", value=70)
+        for m in (10, 30)
+    )
+    await db_session.flush()
+    repo = VitalRepository(db_session, archive)
+    window = (patient_id, DAY, DAY + timedelta(hours=1))
+
+    rows = await repo.find_values_by_time_range(*window)
+    first_page = await repo.find_values_by_time_range(*window, limit=3)
+    next_page = await repo.find_values_by_time_range(
+        *window, limit=3, after=VitalCursor(first_page[-1].recorded_at, first_page[-1].id)
+    )
+    models = await repo.find_by_time_range(*window, vital_type=VitalType.HR)
+
+    assert [row.recorded_at.minute for row in rows] == [0, 10, 20, 30]
+    assert [row.value for row in rows] == [Decimal("80.00"), Decimal("70.00"), Decimal("80.00"), Decimal("70.00")]
+    assert [row.recorded_at.minute for row in first_page] == [0, 10, 20]
+    assert [row.recorded_at.minute for row in next_page] == [30]
+    assert [vital.id for vital in models][::2] == [vital.id for vital in cold]
+
+
+async def test_multi_patient_query_merges_hot_and_cold(db_session: AsyncSession, archive):
+    """Pages run patient by patient in byte order, with archived rows merged in and type filters applied."""
+    suffix = uuid4().hex[:8]
+    upper, lower = f"ARCH_B{suffix}", f"ARCH_a{suffix}"  # "B" < "a" in byte order, not in most locales
+    for patient_id in (upper, lower):
+        db_session.add(PatientModel(patient_id=patient_id, name="Archive", gender="F", birth_date=date(1950, 1, 1)))
+    await db_session.flush()
+    archive.write([archived(lower, 0), archived(lower, 5, "SpO2"), archived(upper, 20)])
+    db_session.add_all(
+        VitalModel(patient_id=patient_id, recorded_at=DAY + timedelta(minutes=m), vital_type="HR", value=70)
+        for patient_id, m in ((lower, 10), (upper, 30))
+    )
+    await db_session.flush()
+    repo = VitalRepository(db_session, archive)
+    window = ([lower, upper], DAY, DAY + timedelta(hours=1), [VitalType.HR])
+
+    pages = [await repo.find_values_for_patients(*window, limit=2)]
+    last = pages[-1][-1]
+    pages.append(
+        await repo.find_values_for_patients(
+            *window, limit=2, after=PatientVitalCursor(last.patient_id, last.recorded_at, last.id)
+        )
+    )
+
+    assert [[(row.patient_id, row.recorded_at.minute) for row in page] for page in pages] == [
+        [(upper, 20), (upper, 30)],
+        [(lower, 0), (lower, 10)],
+    ]
+
+
+async def test_hot_only_queries_reject_archived_windows(db_session: AsyncSession, archive):
+    vital_service, inference_service = VitalService(db_session), StoredInferenceService(db_session)
+    vital_service.vital_repo.archive = inference_service.vital_repo.archive = archive
+    end = DAY + timedelta(hours=1)
+
+    with pytest.raises(ArchivedWindowError):
+        vital_service.stream_vitals("P1", DAY, end)
+    with pytest.raises(ArchivedWindowError):
+        await vital_service.aggregate_vitals("P1", DAY, end, VitalType.HR, max_points=10)
+    with pytest.raises(ArchivedWindowError):
+        await inference_service.evaluate_stored("P1", DAY, end)
+    now = datetime.now(UTC)
+    assert [chunk async for chunk in vital_service.stream_vitals("P1", now - timedelta(hours=1), now)] == []
+
+
+async def test_archive_service_moves_old_vitals(db_session: AsyncSession, tmp_path):
+    """Vitals before the cutoff leave the table for their patient/day segments."""
+    patient_id = f"ARCH_{uuid4().hex[:8]}"
+    db_session.add(PatientModel(patient_id=patient_id, name="Archive", gender="F", birth_date=date(1950, 1, 1)))
+    await db_session.flush()
+    db_session.add_all(
+        VitalModel(patient_id=patient_id, recorded_at=DAY + timedelta(hours=h), vital_type="RR", value=18)
+        for h in (1, 2, 30)
+    )
+    await db_session.commit()
+
+    now = datetime.now(UTC)
+    archive = VitalArchive(tmp_path, archive_after=now - datetime(1991, 1, 1, tzinfo=UTC))
+    try:
+        result = await VitalArchiveService(db_session, archive).archive_before_cutoff(now)
+
+        remaining = select(func.count()).select_from(VitalModel).where(VitalModel.patient_id == patient_id)
+        assert await db_session.scalar(remaining) == 0
+        assert result.archived == 3
+        assert result.segments == 2
+        archived_rows = archive.read(patient_id, DAY, DAY + timedelta(days=2))
+        assert [row.recorded_at.hour for row in archived_rows] == [1, 2, 6]
+        assert {row.value for row in archived_rows} == {Decimal("18.00")}
+    finally:
+        await db_session.execute(delete(PatientModel).where(PatientModel.patient_id == patient_id))
+        await db_session.commit()
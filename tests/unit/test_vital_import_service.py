@@ -0,0 +1,145 @@
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.patient_risk_service import PatientRiskService
+from app.application.vital_import_service import VitalImportFormat, VitalImportService, iter_lines
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
+
+
+async def as_async(items: list) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+async def create_patient(db_session: AsyncSession, patient_id: str) -> None:
+    db_session.add(
+        PatientModel(
+            patient_id=patient_id,
+            name="Import Patient",
+            gender="F",
+            birth_date=date(1980, 1, 1),
+        )
+    )
+    await db_session.flush()
+
+
+async def count_vitals(db_session: AsyncSession, patient_id: str) -> int:
+    stmt = select(func.count()).select_from(VitalModel).where(VitalModel.patient_id == patient_id)
+    return (await db_session.execute(stmt)).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_splits_across_chunks():
+    """Lines and multi-byte characters split across chunks are reassembled."""
+    data = "first\nsecond é\nthird".encode()
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+
+    lines = [line async for line in iter_lines(as_async(chunks))]
+
+    assert lines == ["first", "second é", "third"]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson(db_session: AsyncSession):
+    """Valid rows are copied in chunks, invalid rows are reported by line."""
+    patient_id = f"IMP_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    rows = [
+        {"patient_id": patient_id, "recorded_at": f"2024-01-01T10:0{i}:00Z", "vital_type": "HR", "value": 70 + i}
+        for i in range(5)
+    ]
+    lines = [json.dumps(row) for row in rows]
+    lines.insert(2, json.dumps({**rows[0], "vital_type": "GLUCOSE"}))
+    lines.append(json.dumps({**rows[0], "patient_id": "UNKNOWN_PATIENT"}))
+    lines.append("not json")
+
+    service = VitalImportService(db_session, chunk_size=2)
+    result = await service.import_lines(as_async(lines), VitalImportFormat.NDJSON)
+
+    assert result.imported == 5
+    assert result.rejected == 3
+    assert [error.line for error in result.errors] == [3, 7, 8]
+    assert "vital_type" in result.errors[0].detail
+    assert "not found" in result.errors[1].detail
+    assert result.rows_per_second > 0
+    assert await count_vitals(db_session, patient_id) == 5
+
+
+@pytest.mark.asyncio
+async def test_import_refreshes_risks_once(db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """Current risks are rebuilt after the last chunk, once per import rather than once per chunk."""
+    patient_ids = [f"IMP_{uuid4().hex[:8]}" for _ in range(2)]
+    for patient_id in patient_ids:
+        await create_patient(db_session, patient_id)
+    lines = [
+        json.dumps(
+            {"patient_id": patient_id, "recorded_at": f"2024-01-01T10:0{i}:00Z", "vital_type": "HR", "value": 130}
+        )
+        for i in range(3)
+        for patient_id in patient_ids
+    ]
+    refreshed: list[set[str]] = []
+    refresh = PatientRiskService.refresh
+
+    async def record_refresh(self, patient_ids):
+        refreshed.append(set(patient_ids))
+        await refresh(self, patient_ids)
+
+    monkeypatch.setattr(PatientRiskService, "refresh", record_refresh)
+
+    result = await VitalImportService(db_session, chunk_size=2).import_lines(as_async(lines), VitalImportFormat.NDJSON)
+
+    assert result.imported == 6
+    assert refreshed == [set(patient_ids)]
+    risk = await PatientRiskService(db_session).get_current_risk(patient_ids[0])
+    assert risk.checked_rules == ["HR > 120"]
+
+
+@pytest.mark.asyncio
+async def test_import_csv(db_session: AsyncSession):
+    """CSV rows are mapped through the header line."""
+    patient_id = f"IMP_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    lines = [
+        "patient_id,recorded_at,vital_type,value",
+        f"{patient_id},2024-01-01T10:00:00+09:00,SpO2,97.5",
+        f"{patient_id},2024-01-01T10:01:00,SpO2,97.0",
+        f"{patient_id},2024-01-01T10:02:00Z,SpO2,abc",
+    ]
+
+    service = VitalImportService(db_session)
+    result = await service.import_lines(as_async(lines), VitalImportFormat.CSV)
+
+    assert result.imported == 1
+    assert [error.detail for error in result.errors] == [
+        "recorded_at must include a timezone",
+        "value must be a number",
+    ]
+    assert await count_vitals(db_session, patient_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_value_that_overflows_once_rounded(db_session: AsyncSession):
+    """99999999.999 rounds to 1e8, which Numeric(10, 2) cannot hold; the row is rejected, not the chunk."""
+    patient_id = f"IMP_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    lines = [
+        "patient_id,recorded_at,vital_type,value",
+        f"{patient_id},2024-01-01T10:00:00Z,HR,99999999.999",
+        f"{patient_id},2024-01-01T10:01:00Z,HR,99999999.99",
+        f"{patient_id},2024-01-01T10:02:00Z,HR,NaN",
+    ]
+
+    result = await VitalImportService(db_session).import_lines(as_async(lines), VitalImportFormat.CSV)
+
+    assert result.imported == 1
+    assert [error.line for error in result.errors] == [2, 4]
+    assert "below 1e8" in result.errors[0].detail
+    assert await count_vitals(db_session, patient_id) == 1
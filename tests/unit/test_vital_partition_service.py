@@ -0,0 +1,112 @@
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.vital_partition_service import VitalPartitionService
+from app.domain.vital_partition import PartitionInterval
+from app.infrastructure.models.patient_model import PatientModel
+from app.infrastructure.models.vital_model import VitalModel
+from app.infrastructure.repositories.vital_partition_repository import VitalPartitionRepository
+
+NOW = datetime(2024, 12, 30, 15, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+async def db_session(db_session: AsyncSession) -> AsyncSession:
+    """The test session with only an empty default partition left (rolled back afterwards).
+
+    Partitions created by migrations, and rows other tests left in the default partition, would otherwise
+    change which partitions maintain() has to create.
+    """
+    repo = VitalPartitionRepository(db_session)
+    for partition in await repo.find_all():
+        await repo.drop(partition)
+    await db_session.execute(text(f"DELETE FROM {VitalModel.DEFAULT_PARTITION}"))
+    return db_session
+
+
+@pytest.mark.parametrize(
+    ("interval", "moment", "floor", "following"),
+    [
+        (PartitionInterval.DAY, NOW, datetime(2024, 12, 30, tzinfo=UTC), datetime(2024, 12, 31, tzinfo=UTC)),
+        (PartitionInterval.MONTH, NOW, datetime(2024, 12, 1, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC)),
+        (
+            PartitionInterval.MONTH,
+            datetime(2024, 2, 29, 23, 0, tzinfo=UTC),
+            datetime(2024, 2, 1, tzinfo=UTC),
+            datetime(2024, 3, 1, tzinfo=UTC),
+        ),
+    ],
+)
+def test_interval_periods(interval, moment, floor, following):
+    assert interval.floor(moment) == floor
+    assert interval.next(floor) == following
+
+
+def test_periods_cover_range():
+    periods = list(
+        PartitionInterval.MONTH.periods(datetime(2024, 11, 15, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC))
+    )
+
+    assert periods == [
+        (datetime(2024, 11, 1, tzinfo=UTC), datetime(2024, 12, 1, tzinfo=UTC)),
+        (datetime(2024, 12, 1, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC)),
+    ]
+
+
+async def partition_names(db_session: AsyncSession) -> list[str]:
+    return [partition.name for partition in await VitalPartitionRepository(db_session).find_all()]
+
+
+async def test_creates_current_and_future_partitions(db_session: AsyncSession):
+    result = await VitalPartitionService(db_session, PartitionInterval.DAY).maintain(NOW, ahead=2)
+
+    assert result.created == ["vitals_p20241230", "vitals_p20241231", "vitals_p20250101"]
+    assert await partition_names(db_session) == result.created
+
+    again = await VitalPartitionService(db_session, PartitionInterval.DAY).maintain(NOW, ahead=2)
+    assert again.created == []
+
+
+async def test_moves_default_rows_into_new_partitions(db_session: AsyncSession):
+    """Rows that landed in the default partition get a partition of their own and are moved into it."""
+    db_session.add(PatientModel(patient_id="PART_P001", name="Partition", gender="F", birth_date=date(1990, 1, 1)))
+    await db_session.flush()
+    db_session.add(
+        VitalModel(patient_id="PART_P001", recorded_at=datetime(2024, 10, 5, tzinfo=UTC), vital_type="HR", value=80)
+    )
+    await db_session.flush()
+
+    result = await VitalPartitionService(db_session, PartitionInterval.MONTH).maintain(NOW, ahead=0)
+
+    assert result.created == ["vitals_p202410", "vitals_p202411", "vitals_p202412"]
+    assert result.moved_rows == 1
+    moved = await db_session.execute(text("SELECT patient_id, value FROM vitals_p202410"))
+    assert moved.all() == [("PART_P001", Decimal("80.00"))]
+    assert (
+        await db_session.scalar(
+            select(func.count()).select_from(VitalModel).where(VitalModel.patient_id == "PART_P001")
+        )
+        == 1
+    )
+
+
+async def test_existing_partitions_of_other_interval_are_kept(db_session: AsyncSession):
+    await VitalPartitionService(db_session, PartitionInterval.MONTH).maintain(NOW, ahead=0)
+
+    result = await VitalPartitionService(db_session, PartitionInterval.DAY).maintain(NOW, ahead=3)
+
+    assert result.created == ["vitals_p20250101", "vitals_p20250102"]
+
+
+async def test_retention_drops_old_partitions(db_session: AsyncSession):
+    service = VitalPartitionService(db_session, PartitionInterval.DAY)
+    await service.maintain(datetime(2024, 12, 27, tzinfo=UTC), ahead=1)
+
+    result = await service.maintain(NOW, ahead=0, retain_from=datetime(2024, 12, 29, tzinfo=UTC))
+
+    assert result.dropped == ["vitals_p20241227", "vitals_p20241228"]
+    assert result.created == ["vitals_p20241230"]
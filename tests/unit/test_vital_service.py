@@ -1,16 +1,30 @@
+import json
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.vital_service import VitalService
-from app.domain.exceptions import OptimisticLockError, PatientNotFoundError, VitalNotFoundError
+from app.domain.exceptions import (
+    InvalidCursorError,
+    OptimisticLockError,
+    PatientNotFoundError,
+    VitalNotFoundError,
+)
 from app.domain.vital_type import VitalType
 from app.infrastructure.models.patient_model import PatientModel
 from app.infrastructure.models.vital_model import VitalModel
-from app.presentation.schemas.vital_schema import VitalCreateRequest, VitalUpdateRequest
+from app.infrastructure.patient_cache import patient_existence_cache
+from app.infrastructure.repositories.vital_repository import VitalRepository
+from app.presentation.schemas.vital_schema import (
+    VitalBulkCreateRequest,
+    VitalCreateRequest,
+    VitalMeasurement,
+    VitalUpdateRequest,
+)
 
 
 async def create_patient(db_session: AsyncSession, patient_id: str) -> PatientModel:
@@ -83,6 +97,133 @@ async def test_create_vital_patient_not_found(db_session: AsyncSession):
         await service.create_vital(request)
 
 
+@pytest.mark.asyncio
+async def test_create_vital_known_patient_skips_existence_query(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    """The first write caches the patient; later writes do not query for it."""
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    service = VitalService(db_session)
+    request = VitalCreateRequest(
+        patient_id=patient_id,
+        recorded_at=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        vital_type=VitalType.HR,
+        value=72.5,
+    )
+    await service.create_vital(request)
+    assert patient_id in patient_existence_cache
+
+    async def fail_exists(patient_id: str) -> bool:
+        raise AssertionError("existence query for a cached patient")
+
+    monkeypatch.setattr(service.patient_repo, "exists", fail_exists)
+    response = await service.create_vital(request.model_copy(update={"value": 80.0}))
+
+    assert response.value == 80.0
+
+
+@pytest.mark.asyncio
+async def test_create_vital_stale_cache_entry(db_session: AsyncSession):
+    """A cached patient that does not exist is caught by the foreign key and dropped from the cache."""
+    patient_id = f"GONE_{uuid4().hex[:8]}"
+    patient_existence_cache.add(patient_id)
+    service = VitalService(db_session)
+    request = VitalCreateRequest(
+        patient_id=patient_id,
+        recorded_at=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        vital_type=VitalType.HR,
+        value=72.5,
+    )
+
+    with pytest.raises(PatientNotFoundError):
+        await service.create_vital(request)
+    assert patient_id not in patient_existence_cache
+
+
+@pytest.mark.asyncio
+async def test_create_vitals_bulk_success(db_session: AsyncSession):
+    """Test bulk creation across patients keeps request order."""
+    patient_ids = [f"SVC_{uuid4().hex[:8]}" for _ in range(2)]
+    for patient_id in patient_ids:
+        await create_patient(db_session, patient_id)
+
+    service = VitalService(db_session)
+    request = VitalBulkCreateRequest(
+        items=[
+            VitalCreateRequest(
+                patient_id=patient_ids[i % 2],
+                recorded_at=datetime(2024, 1, 1, 10, i, 0, tzinfo=UTC),
+                vital_type=VitalType.HR,
+                value=70.0 + i,
+            )
+            for i in range(4)
+        ]
+    )
+
+    response = await service.create_vitals_bulk(request)
+
+    assert response.errors == []
+    assert [v.patient_id for v in response.created] == [patient_ids[0], patient_ids[1]] * 2
+    assert [v.value for v in response.created] == [70.0, 71.0, 72.0, 73.0]
+
+
+@pytest.mark.asyncio
+async def test_create_vitals_bulk_reports_unknown_patient(db_session: AsyncSession):
+    """Test bulk creation reports items for unknown patients by index."""
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+
+    service = VitalService(db_session)
+    request = VitalBulkCreateRequest(
+        items=[
+            VitalCreateRequest(
+                patient_id=pid,
+                recorded_at=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+                vital_type=VitalType.SPO2,
+                value=97.0,
+            )
+            for pid in [patient_id, "NONEXISTENT", patient_id]
+        ]
+    )
+
+    response = await service.create_vitals_bulk(request)
+
+    assert len(response.created) == 2
+    assert len(response.errors) == 1
+    assert response.errors[0].index == 1
+    assert response.errors[0].patient_id == "NONEXISTENT"
+
+
+@pytest.mark.asyncio
+async def test_create_vitals_bulk_reports_out_of_range_value(db_session: AsyncSession):
+    """A value that would overflow Numeric(10, 2) once rounded is reported by index; the rest are created."""
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+
+    response = await VitalService(db_session).create_vitals_bulk(
+        VitalBulkCreateRequest(
+            items=[
+                VitalMeasurement(
+                    patient_id=patient_id,
+                    recorded_at=datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC),
+                    vital_type=VitalType.HR,
+                    value=value,
+                )
+                for minute, value in enumerate([72.0, 99999999.996, -1e9, 99999999.99])
+            ]
+        )
+    )
+
+    assert [vital.value for vital in response.created] == [72.0, 99999999.99]
+    assert [error.index for error in response.errors] == [1, 2]
+    assert "below 1e8" in response.errors[0].detail
+    with pytest.raises(ValidationError):
+        VitalCreateRequest(
+            patient_id=patient_id, recorded_at=datetime(2024, 1, 1, tzinfo=UTC), vital_type=VitalType.HR, value=1e8
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_vitals_with_items(db_session: AsyncSession):
     """Test getting vitals returns items."""
@@ -96,15 +237,15 @@ async def test_get_vitals_with_items(db_session: AsyncSession):
     )
 
     service = VitalService(db_session)
-    response = await service.get_vitals(
+    response = await service.get_vitals_payload(
         patient_id=patient_id,
         from_=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
         to=datetime(2024, 1, 1, 23, 59, 59, tzinfo=UTC),
     )
 
-    assert response.patient_id == patient_id
-    assert len(response.items) == 1
-    assert response.items[0].value == 72.0
+    assert response["patient_id"] == patient_id
+    assert len(response["items"]) == 1
+    assert response["items"][0]["value"] == 72.0
 
 
 @pytest.mark.asyncio
@@ -116,15 +257,59 @@ async def test_get_vitals_with_type_filter(db_session: AsyncSession):
     await create_vital(db_session, patient_id, datetime(2024, 1, 1, 11, 0, 0, tzinfo=UTC), "RR")
 
     service = VitalService(db_session)
-    response = await service.get_vitals(
+    response = await service.get_vitals_payload(
         patient_id=patient_id,
         from_=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
         to=datetime(2024, 1, 1, 23, 59, 59, tzinfo=UTC),
         vital_type=VitalType.HR,
     )
 
-    assert len(response.items) == 1
-    assert response.vital_type == "HR"
+    assert len(response["items"]) == 1
+    assert response["vital_type"] == "HR"
+
+
+@pytest.mark.asyncio
+async def test_get_vitals_paginates_with_cursor(db_session: AsyncSession):
+    """Test following next_cursor returns every item exactly once."""
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    for minute in range(5):
+        await create_vital(db_session, patient_id, datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC), value=60.0 + minute)
+
+    service = VitalService(db_session)
+    values = []
+    cursor = None
+    pages = 0
+    while True:
+        response = await service.get_vitals_payload(
+            patient_id=patient_id,
+            from_=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+            to=datetime(2024, 1, 1, 23, 59, 59, tzinfo=UTC),
+            limit=2,
+            cursor=cursor,
+        )
+        pages += 1
+        values.extend(item["value"] for item in response["items"])
+        cursor = response["next_cursor"]
+        if cursor is None:
+            break
+
+    assert values == [60.0, 61.0, 62.0, 63.0, 64.0]
+    assert pages == 3
+
+
+@pytest.mark.asyncio
+async def test_get_vitals_invalid_cursor(db_session: AsyncSession):
+    """Test an undecodable cursor raises InvalidCursorError."""
+    service = VitalService(db_session)
+
+    with pytest.raises(InvalidCursorError):
+        await service.get_vitals_payload(
+            patient_id="ANY",
+            from_=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+            to=datetime(2024, 1, 1, 23, 59, 59, tzinfo=UTC),
+            cursor="not-a-cursor",
+        )
 
 
 @pytest.mark.asyncio
@@ -186,3 +371,52 @@ async def test_update_vital_version_mismatch(db_session: AsyncSession):
     request2 = VitalUpdateRequest(value=85.0, vital_type=VitalType.HR, version=1)
     with pytest.raises(OptimisticLockError):
         await service.update_vital(vital.id, request2)
+
+
+@pytest.mark.asyncio
+async def test_stream_vitals_spans_batches(db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """Test streaming yields every row as NDJSON across several fetch batches."""
+    monkeypatch.setattr(VitalRepository, "STREAM_BATCH_SIZE", 2)
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    for minute in range(5):
+        await create_vital(db_session, patient_id, datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC), value=60.0 + minute)
+
+    service = VitalService(db_session)
+    chunks = [
+        chunk
+        async for chunk in service.stream_vitals(
+            patient_id=patient_id,
+            from_=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+            to=datetime(2024, 1, 1, 23, 59, 59, tzinfo=UTC),
+        )
+    ]
+
+    assert len(chunks) == 3
+    values = [json.loads(line)["value"] for line in b"".join(chunks).splitlines()]
+    assert values == [60.0, 61.0, 62.0, 63.0, 64.0]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_vitals_prebuckets_long_series(db_session: AsyncSession):
+    """A raw series longer than LTTB_PREBUCKET_FACTOR * max_points is averaged into date_bin buckets first."""
+    patient_id = f"SVC_{uuid4().hex[:8]}"
+    await create_patient(db_session, patient_id)
+    for minute in range(24):
+        await create_vital(db_session, patient_id, datetime(2024, 1, 1, 10, minute, 0, tzinfo=UTC), value=60.0 + minute)
+
+    response = await VitalService(db_session).aggregate_vitals(
+        patient_id,
+        datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        datetime(2024, 1, 1, 10, 24, 0, tzinfo=UTC),
+        VitalType.HR,
+        max_points=3,
+    )
+
+    # 12 two-minute buckets, reduced to 3 points by LTTB.
+    assert len(response.items) == 3
+    assert (response.items[0].recorded_at, response.items[0].value) == (datetime(2024, 1, 1, 10, 0, tzinfo=UTC), 60.5)
+    assert (response.items[-1].recorded_at, response.items[-1].value) == (
+        datetime(2024, 1, 1, 10, 22, tzinfo=UTC),
+        82.5,
+    )